@@ -1,8 +1,8 @@
 import os
-import json
 import asyncio
 import aiohttp
 import logging
+import orjson
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime, timezone
 from dataclasses import dataclass
@@ -11,6 +11,11 @@ from dotenv import load_dotenv
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+
+def _orjson_str(obj: Any) -> str:
+    """aiohttp request-body serializer: orjson, with str() for anything it can't encode."""
+    return orjson.dumps(obj, default=str).decode()
+
 @dataclass
 class APIResponse:
     """Structured response from API calls"""
@@ -60,7 +65,8 @@ class MadnessAPIClient:
             self.session = aiohttp.ClientSession(
                 timeout=self.timeout,
                 connector=connector,
-                headers={"User-Agent": "Omnispindle-MCP/1.0"}
+                headers={"User-Agent": "Omnispindle-MCP/1.0"},
+                json_serialize=_orjson_str,
             )
 
     async def close(self):
@@ -94,16 +100,16 @@ class MadnessAPIClient:
                 logger.debug(f"API {method.upper()} {url} (attempt {attempt + 1})")
                 
                 async with self.session.request(method, url, **kwargs) as response:
-                    response_text = await response.text()
+                    body = await response.read()
                     
                     # Log response details
-                    logger.debug(f"API Response: {response.status} {len(response_text)} bytes")
+                    logger.debug("API Response: %s %d bytes", response.status, len(body))
                     
-                    # Try to parse JSON response
+                    # Parse straight from the bytes; only a non-JSON body is decoded to text
                     try:
-                        response_data = json.loads(response_text) if response_text else {}
-                    except json.JSONDecodeError:
-                        response_data = {"raw_response": response_text}
+                        response_data = orjson.loads(body) if body else {}
+                    except orjson.JSONDecodeError:
+                        response_data = {"raw_response": body.decode(errors="replace")}
                     
                     # Handle HTTP status codes
                     if response.status == 200 or response.status == 201:
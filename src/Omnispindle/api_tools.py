@@ -2,16 +2,14 @@
 API-based tools for Omnispindle MCP server.
 Replaces direct database operations with HTTP API calls to madnessinteractive.cc/api
 """
-import json
 import re
-import uuid
 import logging
 from typing import Union, List, Dict, Optional, Any
 from datetime import datetime, timezone
 
 from .api_client import MadnessAPIClient, APIResponse, get_default_client, get_cached_client
 from .context import Context
-from .utils import create_response
+from .utils import create_response, dumps
 from .response_shaping import (
     apply_response_diet,
     apply_todo_list_diet,
@@ -149,7 +147,7 @@ async def add_todo(description: str, project: str, priority: str = "Medium",
         mcp_todo = _convert_api_todo_to_mcp_format(todo_data)
 
         # Return enriched response with agent context
-        return json.dumps({
+        return dumps({
             "id": mcp_todo["id"],
             "project": mcp_todo.get("project", project),
             "priority": mcp_todo.get("priority", priority),
@@ -211,7 +209,7 @@ async def query_todos(filter: Optional[Dict[str, Any]] = None, projection: Optio
             mcp_todos = compact_todo_list(mcp_todos, brief=brief)
             diet = "brief" if brief else "full"
 
-        return json.dumps({"items": mcp_todos, "count": len(mcp_todos), "diet": diet})
+        return dumps({"items": mcp_todos, "count": len(mcp_todos), "diet": diet})
         
     except Exception as e:
         logger.error(f"Failed to query todos via API: {str(e)}")
@@ -253,7 +251,7 @@ async def update_todo(todo_id: str, updates: dict, ctx: Optional[Context] = None
         if not api_response.success:
             return create_response(False, message=api_response.error or f"Failed to update todo {todo_id}")
 
-        return json.dumps({"id": todo_id})
+        return dumps({"id": todo_id})
         
     except Exception as e:
         logger.error(f"Failed to update todo via API: {str(e)}")
@@ -273,7 +271,7 @@ async def delete_todo(todo_id: str, ctx: Optional[Context] = None) -> str:
         if not api_response.success:
             return create_response(False, message=api_response.error or f"Failed to delete todo {todo_id}")
 
-        return json.dumps({"id": todo_id})
+        return dumps({"id": todo_id})
         
     except Exception as e:
         logger.error(f"Failed to delete todo via API: {str(e)}")
@@ -298,7 +296,7 @@ async def get_todo(todo_id: str, ctx: Optional[Context] = None) -> str:
         # Remove MongoDB _id if present
         if '_id' in mcp_todo:
             del mcp_todo['_id']
-        return json.dumps(strip_empty_fields(mcp_todo))
+        return dumps(strip_empty_fields(mcp_todo))
         
     except Exception as e:
         logger.error(f"Failed to get todo via API: {str(e)}")
@@ -318,7 +316,7 @@ async def complete_todo(todo_id: str, comment: Optional[str] = None, ctx: Option
         if not api_response.success:
             return create_response(False, message=api_response.error or f"Failed to complete todo {todo_id}")
 
-        return json.dumps({"id": todo_id})
+        return dumps({"id": todo_id})
         
     except Exception as e:
         logger.error(f"Failed to complete todo via API: {str(e)}")
@@ -398,7 +396,7 @@ async def search_todos(query: str, fields: Optional[list] = None, limit: int = 2
             items = compact_todo_list(items, brief=brief)
             diet = "brief" if brief else "full"
 
-        return json.dumps({
+        return dumps({
             "items": items,
             "count": len(items),
             "search_mode": search_mode,
@@ -475,7 +473,7 @@ async def inventorium_sessions_get(session_id: str, ctx: Optional[Context] = Non
         session_data = response.data
         if isinstance(session_data, dict) and '_id' in session_data:
             del session_data['_id']
-        return json.dumps(strip_empty_fields(session_data))
+        return dumps(strip_empty_fields(session_data))
     except Exception as e:
         logger.error(f"Failed to fetch chat session {session_id}: {str(e)}")
         return create_response(False, message=f"API error: {str(e)}")
@@ -500,7 +498,7 @@ async def inventorium_sessions_create(project: str, title: Optional[str] = None,
             return create_response(False, message=response.error or "Failed to create chat session")
         session = response.data.get("session") if isinstance(response.data, dict) else response.data
         session_id = session.get("id") if isinstance(session, dict) else session
-        return json.dumps({"id": session_id})
+        return dumps({"id": session_id})
     except Exception as e:
         logger.error(f"Failed to create chat session: {str(e)}")
         return create_response(False, message=f"API error: {str(e)}")
@@ -532,7 +530,7 @@ async def inventorium_sessions_spawn(parent_session_id: str, prompt: str, todo_i
             return create_response(False, message=spawn_response.error or "Failed to spawn session")
         session = spawn_response.data.get("session") if isinstance(spawn_response.data, dict) else spawn_response.data
         session_id = session.get("id") if isinstance(session, dict) else session
-        return json.dumps({"id": session_id})
+        return dumps({"id": session_id})
     except Exception as e:
         logger.error(f"Failed to spawn chat session: {str(e)}")
         return create_response(False, message=f"API error: {str(e)}")
@@ -580,7 +578,7 @@ async def inventorium_sessions_fork(session_id: str, title: Optional[str] = None
             return create_response(False, message=response.error or "Failed to fork session")
         session = response.data.get("session", response.data)
         session_id = session.get("id") if isinstance(session, dict) else session
-        return json.dumps({"id": session_id})
+        return dumps({"id": session_id})
     except Exception as e:
         logger.error(f"Failed to fork session {session_id}: {str(e)}")
         return create_response(False, message=f"API error: {str(e)}")
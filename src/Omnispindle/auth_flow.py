@@ -2,6 +2,7 @@ import asyncio
 import json
 import logging
 import os
+import re
 import sys
 import webbrowser
 from pathlib import Path
@@ -111,25 +112,21 @@ def save_token_to_env(token: str) -> Path:
     """Save the Auth0 token to a .env file"""
     env_path = Path(__file__).parent.parent.parent / '.env'
 
-    env_lines = []
+    content = ""
     if env_path.exists():
         with open(env_path, 'r') as f:
-            env_lines = f.readlines()
+            content = f.read()
 
-    token_line = f"AUTH0_TOKEN={token}\n"
-    token_found = False
-
-    for i, line in enumerate(env_lines):
-        if line.startswith('AUTH0_TOKEN='):
-            env_lines[i] = token_line
-            token_found = True
-            break
-
-    if not token_found:
-        env_lines.append(token_line)
+    # Splice the token in place (callable repl: tokens are not regex templates)
+    token_line = f"AUTH0_TOKEN={token}"
+    content, replaced = re.subn(r'^AUTH0_TOKEN=.*$', lambda _: token_line, content, count=1, flags=re.M)
+    if not replaced:
+        if content and not content.endswith('\n'):
+            content += '\n'
+        content += token_line + '\n'
 
     with open(env_path, 'w') as f:
-        f.writelines(env_lines)
+        f.write(content)
 
     os.environ['AUTH0_TOKEN'] = token
     return env_path
@@ -1,7 +1,10 @@
 import os
 import re
+import threading
+import time
 from typing import Optional, Dict, Any
-from pymongo import MongoClient
+from pymongo import MongoClient, ASCENDING, DESCENDING, TEXT
+from pymongo.errors import OperationFailure
 from dotenv import load_dotenv
 from pymongo.collection import Collection
 from pymongo.database import Database as MongoDatabase
@@ -13,6 +16,43 @@ load_dotenv()
 MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
 MONGODB_DB_NAME = os.getenv("MONGODB_DB", "swarmonomicon")  # Fallback/shared database
 
+# Handlers run their queries on asyncio.to_thread workers, so several share
+# the pool at once. Keep a few sockets warm so a burst after a quiet spell
+# doesn't pay a TCP + TLS + auth handshake per worker, and retire idle ones
+# before a NAT or load balancer silently drops them.
+MONGODB_POOL_OPTIONS = {
+    "minPoolSize": int(os.getenv("MONGODB_MIN_POOL_SIZE", "4")),
+    "maxIdleTimeMS": int(os.getenv("MONGODB_MAX_IDLE_MS", "300000")),
+}
+
+# Fields covered by each collection's text index. Mongo allows one text index
+# per collection, so it's a single compound index over the default search
+# fields — search_todos/search_lessons use $text only when searching these.
+TODO_SEARCH_FIELDS = ("description", "project")
+LESSON_SEARCH_FIELDS = ("topic", "lesson_learned", "tags")
+SEARCH_INDEX_NAME = "search_text"
+
+# (collection, keys, options) for every index the tools rely on: point reads
+# and writes go by `id`, list views filter on `status` and sort newest first,
+# so (status, created_at) serves the filter, the sort and the limit in one scan.
+# graph_root walks blockers one todo at a time, and quests/explanations are
+# read and upserted by their own keys.
+INDEX_SPECS = (
+    ("todos", [("id", ASCENDING)], {"unique": True}),
+    ("todos", [("status", ASCENDING), ("created_at", DESCENDING)], {}),
+    ("todos", [("metadata.blockers", ASCENDING)], {}),
+    ("todos", [(f, TEXT) for f in TODO_SEARCH_FIELDS], {"name": SEARCH_INDEX_NAME}),
+    ("lessons_learned", [("id", ASCENDING)], {"unique": True}),
+    ("lessons_learned", [(f, TEXT) for f in LESSON_SEARCH_FIELDS], {"name": SEARCH_INDEX_NAME}),
+    ("quests", [("id", ASCENDING)], {"unique": True}),
+    ("explanations", [("topic", ASCENDING)], {"unique": True}),
+)
+INDEX_RETRY_SECONDS = 60.0  # after a failed build, wait this long before trying again
+# Failures a retry can't fix: IndexOptionsConflict and IndexKeySpecsConflict
+# (an older index, e.g. a text index over other fields, holds the slot) and
+# DuplicateKey (existing documents break a unique index).
+PERMANENT_INDEX_ERRORS = frozenset({85, 86, 11000})
+
 
 def sanitize_database_name(user_context: Dict[str, Any]) -> str:
     """
@@ -58,8 +98,11 @@ class Database:
         if cls._instance is None:
             cls._instance = super(Database, cls).__new__(cls)
             cls._instance._user_databases = {}
+            cls._instance._indexed_databases = set()
+            cls._instance._index_retry_at = {}  # db name -> monotonic time of the next attempt
+            cls._instance._index_lock = threading.Lock()
             try:
-                cls._instance.client = MongoClient(MONGODB_URI)
+                cls._instance.client = MongoClient(MONGODB_URI, **MONGODB_POOL_OPTIONS)
                 # Ping the server to verify the connection
                 cls._instance.client.admin.command('ping')
                 print("MongoDB connection successful.")
@@ -125,8 +168,53 @@ class Database:
         }
         # Add database reference for custom collection access
         collections_dict['database'] = db
+        if db.name not in self._indexed_databases:
+            self._schedule_indexes(db)
         return collections_dict
 
+    def _schedule_indexes(self, db: MongoDatabase) -> None:
+        """
+        Build a database's indexes on a worker thread, never on the caller's:
+        get_collections runs on the event loop, and each create_index is a
+        round trip that blocks for the server-selection timeout when Mongo
+        is unreachable. One build per database at a time; a failed one is
+        retried after INDEX_RETRY_SECONDS.
+        """
+        with self._index_lock:
+            if db.name in self._indexed_databases or time.monotonic() < self._index_retry_at.get(db.name, 0.0):
+                return
+            # Also blocks a second build while this one is in flight
+            self._index_retry_at[db.name] = time.monotonic() + INDEX_RETRY_SECONDS
+        threading.Thread(target=self.ensure_indexes, args=(db,), name=f"indexes-{db.name}", daemon=True).start()
+
+    def ensure_indexes(self, db: MongoDatabase) -> bool:
+        """
+        Create the INDEX_SPECS indexes for a database; blocking, so call it off
+        the event loop. create_index is a no-op when the index already exists.
+        One that can't be built is reported and skipped — queries still work,
+        just without it. Conflicts and duplicate keys (PERMANENT_INDEX_ERRORS)
+        count as done, since retrying won't change them; anything else (Mongo
+        down, timeouts) leaves the database to be retried.
+        """
+        failed = False
+        for collection_name, keys, options in INDEX_SPECS:
+            try:
+                db[collection_name].create_index(keys, **options)
+            except OperationFailure as e:
+                if e.code not in PERMANENT_INDEX_ERRORS:
+                    failed = True
+                print(f"⚠️ Index setup: could not create index {keys} on {db.name}.{collection_name}: {e}")
+            except Exception as e:
+                failed = True
+                print(f"⚠️ Index setup: could not create index {keys} on {db.name}.{collection_name}: {e}")
+        with self._index_lock:
+            if failed:
+                self._index_retry_at[db.name] = time.monotonic() + INDEX_RETRY_SECONDS
+            else:
+                self._indexed_databases.add(db.name)
+                self._index_retry_at.pop(db.name, None)
+        return not failed
+
     # Legacy properties for backward compatibility (use shared database)
     @property
     def db(self) -> MongoDatabase:
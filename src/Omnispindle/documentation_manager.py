@@ -576,6 +576,44 @@ Args:
 - limit: max results (default: 20)
 
 Response: {items: [...], count, anchor_district, anchor_coords, radius}"""
+    },
+    "add_todos": {
+        "minimal": "Create several todos",
+        "compact": "Create several todos in one write. items: [{description, project, ...}].",
+        "basic": "Create several todos in one write. Each item takes add_todo's fields (description and project required). Returns ids plus per-item errors.",
+        "full": """Create several todos with one insert round trip.
+
+Each item in items takes the same fields as add_todo; description and project
+are required. Items are inserted unordered, so one bad item doesn't stop the
+rest. All items share one created_at timestamp.
+
+Response: {ids: [...], count, created_at, errors?: [{index|id, error}]}"""
+    },
+    "update_todos": {
+        "minimal": "Update several todos",
+        "compact": "Update several todos in one write. items: [{todo_id, updates}].",
+        "basic": "Update several todos in one write. Items are {todo_id, updates}; metadata is MERGED. Use complete_todo to complete.",
+        "full": """Update several todos with one bulk write.
+
+Each item is {todo_id, updates} and follows update_todo's rules: metadata is
+merged with the existing metadata, and status "completed" is refused — use
+complete_todo. Only your own database is searched. Writes are unordered, so
+one failure doesn't stop the rest.
+
+Response: {ids: [...], count, errors?: [{index|id, error}]}"""
+    },
+    "add_lessons": {
+        "minimal": "Add several lessons",
+        "compact": "Add several lessons in one write. items: [{language, topic, lesson_learned, tags?}].",
+        "basic": "Add several lessons in one write. Each item takes add_lesson's fields (language, topic and lesson_learned required). Returns ids plus per-item errors.",
+        "full": """Add several lessons with one insert round trip.
+
+Each item in items takes the same fields as add_lesson; language, topic and
+lesson_learned are required. Items are inserted unordered, so one bad item
+doesn't stop the rest. Embeddings are generated in the background after the
+insert.
+
+Response: {ids: [...], count, errors?: [{index|id, error}]}"""
     },
     "link_todos": {
         "minimal": "Link todo dependency",
@@ -5,9 +5,10 @@ Uses Gemini text-embedding-004 (768 dims) via REST API.
 Graceful degradation: no GEMINI_API_KEY = no embeddings = regex fallback everywhere.
 """
 
+import asyncio
 import logging
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import httpx
 import numpy as np
@@ -23,6 +24,30 @@ EMBEDDING_URL = f"https://generativelanguage.googleapis.com/v1beta/models/{EMBED
 # truncation to 768 is safe for similarity even though <3072 isn't auto-normalized.)
 EMBEDDING_DIMS = 768
 
+# One client per event loop: embeddings come in bursts (a batch insert, a
+# find_similar per search), and a fresh client per call paid a TCP + TLS
+# handshake to Google every time.
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """The shared embeddings client, rebuilt if closed or created on another loop."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(timeout=10.0)
+        _http_client_loop = loop
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared embeddings client (call on shutdown)."""
+    global _http_client, _http_client_loop
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+    _http_client = _http_client_loop = None
+
 
 def is_available() -> bool:
     """Check if embedding generation is available (API key configured)."""
@@ -45,25 +70,24 @@ async def generate_embedding(text: str) -> Optional[List[float]]:
     truncated = text[:8000]
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Key goes in the x-goog-api-key header, NOT a query param — keeps the
-            # secret out of error messages/logs (httpx echoes the URL on errors).
-            resp = await client.post(
-                EMBEDDING_URL,
-                headers={"x-goog-api-key": GEMINI_API_KEY},
-                json={
-                    "model": f"models/{EMBEDDING_MODEL}",
-                    "content": {"parts": [{"text": truncated}]},
-                    "outputDimensionality": EMBEDDING_DIMS,
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            values = data.get("embedding", {}).get("values")
-            if values and len(values) == EMBEDDING_DIMS:
-                return values
-            logger.warning(f"Unexpected embedding response shape: {len(values) if values else 'None'}")
-            return None
+        # Key goes in the x-goog-api-key header, NOT a query param — keeps the
+        # secret out of error messages/logs (httpx echoes the URL on errors).
+        resp = await _get_http_client().post(
+            EMBEDDING_URL,
+            headers={"x-goog-api-key": GEMINI_API_KEY},
+            json={
+                "model": f"models/{EMBEDDING_MODEL}",
+                "content": {"parts": [{"text": truncated}]},
+                "outputDimensionality": EMBEDDING_DIMS,
+            },
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        values = data.get("embedding", {}).get("values")
+        if values and len(values) == EMBEDDING_DIMS:
+            return values
+        logger.warning(f"Unexpected embedding response shape: {len(values) if values else 'None'}")
+        return None
     except Exception as e:
         logger.warning(f"Embedding generation failed: {e}")
         return None
@@ -80,35 +104,9 @@ def cosine_similarity(a: List[float], b: List[float]) -> float:
     return float(dot / norm)
 
 
-async def find_similar(
-    query: str,
-    collection,
-    doc_type: str,
-    limit: int = 5,
-    min_score: float = 0.3,
-) -> List[dict]:
-    """
-    Semantic similarity search against a MongoDB collection.
-
-    1. Generate embedding for query text
-    2. Fetch all docs that have an 'embedding' field (projection: id + embedding only)
-    3. Compute cosine similarity for each
-    4. Return top-N sorted by score
-
-    Args:
-        query: Search text
-        collection: pymongo Collection
-        doc_type: "todo" or "lesson" (determines which fields to return)
-        limit: Max results
-        min_score: Minimum similarity threshold
-
-    Returns:
-        List of docs with 'similarity_score' attached, sorted descending
-    """
-    query_embedding = await generate_embedding(query)
-    if query_embedding is None:
-        return []
-
+def _rank_by_similarity(collection, query_embedding: List[float], doc_type: str,
+                        limit: int, min_score: float) -> Tuple[List[dict], Dict[str, float]]:
+    """Score every stored embedding against the query and fetch the top docs. Blocking."""
     # Fetch only docs that have embeddings — project just id + embedding for speed
     cursor = collection.find(
         {"embedding": {"$exists": True}},
@@ -129,7 +127,7 @@ async def find_similar(
     top_ids = scored[:limit]
 
     if not top_ids:
-        return []
+        return [], {}
 
     # Fetch full docs for the top matches
     id_list = [item[0] for item in top_ids]
@@ -140,7 +138,41 @@ async def find_similar(
     else:
         projection = {"_id": 0, "id": 1, "topic": 1, "language": 1, "tags": 1, "lesson_learned": 1}
 
-    results = list(collection.find({"id": {"$in": id_list}}, projection))
+    return list(collection.find({"id": {"$in": id_list}}, projection)), score_map
+
+
+async def find_similar(
+    query: str,
+    collection,
+    doc_type: str,
+    limit: int = 5,
+    min_score: float = 0.3,
+) -> List[dict]:
+    """
+    Semantic similarity search against a MongoDB collection.
+
+    1. Generate embedding for query text
+    2. Fetch all docs that have an 'embedding' field (projection: id + embedding only)
+    3. Compute cosine similarity for each
+    4. Return top-N sorted by score
+
+    Args:
+        query: Search text
+        collection: pymongo Collection
+        doc_type: "todo" or "lesson" (determines which fields to return)
+        limit: Max results
+        min_score: Minimum similarity threshold
+
+    Returns:
+        List of docs with 'similarity_score' attached, sorted descending
+    """
+    query_embedding = await generate_embedding(query)
+    if query_embedding is None:
+        return []
+
+    # The scan, scoring and final read are all blocking pymongo work
+    results, score_map = await asyncio.to_thread(
+        _rank_by_similarity, collection, query_embedding, doc_type, limit, min_score)
 
     # Attach scores and sort
     for doc in results:
@@ -163,7 +163,8 @@ def get_git_metadata(path: Optional[str] = None) -> Dict[str, Any]:
 
 def enrich_metadata_with_git(metadata: Optional[Dict[str, Any]] = None,
                              path: Optional[str] = None,
-                             auto_detect: bool = True) -> Dict[str, Any]:
+                             auto_detect: bool = True,
+                             git_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Enrich existing metadata with git information.
 
@@ -171,6 +172,9 @@ def enrich_metadata_with_git(metadata: Optional[Dict[str, Any]] = None,
         metadata: Existing metadata dict (or None to create new)
         path: Path to check for git context
         auto_detect: Automatically detect and add git metadata
+        git_data: Pre-fetched get_git_metadata() result. Async callers fetch it
+            off the event loop (the lookups are blocking subprocesses) and
+            batch callers fetch it once for every item.
 
     Returns:
         Metadata dict enriched with git information (if available)
@@ -181,7 +185,8 @@ def enrich_metadata_with_git(metadata: Optional[Dict[str, Any]] = None,
         return result_metadata
 
     # Only add git metadata if not already present
-    git_data = get_git_metadata(path)
+    if git_data is None:
+        git_data = get_git_metadata(path)
 
     if "branch" in git_data and "branch" not in result_metadata:
         result_metadata["branch"] = git_data["branch"]
@@ -14,6 +14,7 @@ Compatibility note:
 import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional, Union, List
 
 from fastmcp import FastMCP, Context as MCPContext
@@ -28,7 +29,11 @@ from src.Omnispindle.context import Context
 from src.Omnispindle.patches import apply_patches
 from src.Omnispindle.auth_utils import verify_auth0_token, AUTH_CONFIG
 from src.Omnispindle.auth_flow import ensure_authenticated, run_async_in_thread
-from src.Omnispindle import tools
+from src.Omnispindle import embeddings, tools
+from src.Omnispindle.api_client import close_all_cached_clients
+from src.Omnispindle.todo_log_service import drain_log_queue
+from src.Omnispindle.utils import close_nr_session, stop_status_flusher
+from src.Omnispindle.database import db_connection
 
 # Initialize
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -52,9 +57,49 @@ class HeaderCaptureMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
         return response
 
+@asynccontextmanager
+async def _process_lifespan(app):
+    """Start the shared database's index build; flush queued todo logs and status and release shared network clients when the process stops.
+
+    FastMCP runs its own lifespan once per client session, so this hangs off the
+    SSE app (or the single stdio run) instead: closing the shared clients when
+    one session ends would break every other session still using them.
+    """
+    if db_connection.shared_db is not None:
+        db_connection._schedule_indexes(db_connection.shared_db)
+    try:
+        yield
+    finally:
+        await drain_log_queue()
+        await stop_status_flusher()
+        await close_nr_session()
+        await embeddings.close_http_client()
+        await close_all_cached_clients()
+
+
 # Create the FastMCP instance that fastmcp run will use
 mcp = FastMCP("Omnispindle 🌪️")
 
+_base_sse_app = mcp.sse_app
+_base_run_stdio_async = mcp.run_stdio_async
+
+
+def _sse_app():
+    """FastMCP's SSE app, with the process-wide shutdown on its ASGI lifespan."""
+    app = _base_sse_app()
+    app.router.lifespan_context = _process_lifespan
+    return app
+
+
+async def _run_stdio_async():
+    """Serve stdio once, then run the process-wide shutdown."""
+    async with _process_lifespan(mcp):
+        await _base_run_stdio_async()
+
+
+mcp.sse_app = _sse_app
+mcp.run_stdio_async = _run_stdio_async
+
 # Add middleware to capture headers (if FastMCP supports it)
 if hasattr(mcp, 'app') and hasattr(mcp.app, 'add_middleware'):
     mcp.app.add_middleware(HeaderCaptureMiddleware)
@@ -285,6 +330,13 @@ if "add_lesson" in selected_tools:
         auth_ctx = await get_authenticated_context_from_mcp(ctx, user_ctx)
         return await tools.add_lesson(language, topic, lesson_learned, tags, ctx=auth_ctx)
 
+if "add_lessons" in selected_tools:
+    @mcp.tool()
+    async def add_lessons(items: List[Dict[str, Any]], user_ctx: Optional[Dict[str, Any]] = None, ctx: MCPContext = None):
+        """Store several lessons in one write. Items take add_lesson's fields. Returns ids plus per-item errors."""
+        auth_ctx = await get_authenticated_context_from_mcp(ctx, user_ctx)
+        return await tools.add_lessons(items, ctx=auth_ctx)
+
 if "get_lesson" in selected_tools:
     @mcp.tool()
     async def get_lesson(lesson_id: str, user_ctx: Optional[Dict[str, Any]] = None, ctx: MCPContext = None):
@@ -471,6 +523,20 @@ if "link_todos" in selected_tools:
         auth_ctx = await get_authenticated_context_from_mcp(ctx, user_ctx)
         return await tools.link_todos(blocker_id=blocker_id, blocked_id=blocked_id, ctx=auth_ctx)
 
+if "add_todos" in selected_tools:
+    @mcp.tool()
+    async def add_todos(items: List[Dict[str, Any]], user_ctx: Optional[Dict[str, Any]] = None, ctx: MCPContext = None):
+        """Create several tasks in one write. Items take add_todo's fields. Returns ids plus per-item errors."""
+        auth_ctx = await get_authenticated_context_from_mcp(ctx, user_ctx)
+        return await tools.add_todos(items, ctx=auth_ctx)
+
+if "update_todos" in selected_tools:
+    @mcp.tool()
+    async def update_todos(items: List[Dict[str, Any]], user_ctx: Optional[Dict[str, Any]] = None, ctx: MCPContext = None):
+        """Update several tasks in one write. Items are {todo_id, updates}; same rules as update_todo."""
+        auth_ctx = await get_authenticated_context_from_mcp(ctx, user_ctx)
+        return await tools.update_todos(items, ctx=auth_ctx)
+
 # RAG / Context tools
 if "get_context_bundle" in selected_tools:
     @mcp.tool()
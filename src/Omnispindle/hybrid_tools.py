@@ -5,9 +5,9 @@ Provides graceful degradation and performance comparison capabilities.
 import os
 import asyncio
 import logging
+import time
 from typing import Dict, Any, Optional, Union, List
 from enum import Enum
-from datetime import datetime, timezone
 
 from .context import Context
 from .utils import create_response
@@ -17,6 +17,10 @@ from .api_client import MadnessAPIClient
 
 logger = logging.getLogger(__name__)
 
+# create_response serialises with orjson (compact, no space after the colon);
+# the spaced form covers anything still encoded by stdlib json.
+_FAILURE_MARKERS = ('"success":false', '"success": false')
+
 class OmnispindleMode(Enum):
     """Available operation modes for Omnispindle"""
     LOCAL = "local"      # Direct MongoDB access
@@ -123,7 +127,7 @@ async def _execute_with_fallback(operation_name: str, api_func, local_func, *arg
     config = get_hybrid_config()
     
     # Record start time for performance tracking
-    start_time = datetime.now(timezone.utc)
+    start_time = time.perf_counter()
     
     # Determine primary and fallback methods
     use_api_first = config.should_use_api()
@@ -145,14 +149,14 @@ async def _execute_with_fallback(operation_name: str, api_func, local_func, *arg
         result = await primary_func(*args, ctx=ctx, **kwargs)
         
         # Record success
-        response_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+        response_time = time.perf_counter() - start_time
         if use_api_first:
             config.record_api_success(response_time)
         else:
             config.record_local_success(response_time)
         
         # Check if result indicates failure
-        if isinstance(result, str) and '"success": false' in result:
+        if isinstance(result, str) and any(marker in result for marker in _FAILURE_MARKERS):
             raise Exception(f"{primary_name} returned failure response")
         
         logger.debug(f"{operation_name} succeeded via {primary_name} in {response_time:.2f}s")
@@ -171,12 +175,12 @@ async def _execute_with_fallback(operation_name: str, api_func, local_func, *arg
         if config.fallback_enabled and config.mode in [OmnispindleMode.HYBRID, OmnispindleMode.AUTO]:
             try:
                 logger.info(f"Falling back to {fallback_name} for {operation_name}")
-                fallback_start = datetime.now(timezone.utc)
+                fallback_start = time.perf_counter()
                 
                 result = await fallback_func(*args, ctx=ctx, **kwargs)
                 
                 # Record fallback success
-                response_time = (datetime.now(timezone.utc) - fallback_start).total_seconds()
+                response_time = time.perf_counter() - fallback_start
                 if not use_api_first:
                     config.record_api_success(response_time)
                 else:
@@ -389,10 +393,10 @@ async def test_api_connectivity(ctx: Optional[Context] = None) -> str:
     try:
         auth_token, api_key = api_tools._get_auth_from_context(ctx)
         
-        start_time = datetime.now(timezone.utc)
+        start_time = time.perf_counter()
         async with MadnessAPIClient(auth_token=auth_token, api_key=api_key) as client:
             health_response = await client.health_check()
-            response_time = (datetime.now(timezone.utc) - start_time).total_seconds()
+            response_time = time.perf_counter() - start_time
         
         if health_response.success:
             return create_response(True, {
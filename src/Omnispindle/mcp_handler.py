@@ -5,6 +5,7 @@ import os
 from typing import Dict, Any, Callable, Coroutine
 
 import asyncio
+import orjson
 
 from starlette.requests import Request
 from starlette.responses import JSONResponse
@@ -12,6 +13,7 @@ from starlette.responses import JSONResponse
 from .tool_loadouts import get_loadout, filter_by_tier, get_loadout_names
 from .tool_metadata import is_pro_tool
 from .documentation_manager import DocumentationLevel, DocumentationManager, get_tool_doc
+from .utils import dumps
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,22 @@ logger = logging.getLogger(__name__)
 # a tool name can still call it — this shrinks discovery, not capability.
 DEFAULT_REMOTE_LOADOUT = "basic"
 
+# Server-side fallbacks for the per-request hints, read once at import
+_ENV_TOOL_LOADOUT = os.getenv("OMNISPINDLE_TOOL_LOADOUT")
+_ENV_DOC_LEVEL = os.getenv("OMNISPINDLE_DOC_LEVEL")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON-RPC envelope rendered straight to bytes by orjson.
+
+    The envelope carries the tool result as one large escaped string, and
+    tools/list carries every schema; Starlette's stdlib json.dumps was a
+    second full pass over text the tools had just produced with orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+
 
 def _as_text(result: Any) -> str:
     """
@@ -36,7 +54,7 @@ def _as_text(result: Any) -> str:
     """
     if isinstance(result, str):
         return result
-    return json.dumps(result, default=str)
+    return dumps(result)
 
 
 # Centralized tool schemas - single source of truth for all MCP tools
@@ -131,7 +149,8 @@ TOOL_SCHEMAS = {
                 "status": {"type": "string", "description": "pending|completed|initial|blocked|in_progress|review"},
                 "limit": {"type": "number", "description": "Max results (default: 100)"},
                 "offset": {"type": "number", "description": "Skip N results for pagination (default: 0)"},
-                "brief": {"type": "boolean", "description": "Strip notes + non-essential metadata (default: true)"}
+                "brief": {"type": "boolean", "description": "Strip notes + non-essential metadata (default: true)"},
+                "projection": {"type": "object", "description": "{field: 1} include / {field: 0} exclude. Default already skips _id and the embedding (and notes when brief)"}
             },
             "required": ["status"]
         }
@@ -145,7 +164,8 @@ TOOL_SCHEMAS = {
                 "query": {"type": "string", "description": "Search text. Tokenized regex across description+project."},
                 "limit": {"type": "number", "description": "Max results (default: 20)"},
                 "fields": {"type": "array", "description": "Fields to search (default: description, project)"},
-                "brief": {"type": "boolean", "description": "Force strip notes + non-essential metadata. Omit for auto: multi-hit sets go brief when notes are fat, long descriptions become match-centred snippets, coordinates are dropped; single hit keeps notes."}
+                "brief": {"type": "boolean", "description": "Force strip notes + non-essential metadata. Omit for auto: multi-hit sets go brief when notes are fat, long descriptions become match-centred snippets, coordinates are dropped; single hit keeps notes."},
+                "projection": {"type": "object", "description": "{field: 1} include / {field: 0} exclude. Default already skips _id and the embedding"}
             },
             "required": ["query"]
         }
@@ -190,6 +210,36 @@ TOOL_SCHEMAS = {
             "required": ["blocker_id", "blocked_id"]
         }
     },
+    "add_todos": {
+        "name": "add_todos",
+        "description": "Create several tasks in one write. Items take add_todo's fields. Returns ids plus per-item errors.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "List of {description, project, priority?, target_agent?, notes?, ticket?, metadata?}"
+                }
+            },
+            "required": ["items"]
+        }
+    },
+    "update_todos": {
+        "name": "update_todos",
+        "description": "Update several tasks in one write. Same rules as update_todo; use complete_todo to complete.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "List of {todo_id, updates} — metadata in updates is MERGED not replaced"
+                }
+            },
+            "required": ["items"]
+        }
+    },
     "add_lesson": {
         "name": "add_lesson",
         "description": "Persist a lesson/pitfall for future recall. Tag well — drives preflight_rag relevance.",
@@ -204,6 +254,21 @@ TOOL_SCHEMAS = {
             "required": ["language", "topic", "lesson_learned"]
         }
     },
+    "add_lessons": {
+        "name": "add_lessons",
+        "description": "Store several lessons in one write. Items take add_lesson's fields. Returns ids plus per-item errors.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "items": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "List of {language, topic, lesson_learned, tags?}"
+                }
+            },
+            "required": ["items"]
+        }
+    },
     "get_lesson": {
         "name": "get_lesson",
         "description": "Retrieve single lesson by UUID. Returns full content.",
@@ -258,7 +323,8 @@ TOOL_SCHEMAS = {
                 "query": {"type": "string", "description": "Search text"},
                 "fields": {"type": "array", "description": "Fields to search (default: topic, lesson_learned, tags)"},
                 "limit": {"type": "number", "description": "Max results (default: 20)"},
-                "brief": {"type": "boolean", "description": "Force topic+tags only, no lesson_learned. Omit for auto: fat sets return a match-relevant snippet, small ones keep full text."}
+                "brief": {"type": "boolean", "description": "Force topic+tags only, no lesson_learned. Omit for auto: fat sets return a match-relevant snippet, small ones keep full text."},
+                "projection": {"type": "object", "description": "{field: 1} include / {field: 0} exclude. Default already skips _id and the embedding"}
             },
             "required": ["query"]
         }
@@ -282,7 +348,8 @@ TOOL_SCHEMAS = {
             "type": "object",
             "properties": {
                 "limit": {"type": "number", "description": "Max results (default: 20)"},
-                "brief": {"type": "boolean", "description": "Force topic+tags only, no lesson_learned. Omit for auto: lesson_learned is snipped once the set gets fat, kept whole when small."}
+                "brief": {"type": "boolean", "description": "Force topic+tags only, no lesson_learned. Omit for auto: lesson_learned is snipped once the set gets fat, kept whole when small."},
+                "projection": {"type": "object", "description": "{field: 1} include / {field: 0} exclude. Default already skips _id and the embedding"}
             }
         }
     },
@@ -635,7 +702,7 @@ def _resolve_client_prefs(request: Request) -> tuple:
     loadout = (
         params.get("loadout")
         or headers.get("x-omnispindle-loadout")
-        or os.getenv("OMNISPINDLE_TOOL_LOADOUT")
+        or _ENV_TOOL_LOADOUT
         or DEFAULT_REMOTE_LOADOUT
     ).strip().lower()
 
@@ -646,7 +713,7 @@ def _resolve_client_prefs(request: Request) -> tuple:
     requested_level = (
         params.get("doc_level")
         or headers.get("x-omnispindle-doc-level")
-        or os.getenv("OMNISPINDLE_DOC_LEVEL")
+        or _ENV_DOC_LEVEL
         or ""
     ).strip().lower()
 
@@ -672,7 +739,7 @@ async def mcp_handler(request: Request, get_current_user: Callable[[], Coroutine
         if asyncio.iscoroutine(user):
             user = await user
         if not user:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"error": "Unauthorized"},
                 status_code=401
             )
@@ -681,7 +748,7 @@ async def mcp_handler(request: Request, get_current_user: Callable[[], Coroutine
         try:
             rpc_request = await request.json()
         except json.JSONDecodeError as e:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "jsonrpc": "2.0",
                     "id": None,
@@ -692,7 +759,7 @@ async def mcp_handler(request: Request, get_current_user: Callable[[], Coroutine
 
         # Validate JSON-RPC format
         if not isinstance(rpc_request, dict) or "jsonrpc" not in rpc_request:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "jsonrpc": "2.0",
                     "id": rpc_request.get("id") if isinstance(rpc_request, dict) else None,
@@ -710,7 +777,7 @@ async def mcp_handler(request: Request, get_current_user: Callable[[], Coroutine
         # Handle different MCP methods
         if method == "initialize":
             # Return server capabilities for MCP protocol initialization
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "jsonrpc": "2.0",
                     "id": request_id,
@@ -749,7 +816,7 @@ async def mcp_handler(request: Request, get_current_user: Callable[[], Coroutine
 
             logger.info(f"✅ Generated {len(tools)} tool schemas for remote client")
 
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "result": {"tools": tools}
@@ -785,8 +852,11 @@ async def mcp_handler(request: Request, get_current_user: Callable[[], Coroutine
                 "list_project_todos": tools.list_project_todos,
                 "query_todos_near": tools.query_todos_near,
                 "link_todos": tools.link_todos,
+                "add_todos": tools.add_todos,
+                "update_todos": tools.update_todos,
                 # Lesson tools
                 "add_lesson": tools.add_lesson,
+                "add_lessons": tools.add_lessons,
                 "get_lesson": tools.get_lesson,
                 "update_lesson": tools.update_lesson,
                 "delete_lesson": tools.delete_lesson,
@@ -827,7 +897,7 @@ async def mcp_handler(request: Request, get_current_user: Callable[[], Coroutine
             }
 
             if tool_name not in tool_functions:
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "jsonrpc": "2.0",
                     "id": request_id,
                     "error": {"code": -32601, "message": f"Method not found: {tool_name}"}
@@ -837,7 +907,7 @@ async def mcp_handler(request: Request, get_current_user: Callable[[], Coroutine
             user_tier = user.get("subscription_tier", "free")
             if is_pro_tool(tool_name) and user_tier not in ("pro", "admin"):
                 logger.info(f"🚫 Tier gate: {user.get('email', 'unknown')} blocked from pro tool '{tool_name}' (tier: {user_tier})")
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "jsonrpc": "2.0",
                     "id": request_id,
                     "error": {
@@ -851,7 +921,7 @@ async def mcp_handler(request: Request, get_current_user: Callable[[], Coroutine
                 tool_func = tool_functions[tool_name]
                 result = await tool_func(**tool_arguments, ctx=ctx)
 
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "jsonrpc": "2.0",
                     "id": request_id,
                     "result": {"content": [{"type": "text", "text": _as_text(result)}]}
@@ -859,14 +929,14 @@ async def mcp_handler(request: Request, get_current_user: Callable[[], Coroutine
 
             except Exception as tool_error:
                 logger.error(f"Tool execution error: {tool_error}")
-                return JSONResponse(content={
+                return ORJSONResponse(content={
                     "jsonrpc": "2.0",
                     "id": request_id,
                     "error": {"code": -32603, "message": "Internal error", "data": str(tool_error)}
                 })
 
         else:
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "jsonrpc": "2.0",
                 "id": request_id,
                 "error": {"code": -32601, "message": f"Method not found: {method}"}
@@ -874,7 +944,7 @@ async def mcp_handler(request: Request, get_current_user: Callable[[], Coroutine
 
     except Exception as e:
         logger.error(f"MCP handler error: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "jsonrpc": "2.0",
                 "id": None,
@@ -1,4 +1,5 @@
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.responses import Response, JSONResponse
 from starlette.types import ASGIApp
 import logging
@@ -79,6 +80,22 @@ class ConnectionErrorsMiddleware(BaseHTTPMiddleware):
 # Keep the old middleware for backward compatibility
 SuppressNoResponseReturnedMiddleware = ConnectionErrorsMiddleware
 
+
+class JSONGZipMiddleware(GZipMiddleware):
+    """
+    Gzip responses for clients that accept it, except SSE streams.
+    tools/list and query results are tens of KB of JSON that compress well; an
+    event stream has to go out event by event, so */sse paths pass through.
+    """
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        super().__init__(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].rstrip("/").endswith("/sse"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
 class NoneTypeResponseMiddleware(BaseHTTPMiddleware):
     """
     Middleware to handle 'NoneType' object is not callable errors.
@@ -1,18 +1,80 @@
+import asyncio
+import atexit
+import logging
 import os
 import subprocess
-import shutil 
-from typing import Optional, Any
+import threading
+import uuid
+from typing import Dict, Optional, Any, Tuple
 
+import paho.mqtt.client as paho
 from fastmcp import Context
 
+logger = logging.getLogger(__name__)
+
 # MQTT configuration from environment
 MQTT_HOST = os.getenv("MQTT_HOST", "localhost")
 MQTT_PORT = int(os.getenv("MQTT_PORT", 1883))
-MOSQUITTO_PUB_AVAILABLE = shutil.which("mosquitto_pub") is not None
+
+# One long-lived client per broker, connected in paho's background thread.
+# Publishing through it is a local enqueue instead of a fork of mosquitto_pub
+# plus a fresh TCP + CONNECT handshake per message.
+_clients: Dict[Tuple[str, int], paho.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def get_mqtt_client(host: str = MQTT_HOST, port: int = MQTT_PORT) -> paho.Client:
+    """Return the shared client for a broker, connecting it on first use.
+
+    connect_async + loop_start means a broker that is down never blocks the
+    caller; paho keeps retrying in the background and publishes made while
+    disconnected are dropped (they are status messages).
+    """
+    key = (host, int(port))
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = paho.Client(paho.CallbackAPIVersion.VERSION2,
+                                 client_id=f"omnispindle-{uuid.uuid4()}", clean_session=True)
+            client.connect_async(host, int(port), keepalive=60)
+            client.loop_start()
+            _clients[key] = client
+    return client
+
+
+def close_mqtt_clients() -> None:
+    """Disconnect every shared client (registered with atexit)."""
+    with _clients_lock:
+        for client in _clients.values():
+            try:
+                client.disconnect()
+                client.loop_stop()
+            except Exception:
+                pass
+        _clients.clear()
+
+
+atexit.register(close_mqtt_clients)
+
+
+async def _ctx_log(ctx: Optional[Context], level: str, fmt: str, *args) -> None:
+    """Send a log line to the MCP client; the line is only formatted when there is a client."""
+    if ctx is None:
+        return
+    text = fmt % args if args else fmt
+    try:
+        await getattr(ctx, level)(text)
+    except Exception as log_error:
+        # Fall back to the module logger if context logging fails
+        logger.log(logging.ERROR if level == "error" else logging.INFO, "%s (context logging failed: %s)", text, log_error)
+
 
 async def mqtt_publish(topic: str, message: str, ctx: Optional[Context] = None, retain: bool = False) -> bool:
     """
-    Publish a message to an MQTT topic using mosquitto_pub
+    Publish a message to an MQTT topic over the shared persistent client
     
     Args:
         topic: MQTT topic to publish to
@@ -23,43 +85,42 @@ async def mqtt_publish(topic: str, message: str, ctx: Optional[Context] = None,
     Returns:
         True if publish successful, False otherwise
     """
-    if not MOSQUITTO_PUB_AVAILABLE:
-        print(f"MQTT publishing not available - would publish {message} to {topic} (retain={retain})")
-        return False
-
     try:
-        cmd = ["mosquitto_pub", "-h", MQTT_HOST, "-p", str(MQTT_PORT), "-t", topic, "-m", str(message)]
-        if retain:
-            cmd.append("-r")
-        subprocess.run(cmd, check=True, capture_output=True, text=True)
-        
-        # Safe context logging with error handling
-        if ctx:
-            try:
-                await ctx.info(f"MQTT published to {topic}: {message} (retain={retain})")
-            except Exception as log_error:
-                # Fallback to standard logging if context logging fails
-                print(f"MQTT published to {topic}: {message} (retain={retain})")
-                print(f"Context logging failed: {log_error}")
+        info = get_mqtt_client().publish(topic, str(message), qos=0, retain=retain)
+        if info.rc != paho.MQTT_ERR_SUCCESS:
+            raise ConnectionError(paho.error_string(info.rc))
         
+        await _ctx_log(ctx, "info", "MQTT published to %s: %s (retain=%s)", topic, message, retain)
         return True
-    except subprocess.CalledProcessError as e:
-        error_msg = f"Failed to publish MQTT message: {str(e)}"
-        
-        # Safe context logging with error handling
-        if ctx:
-            try:
-                await ctx.error(error_msg)
-            except Exception as log_error:
-                # Fallback to standard logging if context logging fails
-                print(error_msg)
-                print(f"Context logging failed: {log_error}")
+    except Exception as e:
+        if ctx is None:
+            logger.warning("Failed to publish MQTT message to %s: %s", topic, e)
         else:
-            print(error_msg)
-            
+            await _ctx_log(ctx, "error", "Failed to publish MQTT message: %s", e)
         return False
 
 
+async def _sub_once(topic: str, timeout: float = 3.0, host: str = MQTT_HOST, port: int = MQTT_PORT) -> str:
+    """Read one message with mosquitto_sub without blocking the event loop.
+
+    Raises the same subprocess errors subprocess.run(check=True, timeout=...)
+    would, so callers keep a single except clause.
+    """
+    cmd = ["mosquitto_sub", "-h", host, "-p", str(port), "-t", topic, "-C", "1"]
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stdout, stderr)
+    return stdout.decode(errors="replace").strip()
+
+
 async def mqtt_get(topic: str) -> Optional[str]:
     """
     Get the latest message from an MQTT topic
@@ -71,10 +132,7 @@ async def mqtt_get(topic: str) -> Optional[str]:
         The message content or None if retrieval failed
     """
     try:
-        cmd = ["mosquitto_sub", "-h", MQTT_HOST, "-p", str(MQTT_PORT), "-t", topic, "-C", "1"]
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=3)
-        return result.stdout.strip()
-    except subprocess.SubprocessError as e:
-        error_msg = f"Failed to get MQTT message: {str(e)}"
-        print(error_msg)
-        return None 
+        return await _sub_once(topic)
+    except (subprocess.SubprocessError, OSError) as e:
+        logger.warning("Failed to get MQTT message from %s: %s", topic, e)
+        return None
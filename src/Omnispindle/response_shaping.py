@@ -6,8 +6,9 @@ implementations use the same compaction rules — tools.py imports api_tools, so
 anything api_tools needs from it has to live here to avoid an import cycle.
 """
 
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, Optional
 
 
 # Stop words stripped from tokenized/RAG searches to avoid matching on noise tokens.
@@ -66,7 +67,16 @@ def _iso_from_epoch(value) -> Optional[str]:
     """Render an epoch-seconds value as an ISO-8601 UTC string, or None if not epoch-like."""
     if isinstance(value, datetime):
         return value.isoformat()
-    if isinstance(value, (int, float)) and not isinstance(value, bool):
+    # Whole seconds (what the tools store) format straight from a struct_time;
+    # floats go through datetime to keep their microseconds.
+    if isinstance(value, int) and not isinstance(value, bool):
+        try:
+            tm = time.gmtime(value)
+        except (ValueError, OSError, OverflowError):
+            return None
+        # datetime tops out at year 9999; keep rejecting what it rejected
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", tm) if tm.tm_year <= 9999 else None
+    if isinstance(value, float):
         try:
             return datetime.fromtimestamp(value, tz=timezone.utc).isoformat().replace("+00:00", "Z")
         except (ValueError, OSError, OverflowError):
@@ -124,8 +134,9 @@ def compact_todo(doc: dict, brief: bool = False, iso_dates: bool = False) -> dic
     return out
 
 
-def compact_todo_list(docs: list, brief: bool = False, iso_dates: bool = False) -> list:
-    """Apply compact_todo to each item in a list."""
+def compact_todo_list(docs: Iterable[dict], brief: bool = False, iso_dates: bool = False) -> list:
+    """Apply compact_todo to each item. Pass a cursor straight in so raw docs
+    are dropped batch by batch instead of held alongside the compacted list."""
     return [compact_todo(d, brief=brief, iso_dates=iso_dates) for d in docs if d]
 
 
@@ -160,8 +171,8 @@ def compact_lesson(doc: dict, brief: bool = False, iso_dates: bool = False) -> d
     return out
 
 
-def compact_lesson_list(docs: list, brief: bool = False, iso_dates: bool = False) -> list:
-    """Apply compact_lesson to each item in a list."""
+def compact_lesson_list(docs: Iterable[dict], brief: bool = False, iso_dates: bool = False) -> list:
+    """Apply compact_lesson to each item. Accepts a cursor, same as compact_todo_list."""
     return [compact_lesson(d, brief=brief, iso_dates=iso_dates) for d in docs if d]
 
 
@@ -272,11 +283,7 @@ def apply_response_diet(items: list, query: Optional[str] = None) -> tuple:
     item = items[0]
     if isinstance(item, dict) and total_notes > _NOTES_SINGLE_HIT_BUDGET:
         item = dict(item)
-        notes = item["notes"]
-        item["notes"] = (
-            notes[:_NOTES_SINGLE_HIT_BUDGET]
-            + f"… [truncated — {len(notes)} chars total, get_todo('{item.get('id', '')}') for full]"
-        )
+        item["notes"] = _truncate_with_hint(item["notes"], _NOTES_SINGLE_HIT_BUDGET, "get_todo", item.get("id", ""))
         return [item], "truncated"
     return items, "full"
 
@@ -289,6 +296,13 @@ _LESSON_SINGLE_HIT_BUDGET = 4000  # single hit: truncate lesson_learned past thi
 _LESSON_SNIPPET_MIN = 240         # a snippet below this says nothing useful
 
 
+def _truncate_with_hint(text: str, budget: int, getter: str, item_id: str) -> str:
+    """Head of `text` cut at `budget` chars, with a pointer to the full read; short text unchanged."""
+    if len(text) <= budget:
+        return text
+    return text[:budget] + f"… [truncated — {len(text)} chars total, {getter}('{item_id}') for full]"
+
+
 def _match_snippet(text: str, tokens: list, budget: int) -> str:
     """Window `budget` chars of `text` around the first token hit (head if none)."""
     start = 0
@@ -347,11 +361,8 @@ def apply_lesson_diet(items: list, query: Optional[str] = None) -> tuple:
     item = items[0]
     if isinstance(item, dict) and total > _LESSON_SINGLE_HIT_BUDGET:
         item = dict(item)
-        text = item["lesson_learned"]
-        item["lesson_learned"] = (
-            text[:_LESSON_SINGLE_HIT_BUDGET]
-            + f"… [truncated — {len(text)} chars total, get_lesson('{item.get('id', '')}') for full]"
-        )
+        item["lesson_learned"] = _truncate_with_hint(
+            item["lesson_learned"], _LESSON_SINGLE_HIT_BUDGET, "get_lesson", item.get("id", ""))
         return [item], "truncated"
     return items, "full"
 
@@ -19,7 +19,7 @@ from collections import defaultdict
 
 from pymongo import MongoClient
 from .ai_assistant import assistant as todo_assistant
-from .utils import mqtt_publish
+from .utils import emit_status
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -34,6 +34,12 @@ mongo_client = MongoClient(MONGODB_URI)
 db = mongo_client[MONGODB_DB]
 collection = db[MONGODB_COLLECTION]
 
+# Status topics per scheduling tool, built once instead of per call
+_STATUS_TOPICS = {
+    name: f"status/{os.getenv('DeNa')}/{name}"
+    for name in ("suggest_deadline", "suggest_time_slot", "generate_daily_schedule")
+}
+
 # Constants for scheduling
 WORKING_HOURS = {
     # Weekday: [(start_hour, start_minute), (end_hour, end_minute)]
@@ -710,7 +716,7 @@ async def suggest_deadline(todo_id: str) -> str:
     """
     try:
         result = scheduler.suggest_deadline(todo_id)
-        await mqtt_publish(f"status/{os.getenv('DeNa')}/suggest_deadline", json.dumps({"todo_id": todo_id, "result": result}))
+        emit_status(_STATUS_TOPICS["suggest_deadline"], {"todo_id": todo_id, "result": result})
         return json.dumps(result)
     except Exception as e:
         logger.error(f"Error suggesting deadline for todo {todo_id}: {e}")
@@ -730,7 +736,7 @@ async def suggest_time_slot(todo_id: str, date: Optional[str] = None) -> str:
     """
     try:
         result = scheduler.suggest_time_slot(todo_id, date)
-        await mqtt_publish(f"status/{os.getenv('DeNa')}/suggest_time_slot", json.dumps({"todo_id": todo_id, "date": date, "result": result}))
+        emit_status(_STATUS_TOPICS["suggest_time_slot"], {"todo_id": todo_id, "date": date, "result": result})
         return json.dumps(result)
     except Exception as e:
         logger.error(f"Error suggesting time slot for todo {todo_id}: {e}")
@@ -749,7 +755,7 @@ async def generate_daily_schedule(date: Optional[str] = None) -> str:
     """
     try:
         result = scheduler.generate_daily_schedule(date)
-        await mqtt_publish(f"status/{os.getenv('DeNa')}/generate_daily_schedule", json.dumps({"date": date, "result": result}))
+        emit_status(_STATUS_TOPICS["generate_daily_schedule"], {"date": date, "result": result})
         return json.dumps(result)
     except Exception as e:
         logger.error(f"Error generating daily schedule: {e}")
@@ -47,11 +47,15 @@ from .middleware import (
     ConnectionErrorsMiddleware,
     SuppressNoResponseReturnedMiddleware,
     NoneTypeResponseMiddleware,
+    JSONGZipMiddleware,
     create_asgi_error_handler
 )
 from .auth import get_current_user, get_current_user_from_query, AUTH_CONFIG, invalidate_api_key_cache  # Re-enabled for MCP endpoints
 from fastapi import Depends, Request
-from .todo_log_service import start_service
+from .todo_log_service import start_service, drain_log_queue
+from . import embeddings
+from .api_client import close_all_cached_clients
+from .utils import close_nr_session, stop_status_flusher
 from .database import db_connection
 from .models.config import AuthConfig
 # from .mcp_handler import mcp_handler
@@ -142,6 +146,16 @@ class Omnispindle:
             # Add middleware
             app.add_middleware(ConnectionErrorsMiddleware)
             app.add_middleware(NoneTypeResponseMiddleware)
+            app.add_middleware(JSONGZipMiddleware)
+
+            @app.on_event("shutdown")
+            async def flush_background_work():
+                """Write queued audit logs and status messages and close shared clients before exit."""
+                await drain_log_queue()
+                await stop_status_flusher()
+                await close_nr_session()
+                await embeddings.close_http_client()
+                await close_all_cached_clients()
 
             # Add the new /api/mcp endpoint
             # Both paths registered: FastAPI's redirect_slashes 307 on POST /api/mcp/
@@ -94,6 +94,7 @@ class OmnispindleSSE:
             headers={
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
+                "X-Accel-Buffering": "no",
                 "X-SSE-Handler": "OmnispindleSSE"
             }
         )
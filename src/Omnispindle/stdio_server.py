@@ -26,7 +26,10 @@ from .auth_flow import ensure_authenticated, run_async_in_thread
 from .auth_utils import verify_auth0_token, get_jwks, AUTH_CONFIG
 from fastmcp import FastMCP
 from .context import Context
-from . import tools
+from . import embeddings, tools
+from .api_client import close_all_cached_clients
+from .todo_log_service import drain_log_queue
+from .utils import close_nr_session, stop_status_flusher
 from .documentation_manager import get_tool_doc, build_tool_docstring
 
 # Configure logging to stderr so it doesn't interfere with stdio protocol
@@ -282,6 +285,10 @@ class OmniSpindleStdioServer:
                 "func": tools.add_lesson,
                 "doc": get_tool_doc("add_lesson")
             },
+            "add_lessons": {
+                "func": tools.add_lessons,
+                "doc": get_tool_doc("add_lessons")
+            },
             "get_lesson": {
                 "func": tools.get_lesson,
                 "doc": get_tool_doc("get_lesson")
@@ -394,6 +401,14 @@ class OmniSpindleStdioServer:
                 "func": tools.link_todos,
                 "doc": get_tool_doc("link_todos")
             },
+            "add_todos": {
+                "func": tools.add_todos,
+                "doc": get_tool_doc("add_todos")
+            },
+            "update_todos": {
+                "func": tools.update_todos,
+                "doc": get_tool_doc("update_todos")
+            },
             "create_quest": {
                 "func": tools.create_quest,
                 "doc": get_tool_doc("create_quest")
@@ -554,6 +569,16 @@ class OmniSpindleStdioServer:
                                 return await func(language, topic, lesson_learned, tags, ctx=ctx)
                             return add_lesson
 
+                        elif name == "add_lessons":
+                            @self.server.tool(description=docstring)
+                            async def add_lessons(
+                                items: Annotated[list, Field(description="List of {language, topic, lesson_learned, tags?}")]
+                            ) -> str:
+                                """Add several lessons in one write. Returns ids plus per-item errors."""
+                                ctx = _create_context()
+                                return await func(items, ctx=ctx)
+                            return add_lessons
+
                         elif name == "get_lesson":
                             @self.server.tool(description=docstring)
                             async def get_lesson(
@@ -882,6 +907,26 @@ class OmniSpindleStdioServer:
                                 return await func(blocker_id=blocker_id, blocked_id=blocked_id, ctx=ctx)
                             return link_todos
 
+                        elif name == "add_todos":
+                            @self.server.tool(description=docstring)
+                            async def add_todos(
+                                items: Annotated[list, Field(description="List of {description, project, priority?, target_agent?, notes?, ticket?, metadata?}")]
+                            ) -> str:
+                                """Create several todos in one write. Returns ids plus per-item errors."""
+                                ctx = _create_context()
+                                return await func(items, ctx=ctx)
+                            return add_todos
+
+                        elif name == "update_todos":
+                            @self.server.tool(description=docstring)
+                            async def update_todos(
+                                items: Annotated[list, Field(description="List of {todo_id, updates}")]
+                            ) -> str:
+                                """Update several todos in one write. Same rules as update_todo."""
+                                ctx = _create_context()
+                                return await func(items, ctx=ctx)
+                            return update_todos
+
                         elif name == "create_quest":
                             @self.server.tool(description=docstring)
                             async def create_quest(
@@ -950,7 +995,15 @@ class OmniSpindleStdioServer:
     async def run(self):
         """Run the stdio server."""
         logger.info("Starting Omnispindle stdio MCP server with FastMCP")
-        await self.server.run_stdio_async()
+        try:
+            await self.server.run_stdio_async()
+        finally:
+            # Queued audit logs and status messages would die with the process
+            await drain_log_queue()
+            await stop_status_flusher()
+            await close_nr_session()
+            await embeddings.close_http_client()
+            await close_all_cached_clients()
 
 
 async def main():
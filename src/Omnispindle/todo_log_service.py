@@ -12,7 +12,7 @@ This approach:
 - Simplifies the architecture by eliminating stream monitoring
 """
 
-import json
+import asyncio
 import logging
 import os
 from datetime import datetime, timezone
@@ -26,6 +26,7 @@ from .database import db_connection
 
 # Import MQTT functionality
 from .mqtt import mqtt_publish
+from .utils import dumps, spawn_background
 
 # Configure logger
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -39,6 +40,13 @@ MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
 MONGODB_DB = os.getenv("MONGODB_DB", "swarmonomicon")
 MONGODB_COLLECTION = os.getenv("MONGODB_COLLECTION", "todos")
 MONGODB_LOGS_COLLECTION = os.getenv("MONGODB_LOGS_COLLECTION", "todo_logs")
+LOG_ENTRY_TOPIC = "todo/log/new_entry"
+
+# log_todo_* calls are queued and stored by one writer task per event loop,
+# so a burst of todo changes costs one insert_many per batch, not one each.
+LOG_BATCH_WINDOW = 0.01  # seconds to keep collecting after the first entry
+LOG_BATCH_MAX = 100
+LOG_QUEUE_LIMIT = 10000  # beyond this, new entries are dropped with a warning
 
 class TodoLogService:
     """
@@ -54,6 +62,8 @@ class TodoLogService:
         self.todos_collection = db_connection.todos
         self.logs_collection = db_connection.logs
         self.running = False  # Track service state
+        self._queue: Optional[asyncio.Queue] = None
+        self._writer: Optional[asyncio.Task] = None
 
         logger.info(f"TodoLogService initialized with db={self.db.name if self.db is not None else 'N/A'}, "
                     f"todos={self.todos_collection.name if self.todos_collection is not None else 'N/A'}, "
@@ -163,54 +173,161 @@ class TodoLogService:
         Returns:
             True if logging was successful, False otherwise
         """
-        try:
-            # Ensure the service is initialized before attempting to log
-            if not self.running or self.logs_collection is None:
-                logger.debug("TodoLogService not initialized, attempting to start...")
-                success = await self.start()
-                if not success:
-                    logger.warning("Failed to initialize TodoLogService for logging")
-                    return False
-
-            # Create log entry
-            log_entry = {
-                'timestamp': datetime.now(timezone.utc),
-                'operation': operation,
-                'todoId': todo_id,
-                'description': description,
-                'todoTitle': self.generate_title(description),  # Add truncated title
-                'project': project,
-                'changes': changes or [],
-                'userAgent': user_agent or 'Unknown'
-            }
+        return await self.log_batch([{
+            'operation': operation, 'todo_id': todo_id, 'description': description, 'project': project,
+            'changes': changes, 'user_agent': user_agent, 'completion_comment': completion_comment,
+            'notes': notes, 'tags': tags,
+        }], user_context)
+
+    def build_log_entry(self, operation: str, todo_id: str, description: str, project: str,
+                        changes: List[Dict] = None, user_agent: str = None, completion_comment: str = None,
+                        notes: str = None, tags: List[str] = None) -> Dict[str, Any]:
+        """
+        Build the todo_logs document for one action.
+        """
+        log_entry = {
+            'timestamp': datetime.now(timezone.utc),
+            'operation': operation,
+            'todoId': todo_id,
+            'description': description,
+            'todoTitle': self.generate_title(description),  # Add truncated title
+            'project': project,
+            'changes': changes or [],
+            'userAgent': user_agent or 'Unknown'
+        }
+
+        # Add completion comment for complete operations
+        if operation == 'complete' and completion_comment:
+            log_entry['completion_comment'] = completion_comment
+
+        # Add notes and tags if present
+        if notes:
+            log_entry['notes'] = notes
+        if tags and len(tags) > 0:
+            log_entry['tags'] = tags
+        return log_entry
+
+    async def log_batch(self, actions: List[Dict[str, Any]],
+                        user_context: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Log several todo actions with one insert_many, then notify via MQTT.
 
-            # Add completion comment for complete operations
-            if operation == 'complete' and completion_comment:
-                log_entry['completion_comment'] = completion_comment
+        Args:
+            actions: log_todo_action keyword arguments, one dict per action
+            user_context: User context for database routing, shared by the batch
 
-            # Add notes and tags if present
-            if notes:
-                log_entry['notes'] = notes
-            if tags and len(tags) > 0:
-                log_entry['tags'] = tags
+        Returns:
+            True if logging was successful, False otherwise
+        """
+        if not actions:
+            return True
+        if not await self._ensure_started():
+            return False
+        try:
+            entries = [self.build_log_entry(**action) for action in actions]
 
             # Get the appropriate logs collection for the user context
             collections = db_connection.get_collections(user_context)
             logs_collection = collections['logs']
+        except Exception as e:
+            logger.error(f"Error logging todo action: {str(e)}")
+            return False
+        return await self._store_entries(logs_collection, entries)
 
-            # Store in database
-            logs_collection.insert_one(log_entry)
-
-            # Send MQTT notification if configured
-            await self.notify_change(log_entry)
-
-            logger.info(f"Logged {operation} for todo {todo_id}")
+    async def _ensure_started(self) -> bool:
+        """Start the service on first use."""
+        if self.running and self.logs_collection is not None:
             return True
+        logger.debug("TodoLogService not initialized, attempting to start...")
+        if not await self.start():
+            logger.warning("Failed to initialize TodoLogService for logging")
+            return False
+        return True
 
+    async def _store_entries(self, logs_collection, entries: List[Dict[str, Any]]) -> bool:
+        """Store built entries with one insert_many off the event loop, then notify via MQTT."""
+        try:
+            await asyncio.to_thread(logs_collection.insert_many, entries, ordered=False)
         except Exception as e:
             logger.error(f"Error logging todo action: {str(e)}")
             return False
 
+        # Send MQTT notification if configured
+        for log_entry in entries:
+            await self.notify_change(log_entry)
+
+        if len(entries) == 1:
+            logger.info(f"Logged {entries[0]['operation']} for todo {entries[0]['todoId']}")
+        else:
+            logger.info(f"Logged {len(entries)} todo actions in one batch")
+        return True
+
+    def enqueue(self, action: Dict[str, Any], user_context: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Queue one action (log_todo_action keyword arguments) for the background writer.
+        The entry is built now, so its timestamp is the time of the change.
+
+        Returns:
+            True if the entry was queued, False if there is no loop or the queue is full
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug(f"No running event loop, skipped {action['operation']} log for todo {action['todo_id']}")
+            return False
+        if self._writer is None or self._writer.done() or self._writer.get_loop() is not loop:
+            self._queue = asyncio.Queue(maxsize=LOG_QUEUE_LIMIT)
+            self._writer = spawn_background(self._write_batches(self._queue), "todo log writer")
+        try:
+            self._queue.put_nowait((self.build_log_entry(**action), user_context))
+        except asyncio.QueueFull:
+            logger.warning(f"Todo log queue full, dropped {action['operation']} for todo {action['todo_id']}")
+            return False
+        return True
+
+    async def _write_batches(self, queue: asyncio.Queue) -> None:
+        """Store queued entries in batches until drain() queues the None sentinel."""
+        while True:
+            batch = [await queue.get()]
+            # One sleep per batch, then take whatever arrived meanwhile
+            if queue.qsize() < LOG_BATCH_MAX - 1:
+                await asyncio.sleep(LOG_BATCH_WINDOW)
+            while len(batch) < LOG_BATCH_MAX and not queue.empty():
+                batch.append(queue.get_nowait())
+            items = [item for item in batch if item is not None]
+            if items:
+                await self._store_queued(items)
+            if len(items) != len(batch):
+                return
+
+    async def _store_queued(self, items: List[tuple]) -> None:
+        """Write queued (entry, user_context) pairs, one insert_many per logs collection."""
+        if not await self._ensure_started():
+            logger.warning(f"Dropped {len(items)} todo log entries")
+            return
+        groups: Dict[Any, List[Dict[str, Any]]] = {}
+        for entry, user_context in items:
+            try:
+                logs_collection = db_connection.get_collections(user_context)['logs']
+            except Exception as e:
+                logger.error(f"Error routing log for todo {entry['todoId']}: {str(e)}")
+                continue
+            groups.setdefault(logs_collection, []).append(entry)
+        for logs_collection, entries in groups.items():
+            await self._store_entries(logs_collection, entries)
+
+    async def drain(self) -> None:
+        """Store everything still queued, then stop the writer (call on shutdown)."""
+        writer, queue = self._writer, self._queue
+        self._writer = self._queue = None
+        if writer is None or writer.done():
+            return
+        await queue.put(None)
+        try:
+            await writer
+        except Exception as e:
+            logger.error(f"Todo log writer failed while draining: {str(e)}")
+
     async def notify_change(self, log_entry: Dict[str, Any]):
         """
         Notify about a change via MQTT.
@@ -219,20 +336,13 @@ class TodoLogService:
             log_entry: The log entry to notify about
         """
         try:
-            # Convert datetime to string for JSON serialization
-            log_data = log_entry.copy()
-            log_data['timestamp'] = log_data['timestamp'].isoformat()
-
-            # Convert ObjectId to string if present
-            if '_id' in log_data:
-                log_data['_id'] = str(log_data['_id'])
+            # One orjson pass: datetimes encode as ISO 8601 natively and the
+            # ObjectId goes through dumps' str fallback, so no copy is needed.
+            message = dumps(log_entry)
 
-            # Publish to MQTT
-            topic = f"todo/log/new_entry"
-            message = json.dumps(log_data)
-
-            await mqtt_publish(topic, message)
-            logger.debug(f"MQTT notification sent for {log_entry['operation']} on {log_entry['todoId']}")
+            # Off the write path: the log entry is already stored, this is just a ping
+            spawn_background(mqtt_publish(LOG_ENTRY_TOPIC, message), f"MQTT notification for {log_entry['todoId']}")
+            logger.debug(f"MQTT notification queued for {log_entry['operation']} on {log_entry['todoId']}")
 
         except Exception as e:
             logger.error(f"Error sending MQTT notification: {str(e)}")
@@ -256,6 +366,8 @@ class TodoLogService:
         """
         Stop the Todo Log Service.
         """
+        await self.drain()
+
         # Close the MongoDB connection
         if self.db is not None:
             self.db.client.close()
@@ -387,63 +499,58 @@ async def stop_service():
     service = get_service_instance()
     await service.stop()
 
-# Direct logging functions for use in tools
+async def drain_log_queue() -> None:
+    """
+    Store every queued log entry before shutdown.
+    """
+    if _service_instance is not None:
+        await _service_instance.drain()
+
+# Direct logging functions for use in tools: each queues its entry for the
+# background writer and returns without waiting on Mongo.
 async def log_todo_create(todo_id: str, description: str, project: str, user_agent: str = None,
                          user_context: Optional[Dict[str, Any]] = None,
                          notes: str = None, tags: List[str] = None) -> bool:
     """
     Log a todo creation action.
     """
-    service = get_service_instance()
-    # Ensure service is initialized
-    if not service.running or service.logs_collection is None:
-        logger.debug("TodoLogService not initialized in log_todo_create, attempting to start...")
-        success = await service.start()
-        if not success:
-            logger.warning("Failed to initialize TodoLogService for logging todo creation")
-            return False
-    return await service.log_todo_action('create', todo_id, description, project, None, user_agent, user_context,
-                                        notes=notes, tags=tags)
+    return get_service_instance().enqueue({
+        'operation': 'create', 'todo_id': todo_id, 'description': description, 'project': project,
+        'user_agent': user_agent, 'notes': notes, 'tags': tags,
+    }, user_context)
 
 async def log_todo_update(todo_id: str, description: str, project: str,
                          changes: List[Dict] = None, user_agent: str = None, user_context: Optional[Dict[str, Any]] = None) -> bool:
     """
     Log a todo update action.
     """
-    service = get_service_instance()
-    # Ensure service is initialized
-    if not service.running or service.logs_collection is None:
-        logger.debug("TodoLogService not initialized in log_todo_update, attempting to start...")
-        success = await service.start()
-        if not success:
-            logger.warning("Failed to initialize TodoLogService for logging todo update")
-            return False
-    return await service.log_todo_action('update', todo_id, description, project, changes, user_agent, user_context)
+    return get_service_instance().enqueue({
+        'operation': 'update', 'todo_id': todo_id, 'description': description, 'project': project,
+        'changes': changes, 'user_agent': user_agent,
+    }, user_context)
 
 async def log_todo_complete(todo_id: str, description: str, project: str, user_agent: str = None, user_context: Optional[Dict[str, Any]] = None, completion_comment: str = None) -> bool:
     """
     Log a todo completion action.
     """
-    service = get_service_instance()
-    # Ensure service is initialized
-    if not service.running or service.logs_collection is None:
-        logger.debug("TodoLogService not initialized in log_todo_complete, attempting to start...")
-        success = await service.start()
-        if not success:
-            logger.warning("Failed to initialize TodoLogService for logging todo completion")
-            return False
-    return await service.log_todo_action('complete', todo_id, description, project, None, user_agent, user_context, completion_comment)
+    return get_service_instance().enqueue({
+        'operation': 'complete', 'todo_id': todo_id, 'description': description, 'project': project,
+        'user_agent': user_agent, 'completion_comment': completion_comment,
+    }, user_context)
 
 async def log_todo_delete(todo_id: str, description: str, project: str, user_agent: str = None, user_context: Optional[Dict[str, Any]] = None) -> bool:
     """
     Log a todo deletion action.
     """
+    return get_service_instance().enqueue({
+        'operation': 'delete', 'todo_id': todo_id, 'description': description, 'project': project,
+        'user_agent': user_agent,
+    }, user_context)
+
+async def log_todo_batch(actions: List[Dict[str, Any]], user_context: Optional[Dict[str, Any]] = None) -> bool:
+    """
+    Log several todo actions. Each action holds log_todo_action's keyword
+    arguments (operation, todo_id, description, project, ...).
+    """
     service = get_service_instance()
-    # Ensure service is initialized
-    if not service.running or service.logs_collection is None:
-        logger.debug("TodoLogService not initialized in log_todo_delete, attempting to start...")
-        success = await service.start()
-        if not success:
-            logger.warning("Failed to initialize TodoLogService for logging todo deletion")
-            return False
-    return await service.log_todo_action('delete', todo_id, description, project, None, user_agent, user_context)
+    return all([service.enqueue(action, user_context) for action in actions])
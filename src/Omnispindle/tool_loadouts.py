@@ -14,13 +14,13 @@ from .tool_metadata import filter_remote_safe_loadout, is_pro_tool
 # Base loadout definitions (before security filtering for remote mode)
 _BASE_LOADOUTS: Dict[str, List[str]] = {
     "full": [
-        # Todo management (11 tools)
+        # Todo management (13 tools)
         "add_todo", "query_todos", "update_todo", "delete_todo", "get_todo",
         "complete_todo", "list_todos_by_status", "search_todos", "list_project_todos",
-        "query_todos_near", "link_todos",
+        "query_todos_near", "link_todos", "add_todos", "update_todos",
 
-        # Lessons (8 tools)
-        "add_lesson", "get_lesson", "update_lesson", "delete_lesson", "regenerate_embedding",
+        # Lessons (9 tools)
+        "add_lesson", "add_lessons", "get_lesson", "update_lesson", "delete_lesson", "regenerate_embedding",
         "search_lessons", "grep_lessons", "list_lessons",
 
         # Admin/System (5 tools)
@@ -78,8 +78,8 @@ _BASE_LOADOUTS: Dict[str, List[str]] = {
     ],
 
     "lessons": [
-        # Knowledge management focus (8 tools)
-        "add_lesson", "get_lesson", "update_lesson", "delete_lesson", "regenerate_embedding",
+        # Knowledge management focus (9 tools)
+        "add_lesson", "add_lessons", "get_lesson", "update_lesson", "delete_lesson", "regenerate_embedding",
         "search_lessons", "grep_lessons", "list_lessons"
     ],
 
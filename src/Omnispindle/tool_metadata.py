@@ -43,6 +43,8 @@ TOOL_ACCESS_LEVELS: Dict[str, ToolAccessLevel] = {
     "add_todo": ToolAccessLevel.REMOTE_SAFE,
     "query_todos": ToolAccessLevel.REMOTE_SAFE,
     "update_todo": ToolAccessLevel.REMOTE_SAFE,
+    "add_todos": ToolAccessLevel.REMOTE_SAFE,
+    "update_todos": ToolAccessLevel.REMOTE_SAFE,
     "delete_todo": ToolAccessLevel.REMOTE_SAFE,
     "get_todo": ToolAccessLevel.REMOTE_SAFE,
     "complete_todo": ToolAccessLevel.REMOTE_SAFE,
@@ -50,6 +52,7 @@ TOOL_ACCESS_LEVELS: Dict[str, ToolAccessLevel] = {
     "search_todos": ToolAccessLevel.REMOTE_SAFE,
     "list_project_todos": ToolAccessLevel.REMOTE_SAFE,
     "add_lesson": ToolAccessLevel.REMOTE_SAFE,
+    "add_lessons": ToolAccessLevel.REMOTE_SAFE,
     "get_lesson": ToolAccessLevel.REMOTE_SAFE,
     "update_lesson": ToolAccessLevel.REMOTE_SAFE,
     "delete_lesson": ToolAccessLevel.REMOTE_SAFE,
@@ -113,6 +116,12 @@ TOOL_FEATURES: Dict[str, Set[ToolFeature]] = {
     "update_todo": {
         ToolFeature.DATABASE_WRITE,
     },
+    "add_todos": {
+        ToolFeature.DATABASE_WRITE,
+    },
+    "update_todos": {
+        ToolFeature.DATABASE_WRITE,
+    },
     "delete_todo": {
         ToolFeature.DATABASE_WRITE,
     },
@@ -128,6 +137,9 @@ TOOL_FEATURES: Dict[str, Set[ToolFeature]] = {
     "add_lesson": {
         ToolFeature.DATABASE_WRITE,
     },
+    "add_lessons": {
+        ToolFeature.DATABASE_WRITE,
+    },
     "get_lesson": {
         ToolFeature.DATABASE_READ,
     },
@@ -3,23 +3,29 @@ import os
 import re
 import ssl
 import subprocess
+import time
 import asyncio
-import uuid
 from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from uuid import UUID
 from typing import Union, List, Dict, Optional, Any
 
 import logging
+import orjson
 from dotenv import load_dotenv
 
 from .context import Context
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
+from bson.regex import Regex
 
-from .database import db_connection
-from .utils import create_response, mqtt_publish, _format_duration, MongoJSONEncoder
-from .todo_log_service import log_todo_create, log_todo_update, log_todo_delete, log_todo_complete
+from .database import db_connection, TODO_SEARCH_FIELDS, LESSON_SEARCH_FIELDS
+from .utils import create_response, dumps, emit_status, spawn_background, _format_duration
+from .todo_log_service import log_todo_create, log_todo_update, log_todo_delete, log_todo_complete, log_todo_batch
 from .schemas.todo_metadata_schema import validate_todo_metadata, validate_todo, TodoMetadata, normalize_priority
 from .query_handlers import enhance_todo_query, build_metadata_aggregation, get_query_enhancer
-from .git_integration import enrich_metadata_with_git, get_changed_files
+from .git_integration import enrich_metadata_with_git, get_changed_files, get_git_metadata
 from . import api_tools
 from . import embeddings
 from .response_shaping import (
@@ -50,6 +56,59 @@ _LESSON_NO_VECTOR = {"embedding": 0, "embedding_updated_at": 0}
 # Same idea on the todo side, for read paths that don't pass a caller projection.
 _NO_VECTOR = {"embedding": 0, "embedding_updated_at": 0}
 
+# Default list/search projections. The compactors drop _id anyway, and a brief
+# read drops notes and updated_at, so don't haul any of it off the server in
+# the first place. A brief lesson is only its label fields (compact_lesson's
+# brief whitelist) — lesson_learned is the bulk of the document.
+_TODO_LIST_PROJECTION = {"_id": 0, **_NO_VECTOR}
+_TODO_BRIEF_PROJECTION = {**_TODO_LIST_PROJECTION, "notes": 0, "updated_at": 0}
+_LESSON_LIST_PROJECTION = {"_id": 0, **_LESSON_NO_VECTOR}
+_LESSON_BRIEF_PROJECTION = {"_id": 0, "id": 1, "topic": 1, "language": 1, "tags": 1}
+
+# Prebuilt per-status filters for list_todos_by_status — the lookup doubles as
+# validation. Read-only views: query_todos copies the filter before adding to it.
+_STATUS_FILTERS = {
+    status: MappingProxyType({"status": status})
+    for status in ('pending', 'completed', 'initial', 'blocked', 'in_progress', 'review')
+}
+_ALL_DOCS = MappingProxyType({})
+
+# $text reads come back best match first, so a limit keeps the strongest hits
+# rather than the newest. Mongo sorts on textScore without projecting it.
+_TEXT_SCORE_SORT = [("score", {"$meta": "textScore"})]
+_NEWEST_FIRST = [("created_at", -1)]
+
+
+@lru_cache(maxsize=256)
+def _exact_ci(value: str) -> Regex:
+    """Case-insensitive whole-value match, escaped and built once per distinct value.
+
+    A bson Regex rather than a {"$regex": ...} dict, so the cached filter
+    value can't be mutated by whoever uses it.
+    """
+    return Regex(f"^{re.escape(value)}$", "i")
+
+
+def _new_id() -> str:
+    """Id for a new todo, lesson or quest.
+
+    Stays a dashed UUID string: ids are matched as-is and the dashes keep a
+    hex id like '313e8715...' from being read as a float by JSON clients.
+
+    Version 7 (RFC 9562): a 48-bit millisecond timestamp leads, then 74 random
+    bits. New ids land at the right-hand edge of the unique id index instead
+    of a random page, so inserts keep touching the same few B-tree pages.
+    """
+    rand = int.from_bytes(os.urandom(10), "big")
+    return str(UUID(int=(
+        (time.time_ns() // 1_000_000) << 80
+        | 0x7 << 76                                # version
+        | (rand >> 62 & 0xFFF) << 64               # rand_a
+        | 0b10 << 62                               # variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF             # rand_b
+    )))
+
+
 # Load environment variables
 load_dotenv()
 
@@ -65,7 +124,15 @@ def _build_tokenized_search_query(query: str, fields: list) -> dict:
     Stop words are stripped so common verbs/articles don't inflate matches.
     Each meaningful token must match in at least one field (AND logic).
     Single-token queries behave identically to the original regex approach.
+
+    The filter is shared between calls with the same query and fields — treat
+    it as read-only (copy before adding keys, as _query_todos_page does).
     """
+    return _tokenized_search_query(query, tuple(fields))
+
+
+@lru_cache(maxsize=256)
+def _tokenized_search_query(query: str, fields: tuple) -> dict:
     all_tokens = [t for t in query.split() if t.strip()]
     # Strip stop words; fall back to all tokens if everything is a stop word
     filtered = [re.escape(t) for t in all_tokens
@@ -87,6 +154,24 @@ def _build_tokenized_search_query(query: str, fields: list) -> dict:
     }
 
 
+def _text_search_filter(tokens: list, fields: list, indexed_fields: tuple) -> Optional[dict]:
+    """$text filter for an OR search over the collection's text index.
+
+    One index probe replaces the token x field $regex fan-out. Only used when
+    the caller is searching exactly the indexed fields — $text can't be scoped
+    to a subset, and can't see fields outside the index.
+    """
+    if not tokens or set(fields) != set(indexed_fields):
+        return None
+    return {"$text": {"$search": " ".join(tokens)}}
+
+
+def _merge_search_hits(primary: list, extra: list) -> list:
+    """primary's hits, then extra's that primary didn't already return (by id)."""
+    seen = {doc.get("id") for doc in primary}
+    return primary + [doc for doc in extra if doc.get("id") not in seen]
+
+
 
 
 
@@ -185,7 +270,7 @@ def cache_lesson_tags(tags_list, ctx=None):
         cache_entry = {
             "key": TAGS_CACHE_KEY,
             "tags": list(tags_list),
-            "updated_at": int(datetime.now(timezone.utc).timestamp())
+            "updated_at": int(time.time())
         }
 
         # Use upsert to update if exists or insert if not
@@ -221,7 +306,7 @@ def get_cached_lesson_tags(ctx=None):
             return None
 
         # Check if cache is expired
-        current_time = int(datetime.now(timezone.utc).timestamp())
+        current_time = int(time.time())
         if current_time - cache_entry["updated_at"] > TAGS_CACHE_EXPIRY:
             # Cache expired, invalidate it
             invalidate_lesson_tags_cache(ctx)
@@ -313,7 +398,7 @@ def cache_projects(projects_list, ctx=None):
         cache_entry = {
             "key": PROJECTS_CACHE_KEY,
             "projects": list(projects_list),
-            "updated_at": int(datetime.now(timezone.utc).timestamp())
+            "updated_at": int(time.time())
         }
         tags_cache_collection.update_one(
             {"key": PROJECTS_CACHE_KEY},
@@ -346,7 +431,7 @@ def get_cached_projects(ctx=None):
             return None
 
         # Check if cache is expired
-        current_time = int(datetime.now(timezone.utc).timestamp())
+        current_time = int(time.time())
         if current_time - cache_entry["updated_at"] > PROJECTS_CACHE_EXPIRY:
             invalidate_projects_cache(ctx)
             return None
@@ -400,7 +485,7 @@ def initialize_projects_collection(ctx=None):
             return True
 
         # Insert all valid projects with enhanced metadata
-        current_time = int(datetime.now(timezone.utc).timestamp())
+        current_time = int(time.time())
         project_definitions = {
             "madness_interactive": {
                 "git_url": "https://github.com/d-edens/madness_interactive.git",
@@ -556,13 +641,18 @@ def normalize_project_name(project: Optional[str]) -> str:
     return project_lower or "madness_interactive"
 
 
+# Feature flags are read once at import (after load_dotenv) rather than on
+# every add_todo; changing one takes a restart, like the rest of the config.
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+_VALIDATE_PROJECT_NAMES = os.getenv("OMNISPINDLE_VALIDATE_PROJECT_NAMES", "").strip().lower() in _TRUTHY
+
+
 def should_validate_project_name() -> bool:
     """
     Feature flag for slower, lookup-based project validation.
     Default is disabled for lower add_todo latency.
     """
-    raw = os.getenv("OMNISPINDLE_VALIDATE_PROJECT_NAMES", "").strip().lower()
-    return raw in {"1", "true", "yes", "on"}
+    return _VALIDATE_PROJECT_NAMES
 
 
 def _is_read_only_user(ctx: Optional[Context]) -> bool:
@@ -573,6 +663,14 @@ def _is_read_only_user(ctx: Optional[Context]) -> bool:
     return not ctx or not ctx.user or not ctx.user.get('sub')
 
 
+# Read-only (demo) users get the same refusal on every write, so each one is
+# serialised once here rather than per call.
+_DEMO_CREATE_REFUSED = create_response(False, message="Demo mode: Todo creation is disabled. Please authenticate to create todos.")
+_DEMO_UPDATE_REFUSED = create_response(False, message="Demo mode: Todo updates are disabled. Please authenticate to modify todos.")
+_DEMO_DELETE_REFUSED = create_response(False, message="Demo mode: Todo deletion is disabled. Please authenticate to delete todos.")
+_DEMO_COMPLETE_REFUSED = create_response(False, message="Demo mode: Todo completion is disabled. Please authenticate to modify todos.")
+
+
 def _normalize_updates(updates, label: str = "updates") -> tuple:
     """Coerce updates to dict. Returns (dict, None) on success or (None, error_msg) on failure.
 
@@ -600,21 +698,29 @@ def _normalize_updates(updates, label: str = "updates") -> tuple:
 #     when nothing is clearly relevant
 #   • bounded by a wall-clock budget so recall NEVER blocks todo creation (honors the
 #     existing "keep add_todo latency tight" design)
+_RECALL_ON_ADD = os.getenv("OMNISPINDLE_RECALL_ON_ADD", "0").strip().lower() in _TRUTHY
+
+
 def _recall_on_add_enabled() -> bool:
-    return os.getenv("OMNISPINDLE_RECALL_ON_ADD", "0").strip().lower() in ("1", "true", "yes", "on")
+    return _RECALL_ON_ADD
 
 
-def _recall_cfg() -> dict:
-    def _f(name, default):
-        try:
-            return float(os.getenv(name, str(default)))
-        except (TypeError, ValueError):
-            return float(default)
-    return {
-        "threshold": _f("OMNISPINDLE_RECALL_THRESHOLD", 0.6),   # inject bar, NOT the 0.3 search floor
-        "limit": max(1, int(_f("OMNISPINDLE_RECALL_LIMIT", 2))),
-        "budget": _f("OMNISPINDLE_RECALL_BUDGET_SECS", 2.5),
-    }
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except (TypeError, ValueError):
+        return float(default)
+
+
+_RECALL_CFG = MappingProxyType({
+    "threshold": _env_float("OMNISPINDLE_RECALL_THRESHOLD", 0.6),   # inject bar, NOT the 0.3 search floor
+    "limit": max(1, int(_env_float("OMNISPINDLE_RECALL_LIMIT", 2))),
+    "budget": _env_float("OMNISPINDLE_RECALL_BUDGET_SECS", 2.5),
+})
+
+
+def _recall_cfg() -> MappingProxyType:
+    return _RECALL_CFG
 
 
 def _one_line(text: str, n: int = 140) -> str:
@@ -630,7 +736,7 @@ async def _recall_related_lessons(description: str, project: Optional[str], tags
     nothing above the bar. Raises nothing worth catching here — the caller guards."""
     if lessons_collection is None or not embeddings.is_available():
         return []
-    if not lessons_collection.find_one({"embedding": {"$exists": True}}):
+    if not await asyncio.to_thread(lessons_collection.find_one, {"embedding": {"$exists": True}}, {"_id": 1}):
         return []
     tag_list = [str(t) for t in tags] if isinstance(tags, (list, tuple)) else []
     query = description or ""
@@ -669,36 +775,17 @@ async def _recall_related_lessons(description: str, project: Optional[str], tags
     } for m in matched[: cfg["limit"]]]
 
 
-async def add_todo(description: str, project: str, priority: str = "Medium", target_agent: str = "user", notes: str = "", ticket: str = "", metadata: Optional[Dict[str, Any]] = None, ctx: Optional[Context] = None, **extra) -> str:
-    """
-    Creates a task in the specified project with the given priority and target agent.
+def _track_background(task_name: str, coro, ref: str) -> None:
+    """Run non-critical write follow-up work without blocking the response."""
+    spawn_background(coro, f"task '{task_name}' for {ref}")
 
-    Args:
-        description: Task description
-        project: Project name
-        priority: Priority level (default: "Medium")
-        target_agent: Who should work on this (default: "user")
-        notes: User-facing notes/context about the todo (default: "")
-        ticket: External ticket reference (default: "")
-        metadata: Optional structured metadata. Always include 'files': ['path/to/main/file']
-            so SwarmDesk can link this todo to its source node in the 3D view.
-            Spatial fields power 3D clustering and query_todos_near:
-              - district: topic area (e.g. 'rag', 'ui', 'infra', 'npc-brain', 'auth')
-              - coordinates: {x, y, z} semantic position (assign based on topic similarity to existing todos)
-              - effort: story points 1-10
-            Example: {"files": ["src/components/Dashboard.js"], "tags": ["bug", "ui"],
-                      "district": "ui", "coordinates": {"x": 2.1, "y": 0.5, "z": -1.3}, "effort": 3}
-        ctx: Context with user information
 
-    Returns a compact representation of the created todo with an ID for reference.
-    """
-    logger.info(f"🐛 tools.add_todo called with metadata type={type(metadata)}, value={metadata}")
+def _build_todo(description: str, project: str, priority: str = "Medium", target_agent: str = "user", notes: str = "", ticket: str = "", metadata: Optional[Dict[str, Any]] = None, ctx: Optional[Context] = None, now: Optional[int] = None, git_data: Optional[Dict[str, Any]] = None, **extra) -> dict:
+    """Build the todo document add_todo/add_todos insert.
 
-    # Check for read-only mode (unauthenticated demo users)
-    if _is_read_only_user(ctx):
-        return create_response(False, message="Demo mode: Todo creation is disabled. Please authenticate to create todos.")
-
-    todo_id = str(uuid.uuid4())
+    now and git_data let a batch share one timestamp and one git lookup.
+    """
+    todo_id = _new_id()
     # Canonicalize priority so AI-supplied 'low'/'LOW'/synonyms don't read as Medium downstream.
     priority = normalize_priority(priority)
     if should_validate_project_name():
@@ -751,59 +838,106 @@ async def add_todo(description: str, project: str, priority: str = "Medium", tar
             validated_metadata["_validation_warning"] = f"Schema validation failed: {str(e)}"
 
     # Enrich metadata with git context (branch, commit_hash) if available
-    validated_metadata = enrich_metadata_with_git(validated_metadata)
+    validated_metadata = enrich_metadata_with_git(validated_metadata, git_data=git_data)
 
-    todo = {
+    if now is None:
+        now = int(time.time())
+    return {
         "id": todo_id,
         "description": description,
         "project": validated_project,
         "priority": priority,
         "status": "pending",
         "target_agent": target_agent,
-        "created_at": int(datetime.now(timezone.utc).timestamp()),
-        "updated_at": int(datetime.now(timezone.utc).timestamp()),
+        "created_at": now,
+        "updated_at": now,
         "notes": notes,  # ✅ User-facing notes field
         "ticket": ticket,  # ✅ External ticket reference
         "metadata": validated_metadata
     }
+
+
+def _index_by_id(docs) -> dict:
+    """{id: doc} built straight off a cursor, without a list of the page in between."""
+    return {doc["id"]: doc for doc in docs}
+
+
+async def _store_embeddings(collection, docs: list, text_for) -> None:
+    """Embed freshly inserted docs concurrently, then write every vector in one unordered bulk_write."""
+    vectors = await asyncio.gather(*(embeddings.generate_embedding(text_for(doc)) for doc in docs))
+    ops = [UpdateOne({"id": doc["id"]}, {"$set": {"embedding": vector}}) for doc, vector in zip(docs, vectors) if vector]
+    if ops:
+        await asyncio.to_thread(collection.bulk_write, ops, ordered=False)
+
+
+def _schedule_todo_followups(todo: dict, todos_collection, user_email: str, ctx: Optional[Context], embed: bool = True) -> None:
+    """Audit log + embedding for a freshly inserted todo, off the response path.
+
+    embed=False leaves the embedding to the caller, so a batch can write all
+    of its vectors together.
+    """
+    todo_id = todo["id"]
+
+    async def _background_log_create():
+        await log_todo_create(todo_id, todo["description"], todo["project"], user_email, ctx.user if ctx else None,
+                             notes=todo.get('notes'), tags=todo.get('metadata', {}).get('tags'))
+
+    _track_background("log_todo_create", _background_log_create(), todo_id)
+    if embed:
+        _track_background("embedding_update", _store_embeddings(todos_collection, [todo], embeddings.embedding_text_for_todo), todo_id)
+
+
+async def add_todo(description: str, project: str, priority: str = "Medium", target_agent: str = "user", notes: str = "", ticket: str = "", metadata: Optional[Dict[str, Any]] = None, ctx: Optional[Context] = None, **extra) -> str:
+    """
+    Creates a task in the specified project with the given priority and target agent.
+
+    Args:
+        description: Task description
+        project: Project name
+        priority: Priority level (default: "Medium")
+        target_agent: Who should work on this (default: "user")
+        notes: User-facing notes/context about the todo (default: "")
+        ticket: External ticket reference (default: "")
+        metadata: Optional structured metadata. Always include 'files': ['path/to/main/file']
+            so SwarmDesk can link this todo to its source node in the 3D view.
+            Spatial fields power 3D clustering and query_todos_near:
+              - district: topic area (e.g. 'rag', 'ui', 'infra', 'npc-brain', 'auth')
+              - coordinates: {x, y, z} semantic position (assign based on topic similarity to existing todos)
+              - effort: story points 1-10
+            Example: {"files": ["src/components/Dashboard.js"], "tags": ["bug", "ui"],
+                      "district": "ui", "coordinates": {"x": 2.1, "y": 0.5, "z": -1.3}, "effort": 3}
+        ctx: Context with user information
+
+    Returns a compact representation of the created todo with an ID for reference.
+    """
+    logger.info(f"🐛 tools.add_todo called with metadata type={type(metadata)}, value={metadata}")
+
+    # Check for read-only mode (unauthenticated demo users)
+    if _is_read_only_user(ctx):
+        return _DEMO_CREATE_REFUSED
+
+    # The git lookups are blocking subprocesses — keep them off the event loop.
+    git_data = await asyncio.to_thread(get_git_metadata)
+    todo = _build_todo(description, project, priority, target_agent, notes, ticket, metadata, ctx, git_data=git_data, **extra)
+    todo_id = todo["id"]
+    validated_project = todo["project"]
+    validated_metadata = todo["metadata"]
     try:
         # Get user-scoped collections
         collections = db_connection.get_collections(ctx.user if ctx else None)
         todos_collection = collections['todos']
 
-        todos_collection.insert_one(todo)
+        await asyncio.to_thread(todos_collection.insert_one, todo)
         user_email = ctx.user.get("email", "anonymous") if ctx and ctx.user else "anonymous"
         logger.info(f"Todo created by {user_email} in user database: {todo_id}")
 
         # Keep add_todo latency tight: schedule non-critical follow-up work in background.
-        async def _background_log_create():
-            await log_todo_create(todo_id, description, project, user_email, ctx.user if ctx else None,
-                                 notes=todo.get('notes'), tags=todo.get('metadata', {}).get('tags'))
-
-        async def _background_embedding_update():
-            embed_text = embeddings.embedding_text_for_todo(todo)
-            embedding = await embeddings.generate_embedding(embed_text)
-            if embedding:
-                todos_collection.update_one({"id": todo_id}, {"$set": {"embedding": embedding}})
-
-        def _track_background(task_name: str, coro):
-            task = asyncio.create_task(coro)
-
-            def _done(t):
-                try:
-                    t.result()
-                except Exception as bg_err:
-                    logger.warning(f"Background add_todo task '{task_name}' failed for {todo_id}: {bg_err}")
-
-            task.add_done_callback(_done)
-
-        _track_background("log_todo_create", _background_log_create())
-        _track_background("embedding_update", _background_embedding_update())
+        _schedule_todo_followups(todo, todos_collection, user_email, ctx)
 
         resp = {
             "id": todo_id,
             "project": validated_project,
-            "priority": priority,
+            "priority": todo["priority"],
             "target_agent": target_agent,
             "created_at": todo["created_at"],
         }
@@ -822,11 +956,77 @@ async def add_todo(description: str, project: str, priority: str = "Medium", tar
                     resp["related_lessons"] = {"items": related, "count": len(related)}
             except Exception as e:
                 logger.debug(f"add_todo recall skipped for {todo_id}: {e}")
-        return json.dumps(resp)
+        return dumps(resp)
     except Exception as e:
         logger.error(f"Failed to create todo: {str(e)}")
         return create_response(False, message=str(e))
 
+
+async def _insert_unordered(collection, docs: list) -> tuple:
+    """insert_many(ordered=False) off the event loop; returns (inserted, failed) docs.
+
+    Unordered, the server keeps going past a bad document and reports every
+    failed index at the end, so the batch stays one round trip.
+    """
+    try:
+        await asyncio.to_thread(collection.insert_many, docs, ordered=False)
+    except BulkWriteError as bwe:
+        failed = {err["index"] for err in bwe.details.get("writeErrors", [])}
+        return ([d for i, d in enumerate(docs) if i not in failed],
+                [docs[i] for i in sorted(failed)])
+    return docs, []
+
+
+async def add_todos(items: List[Dict[str, Any]], ctx: Optional[Context] = None) -> str:
+    """
+    Create several todos in one insert_many round trip.
+
+    Each item takes the same fields as add_todo (description and project
+    required). Items are inserted unordered, so one bad document doesn't stop
+    the rest. Returns the created ids plus any per-item errors by index.
+    """
+    if _is_read_only_user(ctx):
+        return _DEMO_CREATE_REFUSED
+    if not isinstance(items, list) or not items:
+        return create_response(False, message="items must be a non-empty list of todo objects.")
+
+    now = int(time.time())
+    git_data = await asyncio.to_thread(get_git_metadata)
+    todos, errors = [], []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not item.get("description") or not item.get("project"):
+            errors.append({"index": index, "error": "description and project are required"})
+            continue
+        try:
+            todos.append(_build_todo(ctx=ctx, now=now, git_data=git_data, **item))
+        except TypeError as e:
+            errors.append({"index": index, "error": str(e)})
+
+    if not todos:
+        return create_response(False, {"errors": errors}, message="No valid todos to create.")
+
+    try:
+        collections = db_connection.get_collections(ctx.user if ctx else None)
+        todos_collection = collections['todos']
+
+        inserted, failed = await _insert_unordered(todos_collection, todos)
+        errors.extend({"id": t["id"], "error": "insert failed"} for t in failed)
+
+        user_email = ctx.user.get("email", "anonymous") if ctx and ctx.user else "anonymous"
+        logger.info(f"{len(inserted)} todos created by {user_email} in one batch")
+        for todo in inserted:
+            _schedule_todo_followups(todo, todos_collection, user_email, ctx, embed=False)
+        if inserted:
+            _track_background("embedding_update", _store_embeddings(todos_collection, inserted, embeddings.embedding_text_for_todo), f"{len(inserted)} todos")
+
+        resp = {"ids": [t["id"] for t in inserted], "count": len(inserted), "created_at": now}
+        if errors:
+            resp["errors"] = errors
+        return dumps(resp)
+    except Exception as e:
+        logger.error(f"Failed to create todos: {str(e)}")
+        return create_response(False, message=str(e))
+
 async def query_todos(filter: Optional[Dict[str, Any]] = None, projection: Optional[Dict[str, Any]] = None, limit: int = 100, offset: int = 0, exclude_completed: bool = True, since: Optional[int] = None, graph_root: Optional[str] = None, brief: Optional[bool] = None, ctx: Optional[Context] = None) -> str:
     """
     Query todos with flexible filtering options and pagination.
@@ -849,50 +1049,69 @@ async def query_todos(filter: Optional[Dict[str, Any]] = None, projection: Optio
     try:
         user_context = ctx.user if ctx else None
 
-        # For authenticated users with Auth0 'sub', use their personal database
-        if user_context and user_context.get('sub'):
-            collections = db_connection.get_collections(user_context)
-            todos_collection = collections['todos']
-            database_source = "personal"
-        else:
-            # For unauthenticated users, provide read-only access to shared database
-            collections = db_connection.get_collections(None)  # None = shared database
-            todos_collection = collections['todos']
-            database_source = "shared (read-only demo)"
-
         # Graph traversal mode
         if graph_root is not None:
+            todos_collection, _ = _todos_read_source(ctx)
             resolved_root = _resolve_todo_id(graph_root, user_context, db_connection)
             if resolved_root is None:
                 return create_response(False, message=f"graph_root todo '{graph_root}' not found.")
-            return _query_todo_graph(todos_collection, resolved_root)
+            return await asyncio.to_thread(_query_todo_graph, todos_collection, resolved_root)
 
-        # Build query filter
-        query_filter = filter.copy() if filter else {}
+        return dumps(await _query_todos_page(filter, projection, limit, offset, exclude_completed, since, brief, ctx))
+    except Exception as e:
+        logger.error(f"Failed to query todos: {str(e)}")
+        return create_response(False, message=str(e))
 
-        # Exclude completed items by default unless explicitly included in filter
-        if exclude_completed and "status" not in query_filter:
-            query_filter["status"] = {"$ne": "completed"}
 
-        # Filter by modification time (updated_at >= since)
-        if since is not None:
-            query_filter["updated_at"] = {"$gte": since}
+def _todos_read_source(ctx: Optional[Context]) -> tuple:
+    """(todos collection, source label) a read should use for this caller."""
+    user_context = ctx.user if ctx else None
+    # For authenticated users with Auth0 'sub', use their personal database
+    if user_context and user_context.get('sub'):
+        return db_connection.get_collections(user_context)['todos'], "personal"
+    # For unauthenticated users, provide read-only access to shared database
+    return db_connection.get_collections(None)['todos'], "shared (read-only demo)"
 
-        cursor = todos_collection.find(query_filter, projection).sort("created_at", -1).skip(offset).limit(limit)
-        results = list(cursor)
 
-        logger.info(f"Query returned {len(results)} todos from {database_source} database (offset={offset}, limit={limit}, exclude_completed={exclude_completed}, since={since}, brief={brief})")
-        # Explicit brief wins; only brief=None auto-sizes. compact_todo's own
-        # brief flag stays off in the auto path so the diet sees the real bytes.
-        compacted = compact_todo_list(results, brief=bool(brief))
-        if brief is None:
-            compacted, diet = apply_todo_list_diet(compacted)
-        else:
-            diet = "brief" if brief else "full"
-        return json.dumps({"items": compacted, "count": len(compacted), "source": database_source, "diet": diet}, cls=MongoJSONEncoder)
-    except Exception as e:
-        logger.error(f"Failed to query todos: {str(e)}")
-        return create_response(False, message=str(e))
+async def _query_todos_page(filter: Optional[Dict[str, Any]], projection: Optional[Dict[str, Any]], limit: int, offset: int,
+                            exclude_completed: bool, since: Optional[int], brief: Optional[bool], ctx: Optional[Context]) -> dict:
+    """
+    The query_todos result page as a dict, before serialization.
+
+    search_todos works on this directly, so its passes don't round-trip each
+    page through JSON. Errors propagate to the caller.
+    """
+    todos_collection, database_source = _todos_read_source(ctx)
+
+    # Build query filter
+    query_filter = filter.copy() if filter else {}
+
+    # Exclude completed items by default unless explicitly included in filter
+    if exclude_completed and "status" not in query_filter:
+        query_filter["status"] = {"$ne": "completed"}
+
+    # Filter by modification time (updated_at >= since)
+    if since is not None:
+        query_filter["updated_at"] = {"$gte": since}
+
+    if projection is None:
+        projection = _TODO_BRIEF_PROJECTION if brief else _TODO_LIST_PROJECTION
+
+    sort = _TEXT_SCORE_SORT if "$text" in query_filter else _NEWEST_FIRST
+    cursor = todos_collection.find(query_filter, projection).sort(sort).skip(offset).limit(limit)
+    # One round trip for the whole page instead of 101 docs + getMore.
+    # Explicit brief wins; only brief=None auto-sizes. compact_todo's own
+    # brief flag stays off in the auto path so the diet sees the real bytes.
+    # Compacting straight off the cursor never holds the raw page in memory;
+    # it runs in a worker thread so the round trip doesn't stall the loop.
+    compacted = await asyncio.to_thread(compact_todo_list, cursor.batch_size(limit), brief=bool(brief))
+
+    logger.info(f"Query returned {len(compacted)} todos from {database_source} database (offset={offset}, limit={limit}, exclude_completed={exclude_completed}, since={since}, brief={brief})")
+    if brief is None:
+        compacted, diet = apply_todo_list_diet(compacted)
+    else:
+        diet = "brief" if brief else "full"
+    return {"items": compacted, "count": len(compacted), "source": database_source, "diet": diet}
 
 
 def _query_todo_graph(todos_collection, root_id: str, max_hops: int = 2) -> str:
@@ -943,7 +1162,7 @@ def _query_todo_graph(todos_collection, root_id: str, max_hops: int = 2) -> str:
             seen_edges.add(key)
             unique_edges.append(e)
 
-    return json.dumps({"root": root_id, "nodes": nodes, "edges": unique_edges, "count": len(nodes)}, cls=MongoJSONEncoder)
+    return dumps({"root": root_id, "nodes": nodes, "edges": unique_edges, "count": len(nodes)})
 
 
 def _euclidean_distance(a: dict, b: dict) -> float:
@@ -980,7 +1199,7 @@ async def query_todos_near(todo_id: Optional[str] = None, district: Optional[str
         anchor_district = district
 
         if todo_id:
-            anchor = todos_col.find_one({"id": todo_id}, {"metadata": 1})
+            anchor = await asyncio.to_thread(todos_col.find_one, {"id": todo_id}, {"metadata": 1})
             if not anchor:
                 return create_response(False, message=f"Todo {todo_id} not found.")
             meta = anchor.get("metadata") or {}
@@ -998,10 +1217,11 @@ async def query_todos_near(todo_id: Optional[str] = None, district: Optional[str
             # Project the vector out at the DB read — compact_todo discards it
             # anyway, so without this every district hit shipped a 768-float
             # embedding across the wire to be thrown away.
-            for doc in todos_col.find(
+            district_cursor = todos_col.find(
                 {"metadata.district": anchor_district, "status": {"$ne": "completed"}},
                 _NO_VECTOR,
-            ).limit(limit):
+            ).limit(limit)
+            for doc in await asyncio.to_thread(list, district_cursor):
                 doc_id = doc.get("id")
                 if doc_id and doc_id != todo_id:
                     results[doc_id] = doc
@@ -1012,7 +1232,7 @@ async def query_todos_near(todo_id: Optional[str] = None, district: Optional[str
                 {"metadata.coordinates": {"$exists": True}, "status": {"$ne": "completed"}},
                 {"id": 1, "description": 1, "project": 1, "status": 1, "priority": 1, "metadata": 1}
             ).limit(limit * 5)
-            for doc in candidate_cursor:
+            for doc in await asyncio.to_thread(list, candidate_cursor):
                 doc_id = doc.get("id")
                 if not doc_id or doc_id == todo_id or doc_id in results:
                     continue
@@ -1023,13 +1243,13 @@ async def query_todos_near(todo_id: Optional[str] = None, district: Optional[str
                         break
 
         compacted = compact_todo_list(list(results.values())[:limit], brief=True)
-        return json.dumps({
+        return dumps({
             "items": compacted,
             "count": len(compacted),
             "anchor_district": anchor_district,
             "anchor_coords": anchor_coords,
             "radius": radius
-        }, cls=MongoJSONEncoder)
+        })
     except Exception as e:
         logger.error(f"query_todos_near failed: {e}")
         return create_response(False, message=str(e))
@@ -1053,6 +1273,49 @@ async def link_todos(blocker_id: str, blocked_id: str, ctx: Optional[Context] =
     )
 
 
+# --- Point-read cache for get_todo / get_lesson ---
+# Maps (kind, id) -> {scope: (response_json, expiry)}. MCP clients re-read the
+# same todo within seconds while polling. Writes made in this process
+# invalidate by id; the short TTL bounds staleness from writes made elsewhere
+# (the API server, Inventorium).
+_point_read_cache: dict[tuple[str, str], dict[str, tuple[str, float]]] = {}
+_POINT_READ_TTL = 5
+_POINT_READ_MAX = 1024
+
+
+def _read_scope(ctx: Optional[Context]) -> str:
+    """Cache scope: the caller's identity, since it picks the database."""
+    return (ctx.user.get('sub') or "") if ctx and ctx.user else ""
+
+
+def _get_cached_read(kind: str, doc_id: str, scope: str) -> Optional[str]:
+    """Return a cached get_* response if present and not expired, else None."""
+    entry = _point_read_cache.get((kind, doc_id), {}).get(scope)
+    if entry is None:
+        return None
+    payload, expiry = entry
+    if time.monotonic() > expiry:
+        _point_read_cache[(kind, doc_id)].pop(scope, None)
+        return None
+    return payload
+
+
+def _set_cached_read(kind: str, doc_id: str, scope: str, payload: str) -> None:
+    """Cache a get_* response, evicting the oldest id once the cache is full."""
+    key = (kind, doc_id)
+    if key not in _point_read_cache and len(_point_read_cache) >= _POINT_READ_MAX:
+        _point_read_cache.pop(next(iter(_point_read_cache)))
+    _point_read_cache.setdefault(key, {})[scope] = (payload, time.monotonic() + _POINT_READ_TTL)
+
+
+def invalidate_point_read_cache(kind: Optional[str] = None, doc_id: Optional[str] = None) -> None:
+    """Drop one id's cached reads (every scope), or flush the whole cache."""
+    if kind and doc_id:
+        _point_read_cache.pop((kind, doc_id), None)
+    else:
+        _point_read_cache.clear()
+
+
 def _resolve_todo_id(todo_id: str, user_context, db_conn) -> Optional[str]:
     """
     Pass the todo ID through as-is. Full UUIDs only.
@@ -1064,6 +1327,71 @@ def _resolve_todo_id(todo_id: str, user_context, db_conn) -> Optional[str]:
     return str(todo_id) if todo_id is not None else None
 
 
+def _merge_metadata_update(existing_todo: dict, updates: dict, todo_id: str) -> None:
+    """Merge updates["metadata"] into the todo's existing metadata and validate it, in place."""
+    if updates.get("metadata") is None:
+        return
+    existing_metadata = existing_todo.get("metadata", {})
+    merged_metadata = deep_merge_metadata(existing_metadata, updates["metadata"])
+
+    # Validate the merged metadata
+    try:
+        validated_metadata_obj = validate_todo_metadata(merged_metadata)
+        updates["metadata"] = validated_metadata_obj.model_dump(exclude_none=True)
+        logger.info(f"Metadata merged and validated for todo {todo_id}: {len(existing_metadata)} existing fields + {len(updates['metadata'])} updates")
+    except Exception as e:
+        logger.warning(f"Metadata validation failed for merged metadata in todo {todo_id}: {str(e)}")
+        # For backward compatibility, keep merged metadata with validation warning
+        if isinstance(merged_metadata, dict):
+            merged_metadata["_validation_warning"] = f"Schema validation failed: {str(e)}"
+        updates["metadata"] = merged_metadata
+
+
+def _canonical_json(value: Any) -> bytes:
+    """Key-order-independent encoding, for comparing nested values."""
+    return orjson.dumps(value, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+
+def _todo_changes(existing_todo: dict, updates: dict) -> list:
+    """Audit-log change list, filtering out identical values (prevents duplicate logging from fallback retries)."""
+    changes = []
+    for field, value in updates.items():
+        if field in ('updated_at', 'updated_by'):
+            continue
+
+        old_value = existing_todo.get(field)
+
+        # Skip if values are identical (handles JSON serialization comparison)
+        if old_value == value:
+            continue
+
+        # For nested objects (like metadata), compare JSON representations
+        if isinstance(old_value, dict) and isinstance(value, dict):
+            if _canonical_json(old_value) == _canonical_json(value):
+                logger.debug(f"Skipping metadata log - old and new values are identical for field '{field}'")
+                continue
+
+        changes.append({"field": field, "old_value": old_value, "new_value": value})
+    return changes
+
+
+# Fields that feed a todo's embedding text; changing any of them re-embeds it.
+_EMBEDDING_FIELDS = frozenset({"description", "notes", "project"})
+
+
+async def _refresh_todo_embedding(todos_collection, todo_id: str) -> None:
+    """Re-embed a todo from its stored text. Failures are swallowed — embeddings are best-effort."""
+    try:
+        updated_todo = await asyncio.to_thread(todos_collection.find_one, {"id": todo_id})
+        if updated_todo:
+            embed_text = embeddings.embedding_text_for_todo(updated_todo)
+            embedding = await embeddings.generate_embedding(embed_text)
+            if embedding:
+                await asyncio.to_thread(todos_collection.update_one, {"id": todo_id}, {"$set": {"embedding": embedding}})
+    except Exception:
+        pass
+
+
 async def update_todo(todo_id: str, updates: dict, ctx: Optional[Context] = None) -> str:
     """
     Update a todo with the provided changes. Metadata updates are MERGED with existing metadata.
@@ -1091,7 +1419,7 @@ async def update_todo(todo_id: str, updates: dict, ctx: Optional[Context] = None
 
     # Check for read-only mode (unauthenticated demo users)
     if _is_read_only_user(ctx):
-        return create_response(False, message="Demo mode: Todo updates are disabled. Please authenticate to modify todos.")
+        return _DEMO_UPDATE_REFUSED
 
     # Completion must go through complete_todo — not update_todo
     if updates.get("status", "").lower() == "completed":
@@ -1110,7 +1438,7 @@ async def update_todo(todo_id: str, updates: dict, ctx: Optional[Context] = None
         )
 
     if "updated_at" not in updates:
-        updates["updated_at"] = int(datetime.now(timezone.utc).timestamp())
+        updates["updated_at"] = int(time.time())
     if "updated_by" not in updates:
         updates["updated_by"] = ctx.user.get("email", "anonymous") if ctx and ctx.user else "anonymous"
 
@@ -1133,7 +1461,7 @@ async def update_todo(todo_id: str, updates: dict, ctx: Optional[Context] = None
             user_db_name = user_collections['database'].name
             searched_databases.append(f"user database '{user_db_name}'")
 
-            existing_todo = user_todos_collection.find_one({"id": todo_id})
+            existing_todo = await asyncio.to_thread(user_todos_collection.find_one, {"id": todo_id})
             if existing_todo:
                 todos_collection = user_todos_collection
                 database_source = "user"
@@ -1145,7 +1473,7 @@ async def update_todo(todo_id: str, updates: dict, ctx: Optional[Context] = None
             shared_db_name = shared_collections['database'].name
             searched_databases.append(f"shared database '{shared_db_name}'")
 
-            existing_todo = shared_todos_collection.find_one({"id": todo_id})
+            existing_todo = await asyncio.to_thread(shared_todos_collection.find_one, {"id": todo_id})
             if existing_todo:
                 todos_collection = shared_todos_collection
                 database_source = "shared"
@@ -1156,86 +1484,136 @@ async def update_todo(todo_id: str, updates: dict, ctx: Optional[Context] = None
             return create_response(False, message=f"Todo {todo_id} not found. Searched in: {searched_locations}")
 
         # 🔧 MERGE metadata with existing instead of replacing
-        if "metadata" in updates and updates["metadata"] is not None:
-            existing_metadata = existing_todo.get("metadata", {})
-            merged_metadata = deep_merge_metadata(existing_metadata, updates["metadata"])
-
-            # Validate the merged metadata
-            try:
-                validated_metadata_obj = validate_todo_metadata(merged_metadata)
-                updates["metadata"] = validated_metadata_obj.model_dump(exclude_none=True)
-                logger.info(f"Metadata merged and validated for todo {todo_id}: {len(existing_metadata)} existing fields + {len(updates['metadata'])} updates")
-            except Exception as e:
-                logger.warning(f"Metadata validation failed for merged metadata in todo {todo_id}: {str(e)}")
-                # For backward compatibility, keep merged metadata with validation warning
-                if isinstance(merged_metadata, dict):
-                    merged_metadata["_validation_warning"] = f"Schema validation failed: {str(e)}"
-                updates["metadata"] = merged_metadata
+        _merge_metadata_update(existing_todo, updates, todo_id)
 
         # Update the todo in the database where it was found
-        result = todos_collection.update_one({"id": todo_id}, {"$set": updates})
+        result = await asyncio.to_thread(todos_collection.update_one, {"id": todo_id}, {"$set": updates})
+        invalidate_point_read_cache("todo", todo_id)
         if result.modified_count == 1:
             user_email = ctx.user.get("email", "anonymous") if ctx and ctx.user else "anonymous"
             logger.info(f"Todo updated by {user_email}: {todo_id} in {database_source} database")
             description = updates.get('description', existing_todo.get('description', 'Unknown'))
             project = updates.get('project', existing_todo.get('project', 'Unknown'))
 
-            # Build changes list, filtering out identical values (prevents duplicate logging from fallback retries)
-            changes = []
-            for field, value in updates.items():
-                if field in ('updated_at', 'updated_by'):
-                    continue
-
-                old_value = existing_todo.get(field)
-
-                # Skip if values are identical (handles JSON serialization comparison)
-                if old_value == value:
-                    continue
-
-                # For nested objects (like metadata), compare JSON representations
-                if isinstance(old_value, dict) and isinstance(value, dict):
-                    import json as json_lib
-                    if json_lib.dumps(old_value, sort_keys=True) == json_lib.dumps(value, sort_keys=True):
-                        logger.debug(f"Skipping metadata log - old and new values are identical for field '{field}'")
-                        continue
-
-                changes.append({"field": field, "old_value": old_value, "new_value": value})
+            changes = _todo_changes(existing_todo, updates)
 
             # Only log if there are actual changes
             if changes:
-                await log_todo_update(todo_id, description, project, changes, user_email, ctx.user if ctx else None)
+                _track_background("log_todo_update", log_todo_update(todo_id, description, project, changes,
+                                                                     user_email, ctx.user if ctx else None), todo_id)
             else:
                 logger.debug(f"No actual changes detected for todo {todo_id}, skipping log entry")
 
             # Regenerate embedding in background — don't block the response
-            embedding_fields = {"description", "notes", "project"}
-            if embedding_fields & set(updates.keys()):
-                async def _bg_regen_embedding(tid=todo_id, coll=todos_collection):
-                    try:
-                        updated_todo = coll.find_one({"id": tid})
-                        if updated_todo:
-                            embed_text = embeddings.embedding_text_for_todo(updated_todo)
-                            embedding = await embeddings.generate_embedding(embed_text)
-                            if embedding:
-                                coll.update_one({"id": tid}, {"$set": {"embedding": embedding}})
-                    except Exception:
-                        pass
-                asyncio.create_task(_bg_regen_embedding())
-
-            return json.dumps({"id": todo_id})
+            if _EMBEDDING_FIELDS & updates.keys():
+                _track_background("embedding_update", _refresh_todo_embedding(todos_collection, todo_id), todo_id)
+
+            return dumps({"id": todo_id})
         else:
             return create_response(False, message=f"Todo {todo_id} found but no changes made.")
     except Exception as e:
         logger.error(f"Failed to update todo: {str(e)}")
         return create_response(False, message=str(e))
 
+async def update_todos(items: List[Dict[str, Any]], ctx: Optional[Context] = None) -> str:
+    """
+    Update several todos with one bulk_write round trip.
+
+    Each item is {"todo_id": "...", "updates": {...}} and follows update_todo's
+    rules: metadata is merged, not replaced, and status "completed" is refused
+    (use complete_todo). Only the caller's own database is searched. Writes
+    are unordered, so one failure doesn't stop the rest. Returns the updated
+    ids plus any per-item errors by index.
+    """
+    if _is_read_only_user(ctx):
+        return _DEMO_UPDATE_REFUSED
+    if not isinstance(items, list) or not items:
+        return create_response(False, message="items must be a non-empty list of {todo_id, updates} objects.")
+
+    now = int(time.time())
+    user_email = ctx.user.get("email", "anonymous") if ctx and ctx.user else "anonymous"
+    planned, errors, seen = [], [], set()
+    for index, item in enumerate(items):
+        todo_id = item.get("todo_id") if isinstance(item, dict) else None
+        if not todo_id:
+            errors.append({"index": index, "error": "todo_id is required"})
+            continue
+        updates, err = _normalize_updates(item.get("updates"))
+        if err:
+            errors.append({"index": index, "error": err})
+        elif str(updates.get("status", "")).lower() == "completed":
+            errors.append({"index": index, "error": "Use complete_todo to complete a todo — not update_todos."})
+        elif todo_id in seen:
+            errors.append({"index": index, "error": f"Todo {todo_id} appears more than once in this batch."})
+        else:
+            seen.add(todo_id)
+            updates.setdefault("updated_at", now)
+            updates.setdefault("updated_by", user_email)
+            planned.append((index, todo_id, updates))
+
+    try:
+        collections = db_connection.get_collections(ctx.user if ctx else None)
+        todos_collection = collections['todos']
+
+        ids = [todo_id for _, todo_id, _ in planned]
+        cursor = todos_collection.find({"id": {"$in": ids}}, _NO_VECTOR) if ids else []
+        existing = await asyncio.to_thread(_index_by_id, cursor)
+
+        ops, writes = [], []
+        for index, todo_id, updates in planned:
+            existing_todo = existing.get(todo_id)
+            if existing_todo is None:
+                errors.append({"index": index, "error": f"Todo {todo_id} not found."})
+                continue
+            _merge_metadata_update(existing_todo, updates, todo_id)
+            ops.append(UpdateOne({"id": todo_id}, {"$set": updates}))
+            writes.append((todo_id, updates, existing_todo))
+
+        if not ops:
+            return create_response(False, {"errors": errors}, message="No todos to update.")
+
+        failed = set()
+        try:
+            await asyncio.to_thread(todos_collection.bulk_write, ops, ordered=False)
+        except BulkWriteError as bwe:
+            failed = {err["index"] for err in bwe.details.get("writeErrors", [])}
+            errors.extend({"id": writes[i][0], "error": "update failed"} for i in sorted(failed))
+
+        updated, log_actions = [], []
+        for i, (todo_id, updates, existing_todo) in enumerate(writes):
+            invalidate_point_read_cache("todo", todo_id)
+            if i in failed:
+                continue
+            updated.append(todo_id)
+            changes = _todo_changes(existing_todo, updates)
+            if changes:
+                log_actions.append({
+                    "operation": "update", "todo_id": todo_id, "changes": changes, "user_agent": user_email,
+                    "description": updates.get('description', existing_todo.get('description', 'Unknown')),
+                    "project": updates.get('project', existing_todo.get('project', 'Unknown')),
+                })
+            if _EMBEDDING_FIELDS & updates.keys():
+                _track_background("embedding_update", _refresh_todo_embedding(todos_collection, todo_id), todo_id)
+
+        if log_actions:
+            _track_background("log_todo_update", log_todo_batch(log_actions, ctx.user if ctx else None),
+                              f"{len(log_actions)} todos")
+        logger.info(f"{len(updated)} todos updated by {user_email} in one batch")
+        resp = {"ids": updated, "count": len(updated)}
+        if errors:
+            resp["errors"] = errors
+        return dumps(resp)
+    except Exception as e:
+        logger.error(f"Failed to update todos: {str(e)}")
+        return create_response(False, message=str(e))
+
 async def delete_todo(todo_id: str, ctx: Optional[Context] = None) -> str:
     """
     Delete a todo item by its ID.
     """
     # Check for read-only mode (unauthenticated demo users)
     if _is_read_only_user(ctx):
-        return create_response(False, message="Demo mode: Todo deletion is disabled. Please authenticate to delete todos.")
+        return _DEMO_DELETE_REFUSED
 
     try:
         user_context = ctx.user if ctx else None
@@ -1248,25 +1626,32 @@ async def delete_todo(todo_id: str, ctx: Optional[Context] = None) -> str:
         collections = db_connection.get_collections(user_context)
         todos_collection = collections['todos']
 
-        existing_todo = todos_collection.find_one({"id": todo_id})
+        # Read and remove in one atomic round trip; of two concurrent deletes
+        # only one gets the document back, so only one tombstone is written.
+        existing_todo = await asyncio.to_thread(todos_collection.find_one_and_delete, {"id": todo_id})
         if not existing_todo:
             return create_response(False, message=f"Todo {todo_id} not found.")
+        invalidate_point_read_cache("todo", todo_id)
 
         user_email = ctx.user.get("email", "anonymous") if ctx and ctx.user else "anonymous"
-        logger.info(f"Todo soft-deleted by {user_email}: {todo_id}")
-        await log_todo_delete(todo_id, existing_todo.get('description', 'Unknown'),
-                              existing_todo.get('project', 'Unknown'), user_email, ctx.user if ctx else None)
 
         # Soft delete: move to deleted_todos collection
         deleted_todos_collection = collections['deleted_todos']
         tombstone = {k: v for k, v in existing_todo.items() if k != '_id'}
         tombstone['deleted_at'] = datetime.now(timezone.utc).isoformat()
         tombstone['deleted_by'] = user_email
-        deleted_todos_collection.insert_one(tombstone)
+        try:
+            await asyncio.to_thread(deleted_todos_collection.insert_one, tombstone)
+        except Exception:
+            # No tombstone means no way back: put the todo where it was
+            await asyncio.to_thread(todos_collection.insert_one, existing_todo)
+            raise
 
-        # Remove from active todos
-        todos_collection.delete_one({"id": todo_id})
-        return json.dumps({"id": todo_id})
+        logger.info(f"Todo soft-deleted by {user_email}: {todo_id}")
+        _track_background("log_todo_delete", log_todo_delete(todo_id, existing_todo.get('description', 'Unknown'),
+                                                             existing_todo.get('project', 'Unknown'), user_email,
+                                                             ctx.user if ctx else None), todo_id)
+        return dumps({"id": todo_id})
     except Exception as e:
         logger.error(f"Failed to delete todo: {str(e)}")
         return create_response(False, message=str(e))
@@ -1283,6 +1668,10 @@ async def get_todo(todo_id: str, ctx: Optional[Context] = None) -> str:
             searched_locations = f"user database and shared database"
             return create_response(False, message=f"Todo with ID {todo_id} not found. Searched in: {searched_locations}")
         todo_id = resolved
+        scope = _read_scope(ctx)
+        cached = _get_cached_read("todo", todo_id, scope)
+        if cached is not None:
+            return cached
         searched_databases = []
 
         # First, try user-specific database
@@ -1292,11 +1681,13 @@ async def get_todo(todo_id: str, ctx: Optional[Context] = None) -> str:
             user_db_name = user_collections['database'].name
             searched_databases.append(f"user database '{user_db_name}'")
 
-            todo = user_todos_collection.find_one({"id": todo_id})
+            todo = await asyncio.to_thread(user_todos_collection.find_one, {"id": todo_id})
             if todo:
                 compacted = compact_todo(todo, iso_dates=True)
                 compacted['source'] = 'user'
-                return json.dumps(compacted)
+                payload = dumps(compacted)
+                _set_cached_read("todo", todo_id, scope, payload)
+                return payload
 
         # If not found in user database (or no user database), try shared database
         shared_collections = db_connection.get_collections(None)  # None = shared database
@@ -1304,11 +1695,13 @@ async def get_todo(todo_id: str, ctx: Optional[Context] = None) -> str:
         shared_db_name = shared_collections['database'].name
         searched_databases.append(f"shared database '{shared_db_name}'")
 
-        todo = shared_todos_collection.find_one({"id": todo_id})
+        todo = await asyncio.to_thread(shared_todos_collection.find_one, {"id": todo_id})
         if todo:
             compacted = compact_todo(todo, iso_dates=True)
             compacted['source'] = 'shared'
-            return json.dumps(compacted)
+            payload = dumps(compacted)
+            _set_cached_read("todo", todo_id, scope, payload)
+            return payload
 
         # Not found in any database
         searched_locations = " and ".join(searched_databases)
@@ -1318,6 +1711,10 @@ async def get_todo(todo_id: str, ctx: Optional[Context] = None) -> str:
         logger.error(f"Failed to get todo: {str(e)}")
         return create_response(False, message=str(e))
 
+# complete_todo reads only what it needs for duration, file detection and the audit log
+_COMPLETE_READ_FIELDS = {"_id": 0, "status": 1, "created_at": 1, "description": 1, "project": 1, "metadata.files": 1}
+
+
 async def complete_todo(todo_id: str, comment: Optional[str] = None, files: Optional[List[str]] = None, ctx: Optional[Context] = None) -> str:
     """
     Mark a todo as completed. Records git context, calculates duration, and writes an audit log entry.
@@ -1335,7 +1732,7 @@ async def complete_todo(todo_id: str, comment: Optional[str] = None, files: Opti
     """
     # Check for read-only mode (unauthenticated demo users)
     if _is_read_only_user(ctx):
-        return create_response(False, message="Demo mode: Todo completion is disabled. Please authenticate to modify todos.")
+        return _DEMO_COMPLETE_REFUSED
 
     try:
         user_context = ctx.user if ctx else None
@@ -1355,7 +1752,7 @@ async def complete_todo(todo_id: str, comment: Optional[str] = None, files: Opti
             user_db_name = user_collections['database'].name
             searched_databases.append(f"user database '{user_db_name}'")
 
-            existing_todo = user_todos_collection.find_one({"id": todo_id})
+            existing_todo = await asyncio.to_thread(user_todos_collection.find_one, {"id": todo_id}, _COMPLETE_READ_FIELDS)
             if existing_todo:
                 todos_collection = user_todos_collection
                 database_source = "user"
@@ -1367,7 +1764,7 @@ async def complete_todo(todo_id: str, comment: Optional[str] = None, files: Opti
             shared_db_name = shared_collections['database'].name
             searched_databases.append(f"shared database '{shared_db_name}'")
 
-            existing_todo = shared_todos_collection.find_one({"id": todo_id})
+            existing_todo = await asyncio.to_thread(shared_todos_collection.find_one, {"id": todo_id}, _COMPLETE_READ_FIELDS)
             if existing_todo:
                 todos_collection = shared_todos_collection
                 database_source = "shared"
@@ -1377,7 +1774,12 @@ async def complete_todo(todo_id: str, comment: Optional[str] = None, files: Opti
             searched_locations = " and ".join(searched_databases)
             return create_response(False, message=f"Todo {todo_id} not found. Searched in: {searched_locations}")
 
-        completed_at = int(datetime.now(timezone.utc).timestamp())
+        # Checked before the git subprocesses below; re-completing an approved
+        # todo would also push it back to review.
+        if existing_todo.get("status") == "completed":
+            return create_response(False, message=f"Todo {todo_id} is already completed.")
+
+        completed_at = int(time.time())
         duration_sec = completed_at - existing_todo.get('created_at', completed_at)
         updates = {
             "status": "review",
@@ -1396,25 +1798,29 @@ async def complete_todo(todo_id: str, comment: Optional[str] = None, files: Opti
             # Auto-detect changed files from git when caller didn't provide them
             # and the todo has no files yet. Only fires in local/stdio mode where
             # the server runs in the user's working tree.
-            auto_files = get_changed_files()
+            auto_files = await asyncio.to_thread(get_changed_files)
             if auto_files:
                 updates["metadata.files"] = auto_files
 
         # Add git context on completion (branch and commit hash at completion time)
-        git_metadata = enrich_metadata_with_git()
+        git_metadata = await asyncio.to_thread(get_git_metadata)
         if "branch" in git_metadata:
             updates["metadata.completion_branch"] = git_metadata["branch"]
         if "commit_hash" in git_metadata:
             updates["metadata.completion_commit_hash"] = git_metadata["commit_hash"]
 
         # Complete the todo in the database where it was found
-        result = todos_collection.update_one({"id": todo_id}, {"$set": updates})
+        # The status guard makes a completion that raced this one a no-op write
+        result = await asyncio.to_thread(
+            todos_collection.update_one, {"id": todo_id, "status": {"$ne": "completed"}}, {"$set": updates})
+        invalidate_point_read_cache("todo", todo_id)
         if result.modified_count == 1:
             user_email = ctx.user.get("email", "anonymous") if ctx and ctx.user else "anonymous"
             logger.info(f"Todo staged for review by {user_email}: {todo_id} in {database_source} database")
-            await log_todo_complete(todo_id, existing_todo.get('description', 'Unknown'),
-                                    existing_todo.get('project', 'Unknown'), user_email, ctx.user if ctx else None, comment)
-            return json.dumps({"id": todo_id})
+            _track_background("log_todo_complete", log_todo_complete(todo_id, existing_todo.get('description', 'Unknown'),
+                                                                     existing_todo.get('project', 'Unknown'), user_email,
+                                                                     ctx.user if ctx else None, comment), todo_id)
+            return dumps({"id": todo_id})
         else:
             return create_response(False, message=f"Todo {todo_id} found but failed to mark as complete.")
     except Exception as e:
@@ -1422,64 +1828,123 @@ async def complete_todo(todo_id: str, comment: Optional[str] = None, files: Opti
         return create_response(False, message=str(e))
 
 
-async def list_todos_by_status(status: str, limit: int = 100, offset: int = 0, brief: bool = True, ctx: Optional[Context] = None) -> str:
+async def list_todos_by_status(status: str, limit: int = 100, offset: int = 0, brief: bool = True, projection: Optional[Dict[str, Any]] = None, ctx: Optional[Context] = None) -> str:
     """
     List todos filtered by their status with pagination support.
     Defaults to brief=True for token efficiency — pass brief=false for full notes/metadata.
+    projection overrides the default slim read (see query_todos).
     """
-    if status.lower() not in ['pending', 'completed', 'initial', 'blocked', 'in_progress', 'review']:
+    status_filter = _STATUS_FILTERS.get(status.lower())
+    if status_filter is None:
         return create_response(False, message="Invalid status. Must be one of 'pending', 'completed', 'initial', 'blocked', 'in_progress', 'review'.")
     # When querying by status, don't apply the default completed filter
-    return await query_todos(filter={"status": status.lower()}, limit=limit, offset=offset, exclude_completed=False, brief=brief, ctx=ctx)
+    return await query_todos(filter=status_filter, projection=projection, limit=limit, offset=offset, exclude_completed=False, brief=brief, ctx=ctx)
 
 async def add_lesson(language: str, topic: str, lesson_learned: str, tags: Optional[list] = None, ctx: Optional[Context] = None) -> str:
     """
     Add a new lesson to the knowledge base.
     """
     lesson = {
-        "id": str(uuid.uuid4()),
+        "id": _new_id(),
         "language": language,
         "topic": topic,
         "lesson_learned": lesson_learned,
         "tags": tags or [],
-        "created_at": int(datetime.now(timezone.utc).timestamp())
+        "created_at": int(time.time())
     }
     try:
         # Get user-scoped collections
         collections = db_connection.get_collections(ctx.user if ctx else None)
         lessons_collection = collections['lessons']
 
-        lessons_collection.insert_one(lesson)
+        await asyncio.to_thread(lessons_collection.insert_one, lesson)
         if tags:
             # Invalidate the tags cache when new tags are added
-            invalidate_lesson_tags_cache(ctx)
+            await asyncio.to_thread(invalidate_lesson_tags_cache, ctx)
 
         # Generate embedding (non-blocking — failure never blocks lesson creation)
         try:
             embed_text = embeddings.embedding_text_for_lesson(lesson)
             embedding = await embeddings.generate_embedding(embed_text)
             if embedding:
-                lessons_collection.update_one({"id": lesson["id"]}, {"$set": {"embedding": embedding}})
+                await asyncio.to_thread(lessons_collection.update_one, {"id": lesson["id"]}, {"$set": {"embedding": embedding}})
         except Exception:
             pass
 
-        return json.dumps({"id": lesson["id"]})
+        return dumps({"id": lesson["id"]})
     except Exception as e:
         logger.error(f"Failed to add lesson: {str(e)}")
         return create_response(False, message=str(e))
 
+async def add_lessons(items: List[Dict[str, Any]], ctx: Optional[Context] = None) -> str:
+    """
+    Add several lessons in one insert_many round trip.
+
+    Each item takes add_lesson's fields (language, topic, lesson_learned,
+    optional tags). Embeddings are generated after the insert, in the
+    background, so the batch returns as soon as the write is acknowledged.
+    """
+    if not isinstance(items, list) or not items:
+        return create_response(False, message="items must be a non-empty list of lesson objects.")
+
+    now = int(time.time())
+    lessons, errors = [], []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not all(item.get(k) for k in ("language", "topic", "lesson_learned")):
+            errors.append({"index": index, "error": "language, topic and lesson_learned are required"})
+            continue
+        lessons.append({
+            "id": _new_id(),
+            "language": item["language"],
+            "topic": item["topic"],
+            "lesson_learned": item["lesson_learned"],
+            "tags": item.get("tags") or [],
+            "created_at": now
+        })
+
+    if not lessons:
+        return create_response(False, {"errors": errors}, message="No valid lessons to add.")
+
+    try:
+        collections = db_connection.get_collections(ctx.user if ctx else None)
+        lessons_collection = collections['lessons']
+
+        inserted, failed = await _insert_unordered(lessons_collection, lessons)
+        errors.extend({"id": l["id"], "error": "insert failed"} for l in failed)
+
+        if any(l["tags"] for l in inserted):
+            await asyncio.to_thread(invalidate_lesson_tags_cache, ctx)
+
+        if inserted:
+            _track_background("embedding_update", _store_embeddings(lessons_collection, inserted, embeddings.embedding_text_for_lesson), f"{len(inserted)} lessons")
+
+        resp = {"ids": [l["id"] for l in inserted], "count": len(inserted)}
+        if errors:
+            resp["errors"] = errors
+        return dumps(resp)
+    except Exception as e:
+        logger.error(f"Failed to add lessons: {str(e)}")
+        return create_response(False, message=str(e))
+
 async def get_lesson(lesson_id: str, ctx: Optional[Context] = None) -> str:
     """
     Get a specific lesson by its ID.
     """
     try:
+        scope = _read_scope(ctx)
+        cached = _get_cached_read("lesson", lesson_id, scope)
+        if cached is not None:
+            return cached
+
         # Get user-scoped collections
         collections = db_connection.get_collections(ctx.user if ctx else None)
         lessons_collection = collections['lessons']
 
-        lesson = lessons_collection.find_one({"id": lesson_id}, _LESSON_NO_VECTOR)
+        lesson = await asyncio.to_thread(lessons_collection.find_one, {"id": lesson_id}, _LESSON_NO_VECTOR)
         if lesson:
-            return json.dumps(compact_lesson(lesson, iso_dates=True))
+            payload = dumps(compact_lesson(lesson, iso_dates=True))
+            _set_cached_read("lesson", lesson_id, scope, payload)
+            return payload
         else:
             return create_response(False, message=f"Lesson with ID {lesson_id} not found.")
     except Exception as e:
@@ -1499,12 +1964,13 @@ async def update_lesson(lesson_id: str, updates: dict, ctx: Optional[Context] =
         collections = db_connection.get_collections(ctx.user if ctx else None)
         lessons_collection = collections['lessons']
 
-        result = lessons_collection.update_one({"id": lesson_id}, {"$set": updates})
+        result = await asyncio.to_thread(lessons_collection.update_one, {"id": lesson_id}, {"$set": updates})
+        invalidate_point_read_cache("lesson", lesson_id)
         if result.modified_count == 1:
             if 'tags' in updates:
                 # Invalidate the tags cache when tags are modified
-                invalidate_lesson_tags_cache(ctx)
-            return json.dumps({"id": lesson_id})
+                await asyncio.to_thread(invalidate_lesson_tags_cache, ctx)
+            return dumps({"id": lesson_id})
         else:
             return create_response(False, message=f"Lesson {lesson_id} not found.")
     except Exception as e:
@@ -1529,7 +1995,7 @@ async def regenerate_embedding(lesson_id: str, ctx: Optional[Context] = None) ->
         collections = db_connection.get_collections(ctx.user if ctx else None)
         lessons_collection = collections['lessons']
 
-        lesson = lessons_collection.find_one({"id": lesson_id})
+        lesson = await asyncio.to_thread(lessons_collection.find_one, {"id": lesson_id}, _NO_VECTOR)
         if not lesson:
             return create_response(False, message=f"Lesson {lesson_id} not found")
 
@@ -1538,12 +2004,13 @@ async def regenerate_embedding(lesson_id: str, ctx: Optional[Context] = None) ->
         if not new_embedding:
             return create_response(False, message="Embedding generation returned empty result")
 
-        now = int(datetime.now(timezone.utc).timestamp())
-        lessons_collection.update_one(
+        now = int(time.time())
+        await asyncio.to_thread(
+            lessons_collection.update_one,
             {"id": lesson_id},
             {"$set": {"embedding": new_embedding, "embedding_updated_at": now}}
         )
-        return json.dumps({"id": lesson_id, "embedding_updated_at": now, "embedded": True})
+        return dumps({"id": lesson_id, "embedding_updated_at": now, "embedded": True})
     except Exception as e:
         logger.error(f"Failed to regenerate embedding for {lesson_id}: {e}")
         return create_response(False, message=str(e))
@@ -1558,30 +2025,34 @@ async def delete_lesson(lesson_id: str, ctx: Optional[Context] = None) -> str:
         collections = db_connection.get_collections(ctx.user if ctx else None)
         lessons_collection = collections['lessons']
 
-        result = lessons_collection.delete_one({"id": lesson_id})
+        result = await asyncio.to_thread(lessons_collection.delete_one, {"id": lesson_id})
+        invalidate_point_read_cache("lesson", lesson_id)
         if result.deleted_count == 1:
             # Invalidate the tags cache when lessons are deleted
-            invalidate_lesson_tags_cache(ctx)
-            return json.dumps({"id": lesson_id})
+            await asyncio.to_thread(invalidate_lesson_tags_cache, ctx)
+            return dumps({"id": lesson_id})
         else:
             return create_response(False, message=f"Lesson {lesson_id} not found.")
     except Exception as e:
         logger.error(f"Failed to delete lesson: {str(e)}")
         return create_response(False, message=str(e))
 
-async def search_todos(query: str, fields: Optional[list] = None, limit: int = 20, brief: Optional[bool] = None, ctx: Optional[Context] = None) -> str:
+async def search_todos(query: str, fields: Optional[list] = None, limit: int = 20, brief: Optional[bool] = None, projection: Optional[Dict[str, Any]] = None, ctx: Optional[Context] = None) -> str:
     """
     Search todos with two-pass fuzzy matching.
 
     Pass 1 (strict): all meaningful tokens must appear (AND). Fast, precise.
     Pass 2 (fuzzy):  any token matches (OR), results ranked by how many tokens
                      appear in description+project. Fires only when pass 1 returns
-                     nothing — avoids flooding precise queries with noise.
+                     nothing — avoids flooding precise queries with noise. The
+                     text index answers first; a bounded regex pass tops it up
+                     with partial-word hits when it returns fewer than limit.
 
     brief=None (default) auto-sizes the response: multi-hit sets with fat notes
     come back brief, a single hit keeps its notes (truncated if oversized). Pass
     brief=True/False to force. Response carries search_mode ('strict'|'fuzzy_or')
-    and diet ('full'|'brief'|'truncated').
+    and diet ('full'|'brief'|'truncated'). projection overrides the default
+    slim read (see query_todos).
     """
     if fields is None:
         fields = ["description", "project"]
@@ -1598,38 +2069,50 @@ async def search_todos(query: str, fields: Optional[list] = None, limit: int = 2
         else:
             data['diet'] = 'brief' if fetch_brief else 'full'
         data['search_mode'] = mode
-        return json.dumps(data, cls=MongoJSONEncoder)
+        return dumps(data)
 
-    # Pass 1 — strict AND
-    strict_query = _build_tokenized_search_query(query, fields)
-    result = await query_todos(filter=strict_query, limit=limit, brief=fetch_brief, ctx=ctx)
+    def _page(query_filter: dict, page_limit: int):
+        return _query_todos_page(query_filter, projection, page_limit, 0, True, None, fetch_brief, ctx)
 
     try:
-        data = json.loads(result)
-        if data.get('items'):
+        # Pass 1 — strict AND
+        strict_query = _build_tokenized_search_query(query, fields)
+        data = await _page(strict_query, limit)
+        if data['items']:
             return _finish(data, 'strict')
-    except Exception:
-        return result
-
-    # Extract meaningful tokens for OR pass (keep digits even if short: "4", "2", etc.)
-    tokens = meaningful_tokens(query)
-    if not tokens:
-        return result
-
-    # Pass 2 — OR fallback, ranked by token match density
-    escaped = [re.escape(t) for t in tokens]
-    or_query = {"$or": [
-        {field: {"$regex": tok, "$options": "i"}}
-        for tok in escaped for field in fields
-    ]}
 
-    fallback = await query_todos(filter=or_query, limit=min(limit * 4, 400), brief=fetch_brief, ctx=ctx)
-
-    try:
-        fb = json.loads(fallback)
-        candidates = fb.get('items', [])
+        # Extract meaningful tokens for OR pass (keep digits even if short: "4", "2", etc.)
+        tokens = meaningful_tokens(query)
+        if not tokens:
+            return dumps(data)
+
+        # Pass 2 — OR fallback, ranked by token match density. The text index
+        # answers it in one probe; the per-field regex $or covers substrings the
+        # word-stemmed index misses ("dock" -> "docker"), and databases without
+        # the index, so it runs whenever $text leaves the page short.
+        fallback_limit = min(limit * 4, 400)
+        fb = None
+        text_filter = _text_search_filter(tokens, fields, TODO_SEARCH_FIELDS)
+        if text_filter:
+            try:
+                fb = await _page(text_filter, fallback_limit)
+            except Exception as e:
+                logger.debug(f"search_todos $text unavailable, using regex: {e}")
+
+        if not fb or len(fb['items']) < limit:
+            escaped = [re.escape(t) for t in tokens]
+            or_query = {"$or": [
+                {field: {"$regex": tok, "$options": "i"}}
+                for tok in escaped for field in fields
+            ]}
+            regex_fb = await _page(or_query, fallback_limit)
+            if fb:
+                regex_fb['items'] = _merge_search_hits(fb['items'], regex_fb['items'])
+            fb = regex_fb
+
+        candidates = fb['items']
         if not candidates:
-            return result  # Still nothing — return original empty
+            return dumps(data)  # Still nothing — return original empty
 
         tok_lower = [t.lower() for t in tokens]
 
@@ -1644,8 +2127,9 @@ async def search_todos(query: str, fields: Optional[list] = None, limit: int = 2
             "count": len(ranked),
             "source": fb.get('source'),
         }, "fuzzy_or")
-    except Exception:
-        return fallback
+    except Exception as e:
+        logger.error(f"Failed to search todos: {str(e)}")
+        return create_response(False, message=str(e))
 
 
 async def query_todos_by_metadata(metadata_filters: Dict[str, Any],
@@ -1687,10 +2171,10 @@ async def query_todos_by_metadata(metadata_filters: Dict[str, Any],
         # Execute query
         # Exclude the search-only vector field (see compact_todo) — this raw
         # path skips compaction, so project it out at the DB read.
-        cursor = todos_collection.find(enhanced_filter, {"embedding": 0}).limit(limit).sort("created_at", -1)
-        results = list(cursor)
+        cursor = todos_collection.find(enhanced_filter, _TODO_LIST_PROJECTION).limit(limit).sort("created_at", -1).batch_size(limit)
+        results = await asyncio.to_thread(list, cursor)
 
-        return json.dumps({"items": results, "count": len(results)}, cls=MongoJSONEncoder)
+        return dumps({"items": results, "count": len(results)})
 
     except Exception as e:
         logger.error(f"Failed to query todos by metadata: {str(e)}")
@@ -1726,8 +2210,11 @@ async def search_todos_advanced(query: str,
         if fields is None:
             fields = ["description", "project"]
 
+        # Escaped: the query is text to find, not a pattern — an unescaped
+        # "a+b" or "(x+)+" is a quantifier, and a backtracking bomb on big notes.
+        pattern = re.escape(query)
         text_search_filter = {
-            "$or": [{field: {"$regex": query, "$options": "i"}} for field in fields]
+            "$or": [{field: {"$regex": pattern, "$options": "i"}} for field in fields]
         }
 
         # Combine with metadata filters if provided
@@ -1748,14 +2235,14 @@ async def search_todos_advanced(query: str,
             )
             # Exclude the search-only vector field (see compact_todo); this raw
             # path skips compaction, so drop it in the pipeline / projection.
-            pipeline = pipeline + [{"$project": {"embedding": 0}}]
-            results = list(todos_collection.aggregate(pipeline))
+            pipeline = pipeline + [{"$project": _TODO_LIST_PROJECTION}]
+            results = await asyncio.to_thread(lambda: list(todos_collection.aggregate(pipeline)))
         else:
             # Simple query for text-only search
-            cursor = todos_collection.find(combined_filter, {"embedding": 0}).limit(limit).sort("created_at", -1)
-            results = list(cursor)
+            cursor = todos_collection.find(combined_filter, _TODO_LIST_PROJECTION).limit(limit).sort("created_at", -1).batch_size(limit)
+            results = await asyncio.to_thread(list, cursor)
 
-        return json.dumps({"items": results, "count": len(results)}, cls=MongoJSONEncoder)
+        return dumps({"items": results, "count": len(results)})
 
     except Exception as e:
         logger.error(f"Failed to perform advanced todo search: {str(e)}")
@@ -1851,15 +2338,15 @@ async def get_metadata_stats(project: Optional[str] = None,
             }
         ]
 
-        results = list(todos_collection.aggregate(pipeline))
+        results = await asyncio.to_thread(lambda: list(todos_collection.aggregate(pipeline)))
 
         if results:
             # compact_stats_facets does the null-bucket cleanup the per-facet
             # list comprehensions used to do, renames Mongo's `_id` group key to
             # `value`, and flattens the one-element total_counts facet.
-            return json.dumps(compact_stats_facets(results[0]))
+            return dumps(compact_stats_facets(results[0]))
         else:
-            return json.dumps({"message": "No todos found"})
+            return dumps({"message": "No todos found"})
 
     except Exception as e:
         logger.error(f"Failed to get metadata stats: {str(e)}")
@@ -1881,11 +2368,11 @@ async def grep_lessons(pattern: str, limit: int = 20, ctx: Optional[Context] = N
         search_query = _build_tokenized_search_query(pattern, ["topic", "lesson_learned"])
         logger.debug(f"MongoDB query: {search_query}")
 
-        cursor = lessons_collection.find(search_query, _LESSON_NO_VECTOR).limit(limit)
-        results = compact_lesson_list(list(cursor))
+        cursor = lessons_collection.find(search_query, _LESSON_LIST_PROJECTION).limit(limit)
+        results = await asyncio.to_thread(compact_lesson_list, cursor)
 
         logger.info(f"grep_lessons returned {len(results)} results for pattern '{pattern}'")
-        return json.dumps({"items": results, "count": len(results)}, cls=MongoJSONEncoder)
+        return dumps({"items": results, "count": len(results)})
     except Exception as e:
         logger.error(f"Failed to grep lessons: {str(e)}")
         return create_response(False, message=str(e))
@@ -1957,7 +2444,7 @@ async def query_todo_logs(filter_type: str = 'all', project: str = 'all',
 
             logger.info(f"Unified view: personal={len(personal_entries)}, shared={len(shared_entries)}, unique={len(all_logs)}")
             paginated_logs = compact_log_list(paginated_logs)
-            return json.dumps({"items": paginated_logs, "count": len(paginated_logs)})
+            return dumps({"items": paginated_logs, "count": len(paginated_logs)})
 
         except Exception as e:
             logger.error(f"Failed to query unified todo logs: {str(e)}")
@@ -1965,7 +2452,7 @@ async def query_todo_logs(filter_type: str = 'all', project: str = 'all',
             service = get_service_instance()
             logs = await service.get_logs(filter_type, project, page, page_size, ctx.user if ctx else None)
             log_entries = compact_log_list(logs.get('logEntries', []))
-            return json.dumps({"items": log_entries, "count": len(log_entries)})
+            return dumps({"items": log_entries, "count": len(log_entries)})
     else:
         # Regular view: single database based on user context
         service = get_service_instance()
@@ -1978,7 +2465,7 @@ async def query_todo_logs(filter_type: str = 'all', project: str = 'all',
             log['source'] = source
 
         log_entries = compact_log_list(log_entries)
-        return json.dumps({"items": log_entries, "count": len(log_entries)})
+        return dumps({"items": log_entries, "count": len(log_entries)})
 
 async def list_projects(include_details: Union[bool, str] = False, madness_root: str = "/Users/d.edens/lab/madness_interactive", ctx: Optional[Context] = None) -> str:
     """
@@ -1993,20 +2480,20 @@ async def list_projects(include_details: Union[bool, str] = False, madness_root:
         # For authenticated users, get from their database
         if ctx and ctx.user and ctx.user.get('sub'):
             # Primary: Get distinct projects from todos (fast indexed query)
-            todo_projects = get_distinct_projects_from_todos(ctx)
+            todo_projects = await asyncio.to_thread(get_distinct_projects_from_todos, ctx)
             all_project_names.update(todo_projects)
 
             # Secondary: Merge with projects collection
-            user_projects = get_all_projects(ctx)
+            user_projects = await asyncio.to_thread(get_all_projects, ctx)
             if user_projects:
                 collection_names = [p.get('name', p.get('id', '')) for p in user_projects]
                 all_project_names.update(n for n in collection_names if n)
         else:
             # For unauthenticated users (demo mode), use shared database
-            todo_projects = get_distinct_projects_from_todos(None)
+            todo_projects = await asyncio.to_thread(get_distinct_projects_from_todos, None)
             all_project_names.update(todo_projects)
 
-            shared_projects = get_all_projects(None)
+            shared_projects = await asyncio.to_thread(get_all_projects, None)
             if shared_projects:
                 collection_names = [p.get('name', p.get('id', '')) for p in shared_projects]
                 all_project_names.update(n for n in collection_names if n)
@@ -2015,15 +2502,15 @@ async def list_projects(include_details: Union[bool, str] = False, madness_root:
         # "" entries a project doc with no name/id leaves behind.
         if all_project_names:
             sorted_projects = strip_empty_fields(sorted(all_project_names))
-            return json.dumps({"items": sorted_projects, "count": len(sorted_projects)})
+            return dumps({"items": sorted_projects, "count": len(sorted_projects)})
 
         # Final fallback to hardcoded list if database is empty
-        return json.dumps({"items": VALID_PROJECTS, "count": len(VALID_PROJECTS)})
+        return dumps({"items": VALID_PROJECTS, "count": len(VALID_PROJECTS)})
 
     except Exception as e:
         logger.error(f"Failed to list projects: {str(e)}")
         # Fallback to hardcoded list on error
-        return json.dumps({"items": VALID_PROJECTS, "count": len(VALID_PROJECTS)})
+        return dumps({"items": VALID_PROJECTS, "count": len(VALID_PROJECTS)})
 
 async def add_explanation(topic: str, content: str, kind: str = "concept", author: str = "system", ctx: Optional[Context] = None) -> str:
     """
@@ -2041,12 +2528,13 @@ async def add_explanation(topic: str, content: str, kind: str = "concept", autho
         collections = db_connection.get_collections(ctx.user if ctx else None)
         explanations_collection = collections['explanations']
 
-        explanations_collection.update_one(
+        await asyncio.to_thread(
+            explanations_collection.update_one,
             {"topic": topic},
             {"$set": explanation},
             upsert=True
         )
-        return json.dumps({"id": topic})
+        return dumps({"id": topic})
     except Exception as e:
         logger.error(f"Failed to add explanation: {str(e)}")
         return create_response(False, message=str(e))
@@ -2058,11 +2546,9 @@ async def get_explanation(topic: str, ctx: Optional[Context] = None) -> str:
         collections = db_connection.get_collections(ctx.user if ctx else None)
         explanations_collection = collections['explanations']
 
-        explanation = explanations_collection.find_one({"topic": topic})
+        explanation = await asyncio.to_thread(explanations_collection.find_one, {"topic": topic}, {"_id": 0})
         if explanation:
-            if '_id' in explanation:
-                del explanation['_id']
-            return json.dumps(strip_empty_fields(explanation))
+            return dumps(strip_empty_fields(explanation))
         return create_response(False, message=f"Explanation for '{topic}' not found.")
     except Exception as e:
         logger.error(f"Failed to get explanation: {str(e)}")
@@ -2079,9 +2565,9 @@ async def update_explanation(topic: str, updates: dict, ctx: Optional[Context] =
         collections = db_connection.get_collections(ctx.user if ctx else None)
         explanations_collection = collections['explanations']
 
-        result = explanations_collection.update_one({"topic": topic}, {"$set": updates})
+        result = await asyncio.to_thread(explanations_collection.update_one, {"topic": topic}, {"$set": updates})
         if result.modified_count:
-            return json.dumps({"id": topic})
+            return dumps({"id": topic})
         return create_response(False, message="Explanation not found or no changes made.")
     except Exception as e:
         logger.error(f"Failed to update explanation: {str(e)}")
@@ -2094,9 +2580,9 @@ async def delete_explanation(topic: str, ctx: Optional[Context] = None) -> str:
         collections = db_connection.get_collections(ctx.user if ctx else None)
         explanations_collection = collections['explanations']
 
-        result = explanations_collection.delete_one({"topic": topic})
+        result = await asyncio.to_thread(explanations_collection.delete_one, {"topic": topic})
         if result.deleted_count:
-            return json.dumps({"id": topic})
+            return dumps({"id": topic})
         return create_response(False, message="Explanation not found.")
     except Exception as e:
         logger.error(f"Failed to delete explanation: {str(e)}")
@@ -2112,14 +2598,15 @@ async def explain_tool(topic: str, brief: bool = False, ctx: Optional[Context] =
     return await get_explanation(topic, ctx)
 
 
-async def list_lessons(limit: int = 20, brief: Optional[bool] = None, ctx: Optional[Context] = None) -> str:
+async def list_lessons(limit: int = 20, brief: Optional[bool] = None, projection: Optional[Dict[str, Any]] = None, ctx: Optional[Context] = None) -> str:
     """
     List all lessons, sorted by creation date.
 
     brief=None (default) auto-sizes the response: lesson_learned is cut to a
     snippet once the combined text blows the budget, kept whole when the set is
     small. Pass brief=True/False to force. Response carries diet
-    ('full'|'brief'|'truncated').
+    ('full'|'brief'|'truncated'). projection overrides the default read,
+    which already leaves out _id and the embedding.
     """
     try:
         # Get user-scoped collections
@@ -2130,8 +2617,10 @@ async def list_lessons(limit: int = 20, brief: Optional[bool] = None, ctx: Optio
         db_name = lessons_collection.database.name
         logger.info(f"list_lessons called by {user_id}: limit={limit}, brief={brief}, db={db_name}")
 
-        cursor = lessons_collection.find({}, _LESSON_NO_VECTOR).sort("created_at", -1).limit(limit)
-        results = compact_lesson_list(list(cursor), brief=bool(brief))
+        if projection is None:
+            projection = _LESSON_BRIEF_PROJECTION if brief else _LESSON_LIST_PROJECTION
+        cursor = lessons_collection.find(_ALL_DOCS, projection).sort("created_at", -1).limit(limit)
+        results = await asyncio.to_thread(compact_lesson_list, cursor.batch_size(limit), brief=bool(brief))
 
         if brief is None:
             results, diet = apply_lesson_diet(results)
@@ -2140,39 +2629,42 @@ async def list_lessons(limit: int = 20, brief: Optional[bool] = None, ctx: Optio
 
         logger.info(f"list_lessons returned {len(results)} total lessons (diet={diet})")
 
-        return json.dumps({"items": results, "count": len(results), "diet": diet}, cls=MongoJSONEncoder)
+        return dumps({"items": results, "count": len(results), "diet": diet})
     except Exception as e:
         logger.error(f"Failed to list lessons: {str(e)}")
         return create_response(False, message=str(e))
 
-async def search_lessons(query: str, fields: Optional[list] = None, limit: int = 20, brief: Optional[bool] = None, ctx: Optional[Context] = None) -> str:
+async def search_lessons(query: str, fields: Optional[list] = None, limit: int = 20, brief: Optional[bool] = None, projection: Optional[Dict[str, Any]] = None, ctx: Optional[Context] = None) -> str:
     """
     Search lessons with two-pass text search.
 
     Pass 1 (strict): all tokens must appear (AND). Fast, precise.
     Pass 2 (fuzzy):  any token matches (OR), ranked by how many tokens hit.
-                     Fires only when strict returns nothing.
+                     Fires only when strict returns nothing. Text-index hits
+                     are topped up by a bounded regex pass when fewer than limit.
 
     brief=None (default) auto-sizes the response: a fat result set comes back
     with lesson_learned cut to a snippet around the query match, a small one
     keeps full text. Pass brief=True/False to force. Response carries
     search_mode ('strict'|'fuzzy_or') and diet ('full'|'brief'|'truncated').
+    projection overrides the default read (no _id, no embedding).
     """
     if fields is None:
         fields = ["topic", "lesson_learned", "tags"]
-
     auto = brief is None
     fetch_brief = False if auto else brief
+    # Pass 2 ranks candidates on their field text, so only pass 1 can read slim
+    strict_projection = projection or (_LESSON_BRIEF_PROJECTION if fetch_brief else _LESSON_LIST_PROJECTION)
+    if projection is None:
+        projection = _LESSON_LIST_PROJECTION
 
-    def _shape(docs: list, mode: str) -> str:
-        results = compact_lesson_list(docs, brief=fetch_brief)
+    def _shape(results: list, mode: str) -> str:
         if auto:
             results, diet = apply_lesson_diet(results, query)
         else:
             diet = "brief" if fetch_brief else "full"
-        return json.dumps(
-            {"items": results, "count": len(results), "search_mode": mode, "diet": diet},
-            cls=MongoJSONEncoder,
+        return dumps(
+            {"items": results, "count": len(results), "search_mode": mode, "diet": diet}
         )
 
     try:
@@ -2186,7 +2678,8 @@ async def search_lessons(query: str, fields: Optional[list] = None, limit: int =
         # Pass 1 — strict AND
         strict_query = _build_tokenized_search_query(query, fields)
         logger.debug(f"search_lessons pass1 query: {strict_query}")
-        results = list(lessons_collection.find(strict_query, _LESSON_NO_VECTOR).limit(limit))
+        cursor = lessons_collection.find(strict_query, strict_projection).limit(limit).batch_size(limit)
+        results = await asyncio.to_thread(compact_lesson_list, cursor, brief=fetch_brief)
         if results:
             logger.info(f"search_lessons strict returned {len(results)} results")
             return _shape(results, "strict")
@@ -2197,14 +2690,28 @@ async def search_lessons(query: str, fields: Optional[list] = None, limit: int =
         if not meaningful:
             return _shape([], "fuzzy_or")
 
-        escaped = [re.escape(t) for t in meaningful]
-        or_query = {"$or": [
-            {field: {"$regex": tok, "$options": "i"}}
-            for tok in escaped
-            for field in fields
-        ]}
-        logger.debug(f"search_lessons pass2 OR query: {or_query}")
-        candidates = list(lessons_collection.find(or_query, _LESSON_NO_VECTOR).limit(limit * 4))
+        # Text index first (one probe), per-field regex $or for substrings
+        # the index misses or when the index isn't there; the regex pass runs
+        # whenever $text leaves the page short, so partial words still match.
+        candidates = []
+        text_filter = _text_search_filter(meaningful, fields, LESSON_SEARCH_FIELDS)
+        if text_filter:
+            try:
+                cursor = lessons_collection.find(text_filter, projection).sort(_TEXT_SCORE_SORT).limit(limit * 4).batch_size(limit * 4)
+                candidates = await asyncio.to_thread(list, cursor)
+            except Exception as e:
+                logger.debug(f"search_lessons $text unavailable, using regex: {e}")
+
+        if len(candidates) < limit:
+            escaped = [re.escape(t) for t in meaningful]
+            or_query = {"$or": [
+                {field: {"$regex": tok, "$options": "i"}}
+                for tok in escaped
+                for field in fields
+            ]}
+            logger.debug(f"search_lessons pass2 OR query: {or_query}")
+            cursor = lessons_collection.find(or_query, projection).limit(limit * 4).batch_size(limit * 4)
+            candidates = _merge_search_hits(candidates, await asyncio.to_thread(list, cursor))
 
         tok_lower = [t.lower() for t in meaningful]
 
@@ -2213,7 +2720,7 @@ async def search_lessons(query: str, fields: Optional[list] = None, limit: int =
             return sum(1 for t in tok_lower if t in text)
 
         candidates.sort(key=match_score, reverse=True)
-        results = candidates[:limit]
+        results = compact_lesson_list(candidates[:limit], brief=fetch_brief)
 
         logger.info(f"search_lessons fuzzy_or returned {len(results)} results for query '{query}'")
         return _shape(results, "fuzzy_or")
@@ -2275,7 +2782,7 @@ async def point_out_obvious(observation: str, sarcasm_level: int = 5, ctx: Optio
         collections = db_connection.get_collections(ctx.user if ctx else None)
         # Access the database directly for custom collections like obvious_observations
         obvious_collection = collections.database["obvious_observations"]
-        obvious_collection.insert_one({
+        await asyncio.to_thread(obvious_collection.insert_one, {
             "observation": observation,
             "sarcasm_level": level,
             "timestamp": datetime.now(timezone.utc),
@@ -2286,16 +2793,13 @@ async def point_out_obvious(observation: str, sarcasm_level: int = 5, ctx: Optio
         logger.debug(f"Failed to store obvious observation: {e}")
 
     # Publish to MQTT for other systems to enjoy the obviousness
-    try:
-        await mqtt_publish("observations/obvious", {
-            "observation": observation,
-            "sarcasm_level": level,
-            "response": response
-        })
-    except Exception as e:
-        logger.debug(f"Failed to publish obvious observation: {e}")
+    emit_status("observations/obvious", {
+        "observation": observation,
+        "sarcasm_level": level,
+        "response": response
+    })
 
-    return json.dumps({"response": response})
+    return dumps({"response": response})
 
 
 async def bring_your_own(tool_name: str, code: str, runtime: str = "python",
@@ -2339,7 +2843,7 @@ async def bring_your_own(tool_name: str, code: str, runtime: str = "python",
                 bring_your_own._rate_limits = {}
 
             last_call = bring_your_own._rate_limits.get(rate_limit_key, 0)
-            now = datetime.now(timezone.utc).timestamp()
+            now = time.time()
             if now - last_call < 10:  # 10 second cooldown
                 return create_response(False,
                     message=f"Rate limited. Please wait {10 - (now - last_call):.1f} seconds")
@@ -2499,12 +3003,13 @@ async def _execute_byo_tool(args):
                 "persist": persist,
                 "success": True
             }
-            byo_collection.insert_one(execution_record)
+            await asyncio.to_thread(byo_collection.insert_one, execution_record)
 
             # If persist is True, save to a persistent tools collection
             if persist:
                 persistent_tools = collections.database["persistent_byo_tools"]
-                persistent_tools.update_one(
+                await asyncio.to_thread(
+                    persistent_tools.update_one,
                     {"tool_name": tool_name},
                     {"$set": {
                         "tool_name": tool_name,
@@ -2522,16 +3027,13 @@ async def _execute_byo_tool(args):
             logger.debug(f"Failed to store BYO tool execution: {e}")
 
         # Publish to MQTT for monitoring
-        try:
-            await mqtt_publish("tools/byo/execution", {
-                "tool_id": tool_id,
-                "tool_name": full_tool_name,
-                "runtime": runtime,
-                "user": user_id,
-                "success": True
-            })
-        except Exception as e:
-            logger.debug(f"Failed to publish BYO execution to MQTT: {e}")
+        emit_status("tools/byo/execution", {
+            "tool_id": tool_id,
+            "tool_name": full_tool_name,
+            "runtime": runtime,
+            "user": user_id,
+            "success": True
+        })
 
         return create_response(True, {
             "tool_id": tool_id,
@@ -2555,7 +3057,7 @@ async def _execute_byo_tool(args):
             # Get user-scoped collections - use database access for custom collections
             collections = db_connection.get_collections(ctx.user if ctx else None)
             byo_collection = collections.database["byo_tools"]
-            byo_collection.insert_one({
+            await asyncio.to_thread(byo_collection.insert_one, {
                 "tool_id": tool_id,
                 "tool_name": tool_name,
                 "error": str(e),
@@ -2593,6 +3095,7 @@ async def get_context_bundle(
     _TODO_FIELDS = {"_id": 0, "id": 1, "description": 1, "priority": 1, "status": 1, "project": 1, "created_at": 1}
     _LESSON_FIELDS = {"_id": 0, "id": 1, "topic": 1, "language": 1, "tags": 1}
     _SESSION_KEYS = {"id", "title", "project", "status", "created_at"}
+    _RELATED_TODO_KEYS = {*_TODO_FIELDS.keys() - {"_id"}, "similarity_score"}
 
     try:
         collections = db_connection.get_collections(ctx.user if ctx else None)
@@ -2606,10 +3109,10 @@ async def get_context_bundle(
     if project:
         try:
             cursor = todos_collection.find(
-                {"project": {"$regex": f"^{re.escape(project)}$", "$options": "i"}, "status": "pending"},
+                {"project": _exact_ci(project), "status": "pending"},
                 _TODO_FIELDS
             ).sort("created_at", -1).limit(5)
-            items = [strip_empty_fields(doc) for doc in cursor]
+            items = [strip_empty_fields(doc) for doc in await asyncio.to_thread(list, cursor)]
             bundle["project_todos"] = {"items": items, "count": len(items), "project": project}
             sections_returned.append("project_todos")
         except Exception as e:
@@ -2621,7 +3124,8 @@ async def get_context_bundle(
     if keywords and lessons_collection is not None:
         try:
             query_text = " ".join(keywords)
-            use_semantic = embeddings.is_available() and lessons_collection.find_one({"embedding": {"$exists": True}})
+            use_semantic = embeddings.is_available() and await asyncio.to_thread(
+                lessons_collection.find_one, {"embedding": {"$exists": True}}, {"_id": 1})
             if use_semantic:
                 items = await embeddings.find_similar(query_text, lessons_collection, "lesson", limit=3)
                 # Slim down to match expected projection
@@ -2636,7 +3140,7 @@ async def get_context_bundle(
                     ]
                 }
                 cursor = lessons_collection.find(lesson_query, _LESSON_FIELDS).limit(3)
-                items = [strip_empty_fields(doc) for doc in cursor]
+                items = [strip_empty_fields(doc) for doc in await asyncio.to_thread(list, cursor)]
             bundle["related_lessons"] = {"items": items, "count": len(items)}
             sections_returned.append("related_lessons")
         except Exception as e:
@@ -2653,15 +3157,15 @@ async def get_context_bundle(
                 project_todo_ids = {t.get("id") for t in bundle["project_todos"]["items"] if t.get("id")}
 
             query_text = " ".join(keywords)
-            use_semantic = embeddings.is_available() and todos_collection.find_one({"embedding": {"$exists": True}})
+            use_semantic = embeddings.is_available() and await asyncio.to_thread(
+                todos_collection.find_one, {"embedding": {"$exists": True}}, {"_id": 1})
             if use_semantic:
                 raw_items = await embeddings.find_similar(query_text, todos_collection, "todo", limit=10)
                 # Slim to expected fields + dedup
-                items = []
-                for doc in raw_items:
-                    if doc.get("id") not in project_todo_ids:
-                        items.append({k: v for k, v in doc.items() if k in ("id", "description", "priority", "status", "project", "created_at", "similarity_score")})
-                items = items[:5]
+                items = [
+                    {k: v for k, v in doc.items() if k in _RELATED_TODO_KEYS}
+                    for doc in raw_items if doc.get("id") not in project_todo_ids
+                ][:5]
             else:
                 keyword_pattern = "|".join(re.escape(k) for k in keywords)
                 keyword_query = {
@@ -2672,7 +3176,7 @@ async def get_context_bundle(
                     "status": {"$ne": "completed"}
                 }
                 cursor = todos_collection.find(keyword_query, _TODO_FIELDS).sort("created_at", -1).limit(10)
-                items = [strip_empty_fields(doc) for doc in cursor if doc.get("id") not in project_todo_ids][:5]
+                items = [strip_empty_fields(doc) for doc in await asyncio.to_thread(list, cursor) if doc.get("id") not in project_todo_ids][:5]
             bundle["keyword_todos"] = {"items": items, "count": len(items)}
             sections_returned.append("keyword_todos")
         except Exception as e:
@@ -2684,10 +3188,10 @@ async def get_context_bundle(
     if project and include_completed:
         try:
             cursor = todos_collection.find(
-                {"project": {"$regex": f"^{re.escape(project)}$", "$options": "i"}, "status": "completed"},
+                {"project": _exact_ci(project), "status": "completed"},
                 _TODO_FIELDS
             ).sort("updated_at", -1).limit(3)
-            items = [strip_empty_fields(doc) for doc in cursor]
+            items = [strip_empty_fields(doc) for doc in await asyncio.to_thread(list, cursor)]
             bundle["recent_completions"] = {"items": items, "count": len(items)}
             sections_returned.append("recent_completions")
         except Exception as e:
@@ -2699,10 +3203,10 @@ async def get_context_bundle(
     if project:
         try:
             cursor = todos_collection.find(
-                {"project": {"$regex": f"^{re.escape(project)}$", "$options": "i"}, "status": "blocked"},
+                {"project": _exact_ci(project), "status": "blocked"},
                 _TODO_FIELDS
             ).limit(5)
-            items = [strip_empty_fields(doc) for doc in cursor]
+            items = [strip_empty_fields(doc) for doc in await asyncio.to_thread(list, cursor)]
             bundle["blocked_todos"] = {"items": items, "count": len(items)}
             sections_returned.append("blocked_todos")
         except Exception as e:
@@ -2715,11 +3219,11 @@ async def get_context_bundle(
         try:
             changed_query = {"updated_at": {"$gte": since}}
             if project:
-                changed_query["project"] = {"$regex": f"^{re.escape(project)}$", "$options": "i"}
+                changed_query["project"] = _exact_ci(project)
             # Include updated_by in changed results so agent sees who made changes
             changed_fields = {**_TODO_FIELDS, "updated_at": 1, "updated_by": 1}
             cursor = todos_collection.find(changed_query, changed_fields).sort("updated_at", -1).limit(10)
-            items = [strip_empty_fields(doc) for doc in cursor]
+            items = [strip_empty_fields(doc) for doc in await asyncio.to_thread(list, cursor)]
             bundle["changed_todos"] = {"items": items, "count": len(items), "since": since}
             sections_returned.append("changed_todos")
         except Exception as e:
@@ -2731,7 +3235,7 @@ async def get_context_bundle(
     if project:
         try:
             result_str = await inventorium_sessions_list(project=project, limit=1, ctx=ctx)
-            result_data = json.loads(result_str)
+            result_data = orjson.loads(result_str)
             if result_data.get("success"):
                 sessions = result_data.get("data", {}).get("sessions", [])
                 if sessions:
@@ -2767,7 +3271,7 @@ async def get_context_bundle(
         }
     }
 
-    return json.dumps(response, cls=MongoJSONEncoder)
+    return dumps(response)
 
 
 # --- Semantic Search (Phase 4 RAG) ---
@@ -2802,7 +3306,7 @@ async def find_relevant(
         if "todos" in types:
             todos_collection = collections['todos']
             if use_semantic:
-                has_embeddings = todos_collection.find_one({"embedding": {"$exists": True}})
+                has_embeddings = await asyncio.to_thread(todos_collection.find_one, {"embedding": {"$exists": True}}, {"_id": 1})
                 if has_embeddings:
                     items = await embeddings.find_similar(query, todos_collection, "todo", limit=limit)
                     # Semantic available: return whatever it found (may be empty if nothing above threshold)
@@ -2810,30 +3314,30 @@ async def find_relevant(
                                         **({"message": "no matches above similarity threshold"} if not items else {})}
                 else:
                     # No embeddings stored yet — regex is the only option
-                    items = _regex_search_todos(todos_collection, query, limit)
+                    items = await asyncio.to_thread(_regex_search_todos, todos_collection, query, limit)
                     results["todos"] = {"items": items, "count": len(items), "method": "regex"}
             else:
-                items = _regex_search_todos(todos_collection, query, limit)
+                items = await asyncio.to_thread(_regex_search_todos, todos_collection, query, limit)
                 results["todos"] = {"items": items, "count": len(items), "method": "regex"}
 
         if "lessons" in types:
             lessons_collection = collections.get('lessons')
             if lessons_collection is not None:
                 if use_semantic:
-                    has_embeddings = lessons_collection.find_one({"embedding": {"$exists": True}})
+                    has_embeddings = await asyncio.to_thread(lessons_collection.find_one, {"embedding": {"$exists": True}}, {"_id": 1})
                     if has_embeddings:
                         items = await embeddings.find_similar(query, lessons_collection, "lesson", limit=limit)
                         # Semantic available: trust the threshold, don't pollute with regex fallback
                         results["lessons"] = {"items": items, "count": len(items), "method": "semantic",
                                               **({"message": "no matches above similarity threshold"} if not items else {})}
                     else:
-                        items = _regex_search_lessons(lessons_collection, query, limit)
+                        items = await asyncio.to_thread(_regex_search_lessons, lessons_collection, query, limit)
                         results["lessons"] = {"items": items, "count": len(items), "method": "regex"}
                 else:
-                    items = _regex_search_lessons(lessons_collection, query, limit)
+                    items = await asyncio.to_thread(_regex_search_lessons, lessons_collection, query, limit)
                     results["lessons"] = {"items": items, "count": len(items), "method": "regex"}
 
-        return json.dumps(results, cls=MongoJSONEncoder)
+        return dumps(results)
     except Exception as e:
         logger.error(f"find_relevant failed: {e}")
         return create_response(False, message=str(e))
@@ -2844,21 +3348,30 @@ def _regex_search_todos(collection, query: str, limit: int) -> list:
     keywords = _extract_keywords(query)
     search_query = {**_broad_search_query(keywords, ["description", "project", "notes"]), "status": {"$ne": "completed"}}
     projection = {"_id": 0, "id": 1, "description": 1, "priority": 1, "status": 1, "project": 1, "created_at": 1}
-    cursor = collection.find(search_query, projection).sort("created_at", -1).limit(limit * 3)
+    cursor = collection.find(search_query, projection).sort("created_at", -1).limit(limit * 3).batch_size(limit * 3)
     results = [strip_empty_fields(doc) for doc in cursor]
+    needles = _keyword_needles(keywords)
     def score(doc):
         text = f"{doc.get('description', '')} {doc.get('project', '')} {doc.get('notes', '')}".lower()
-        return sum(1 for kw in keywords if re.search(kw, text, re.IGNORECASE))
+        return sum(1 for n in needles if n in text)
     results.sort(key=score, reverse=True)
     return results[:limit]
 
 
+_UNESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+
+
 def _extract_keywords(text: str) -> list:
     """Extract meaningful keywords from natural language, stripping stop words."""
     tokens = [re.escape(t) for t in text.split() if t.strip() and t.lower() not in _STOP_WORDS and len(t) > 2]
     return tokens if tokens else [re.escape(t) for t in text.split() if t.strip()]
 
 
+def _keyword_needles(keywords: list) -> list:
+    """Lower-cased literals for escaped keywords — ranking is plain substring checks, no regex engine."""
+    return [_UNESCAPE_RE.sub(r"\1", kw).lower() for kw in keywords]
+
+
 def _broad_search_query(keywords: list, fields: list) -> dict:
     """Build an OR query — match ANY keyword in ANY field. For broad recall on long intents."""
     if not keywords:
@@ -2875,12 +3388,13 @@ def _regex_search_lessons(collection, query: str, limit: int) -> list:
     keywords = _extract_keywords(query)
     search_query = _broad_search_query(keywords, ["topic", "lesson_learned", "tags"])
     projection = {"_id": 0, "id": 1, "topic": 1, "language": 1, "tags": 1, "lesson_learned": 1}
-    cursor = collection.find(search_query, projection).limit(limit * 3)  # over-fetch for ranking
+    cursor = collection.find(search_query, projection).limit(limit * 3).batch_size(limit * 3)  # over-fetch for ranking
     results = [strip_empty_fields(doc) for doc in cursor]
     # Rank by keyword overlap count
+    needles = _keyword_needles(keywords)
     def score(doc):
         text = f"{doc.get('topic', '')} {doc.get('lesson_learned', '')} {' '.join(doc.get('tags', []))}".lower()
-        return sum(1 for kw in keywords if re.search(kw, text, re.IGNORECASE))
+        return sum(1 for n in needles if n in text)
     results.sort(key=score, reverse=True)
     return results[:limit]
 
@@ -2918,12 +3432,13 @@ async def preflight_rag(
         lessons_collection = collections.get("lessons")
 
         if lessons_collection is None:
-            return json.dumps({
+            return dumps({
                 **results,
                 "message": "No lessons collection available — proceeding without historical context."
-            }, cls=MongoJSONEncoder)
+            })
 
-        use_semantic = embeddings.is_available() and lessons_collection.find_one({"embedding": {"$exists": True}})
+        use_semantic = embeddings.is_available() and await asyncio.to_thread(
+            lessons_collection.find_one, {"embedding": {"$exists": True}}, {"_id": 1})
 
         matched_lessons = []
 
@@ -2934,9 +3449,9 @@ async def preflight_rag(
             if not matched_lessons:
                 results["message"] = "No lessons above similarity threshold — no prior context for this intent."
                 results["suggestions"].append("No prior lessons found — charting new territory.")
-                return json.dumps(results, cls=MongoJSONEncoder)
+                return dumps(results)
         else:
-            matched_lessons = _regex_search_lessons(lessons_collection, intent, limit)
+            matched_lessons = await asyncio.to_thread(_regex_search_lessons, lessons_collection, intent, limit)
             results["method"] = "regex"
 
         # If project specified, nudge score of project-relevant lessons so semantic ranking still dominates.
@@ -2993,7 +3508,7 @@ async def preflight_rag(
             results["suggestions"].append("No prior lessons found for this intent — charting new territory.")
 
         results["message"] = f"Preflight check complete: {total} lesson(s) retrieved via {results['method']} search."
-        return json.dumps(results, cls=MongoJSONEncoder)
+        return dumps(results)
 
     except Exception as e:
         logger.error(f"preflight_rag failed: {e}")
@@ -3068,8 +3583,8 @@ async def create_quest(name: str, description: str, project: str,
         parsed_tags = [t.strip() for t in tags.split(",") if t.strip()] if tags else []
         parsed_criteria = [c.strip() for c in success_criteria.split(",") if c.strip()] if success_criteria else []
 
-        now = int(datetime.now(timezone.utc).timestamp())
-        quest_id = str(uuid.uuid4())
+        now = int(time.time())
+        quest_id = _new_id()
 
         chain_docs = []
         total_todos = 0
@@ -3098,16 +3613,19 @@ async def create_quest(name: str, description: str, project: str,
             "metadata": {"tags": parsed_tags},
         }
 
-        quests_col.insert_one(quest_doc)
+        await asyncio.to_thread(quests_col.insert_one, quest_doc)
 
         # Backlink: tag each referenced todo with quest_id
         todos_col = collections['todos']
         all_todo_ids = [tid for c in chain_docs for tid in c["todos"]]
         if all_todo_ids:
-            todos_col.update_many(
+            await asyncio.to_thread(
+                todos_col.update_many,
                 {"id": {"$in": all_todo_ids}},
                 {"$set": {"metadata.quest_id": quest_id}}
             )
+            for tid in all_todo_ids:
+                invalidate_point_read_cache("todo", tid)
 
         return create_response(True, {
             "id": quest_id,
@@ -3121,6 +3639,12 @@ async def create_quest(name: str, description: str, project: str,
         return create_response(False, message=f"Error creating quest: {str(e)}")
 
 
+# check_quest only reads these off each linked todo; list_quests only needs
+# the todo ids inside each chain to count them.
+_QUEST_TODO_FIELDS = {"_id": 0, "id": 1, "status": 1, "description": 1}
+_QUEST_LIST_FIELDS = {"_id": 0, "id": 1, "name": 1, "project": 1, "status": 1, "updated_at": 1, "chains.todos": 1}
+
+
 async def check_quest(quest_id: str, ctx: Optional[Context] = None) -> str:
     """Check quest progress — agent orientation tool for a Quest→Chain→Todo goal.
 
@@ -3132,13 +3656,16 @@ async def check_quest(quest_id: str, ctx: Optional[Context] = None) -> str:
         quests_col = collections['quests']
         todos_col = collections['todos']
 
-        quest = quests_col.find_one({"id": quest_id})
+        quest = await asyncio.to_thread(quests_col.find_one, {"id": quest_id})
         if not quest:
             return create_response(False, message=f"Quest {quest_id} not found")
 
         # Fetch all referenced todos in one query
         all_todo_ids = [tid for c in quest.get("chains", []) for tid in c.get("todos", [])]
-        todo_docs = {t["id"]: t for t in todos_col.find({"id": {"$in": all_todo_ids}})} if all_todo_ids else {}
+        todo_docs = {}
+        if all_todo_ids:
+            cursor = todos_col.find({"id": {"$in": all_todo_ids}}, _QUEST_TODO_FIELDS)
+            todo_docs = await asyncio.to_thread(_index_by_id, cursor)
 
         chains_report = []
         total_done = 0
@@ -3213,12 +3740,12 @@ async def check_quest(quest_id: str, ctx: Optional[Context] = None) -> str:
         # Fallback: no chains → count todos tagged with this quest ID
         metadata_fallback = False
         if total_count == 0:
-            metadata_fallback_todos = list(todos_col.find({
+            metadata_fallback_todos = await asyncio.to_thread(list, todos_col.find({
                 "$or": [
                     {"metadata.quest_id": quest_id},
                     {"metadata.quest": quest_id},
                 ]
-            }))
+            }, _QUEST_TODO_FIELDS))
             metadata_fallback_todos = [t for t in metadata_fallback_todos if t.get("status") != "cancelled"]
             if metadata_fallback_todos:
                 metadata_fallback = True
@@ -3268,7 +3795,7 @@ async def check_quest(quest_id: str, ctx: Optional[Context] = None) -> str:
             **({"progress_source": "metadata-fallback", "note": "No chains found — progress derived from todos tagged with this quest ID via metadata.quest_id / metadata.quest"} if metadata_fallback else {}),
         }
 
-        return json.dumps(result, cls=MongoJSONEncoder)
+        return dumps(result)
 
     except Exception as e:
         logger.error(f"Failed to check quest: {str(e)}")
@@ -3291,22 +3818,22 @@ async def list_quests(status: str = "active", project: str = "",
         if project:
             query["project"] = project.lower().strip()
 
-        quests = list(quests_col.find(query).sort("updated_at", -1).limit(limit))
+        quests = await asyncio.to_thread(list, quests_col.find(query, _QUEST_LIST_FIELDS).sort("updated_at", -1).limit(limit))
 
-        items = []
-        for q in quests:
-            total = sum(len(c.get("todos", [])) for c in q.get("chains", []))
-            items.append({
+        items = [
+            {
                 "id": q["id"],
                 "name": q["name"],
                 "project": q.get("project"),
                 "status": q.get("status"),
                 "chain_count": len(q.get("chains", [])),
-                "todo_count": total,
+                "todo_count": sum(len(c.get("todos", [])) for c in q.get("chains", [])),
                 "updated_at": q.get("updated_at"),
-            })
+            }
+            for q in quests
+        ]
 
-        return json.dumps({"items": items, "count": len(items)}, cls=MongoJSONEncoder)
+        return dumps({"items": items, "count": len(items)})
 
     except Exception as e:
         logger.error(f"Failed to list quests: {str(e)}")
@@ -3325,7 +3852,7 @@ async def link_quest(quest_id: str, todo_id: str, chain_label: str,
         quests_col = collections['quests']
         todos_col = collections['todos']
 
-        quest = quests_col.find_one({"id": quest_id})
+        quest = await asyncio.to_thread(quests_col.find_one, {"id": quest_id})
         if not quest:
             return create_response(False, message=f"Quest {quest_id} not found")
 
@@ -3351,7 +3878,7 @@ async def link_quest(quest_id: str, todo_id: str, chain_label: str,
             chains.append(new_chain)
             chain_idx = len(chains) - 1
             target_chain = new_chain
-            quests_col.update_one({"id": quest_id}, {"$set": {"chains": chains}})
+            await asyncio.to_thread(quests_col.update_one, {"id": quest_id}, {"$set": {"chains": chains}})
 
         todos_list = target_chain.get("todos", [])
         if todo_id in todos_list:
@@ -3364,14 +3891,16 @@ async def link_quest(quest_id: str, todo_id: str, chain_label: str,
             todos_list.insert(position, todo_id)
             pos = position
 
-        now = int(datetime.now(timezone.utc).timestamp())
-        quests_col.update_one(
+        now = int(time.time())
+        await asyncio.to_thread(
+            quests_col.update_one,
             {"id": quest_id},
             {"$set": {f"chains.{chain_idx}.todos": todos_list, "updated_at": now}}
         )
 
         # Backlink todo
-        todos_col.update_one({"id": todo_id}, {"$set": {"metadata.quest_id": quest_id}})
+        await asyncio.to_thread(todos_col.update_one, {"id": todo_id}, {"$set": {"metadata.quest_id": quest_id}})
+        invalidate_point_read_cache("todo", todo_id)
 
         return create_response(True, {
             "chain": chain_label,
@@ -3394,7 +3923,7 @@ async def update_quest(quest_id: str, updates: str = "{}",
         collections = db_connection.get_collections(ctx.user if ctx else None)
         quests_col = collections['quests']
 
-        quest = quests_col.find_one({"id": quest_id})
+        quest = await asyncio.to_thread(quests_col.find_one, {"id": quest_id})
         if not quest:
             return create_response(False, message=f"Quest {quest_id} not found")
 
@@ -3405,13 +3934,13 @@ async def update_quest(quest_id: str, updates: str = "{}",
         if not set_fields:
             return create_response(False, message="No valid fields to update")
 
-        now = int(datetime.now(timezone.utc).timestamp())
+        now = int(time.time())
         set_fields["updated_at"] = now
 
         if set_fields.get("status") == "completed":
             set_fields["completed_at"] = now
 
-        quests_col.update_one({"id": quest_id}, {"$set": set_fields})
+        await asyncio.to_thread(quests_col.update_one, {"id": quest_id}, {"$set": set_fields})
 
         return create_response(True, {"id": quest_id, "updated_fields": list(set_fields.keys())},
                                message=f"Quest updated: {', '.join(set_fields.keys())}")
@@ -3444,23 +3973,24 @@ async def write_agent_journal(agent_name: str, content: str, entry_type: str = "
         collection = db[JOURNAL_COLLECTION]
 
         entry = {
-            "timestamp": int(datetime.now(timezone.utc).timestamp() * 1000),
+            "timestamp": int(time.time() * 1000),
             "content": content[:500],
             "type": entry_type[:20],
             "author": agent_name[:50]
         }
 
-        collection.update_one(
+        await asyncio.to_thread(
+            collection.update_one,
             {"agent_type": agent_name},
             {
                 "$push": {"entries": {"$each": [entry], "$slice": -JOURNAL_MAX_ENTRIES}},
-                "$set": {"agent_type": agent_name, "updated_at": int(datetime.now(timezone.utc).timestamp() * 1000)}
+                "$set": {"agent_type": agent_name, "updated_at": int(time.time() * 1000)}
             },
             upsert=True
         )
 
         logger.info(f"📓 Journal entry for '{agent_name}': {content[:80]}")
-        return json.dumps({"success": True, "agent": agent_name, "entry": entry}, default=str)
+        return dumps({"success": True, "agent": agent_name, "entry": entry})
 
     except Exception as e:
         logger.error(f"Failed to write agent journal: {e}")
@@ -3484,20 +4014,20 @@ async def read_agent_journal(agent_name: str, limit: int = 10, ctx: Optional[Con
         db = collections["database"]
         collection = db[JOURNAL_COLLECTION]
 
-        journal = collection.find_one({"agent_type": agent_name})
+        journal = await asyncio.to_thread(collection.find_one, {"agent_type": agent_name})
 
         if not journal:
-            return json.dumps({"agent": agent_name, "entries": [], "count": 0})
+            return dumps({"agent": agent_name, "entries": [], "count": 0})
 
         entries = (journal.get("entries") or [])[-limit:]
 
-        return json.dumps({
+        return dumps({
             "agent": agent_name,
             "entries": entries,
             "count": len(entries),
             "total": len(journal.get("entries") or []),
             "updated_at": journal.get("updated_at")
-        }, default=str)
+        })
 
     except Exception as e:
         logger.error(f"Failed to read agent journal: {e}")
@@ -1,17 +1,31 @@
+import asyncio
 import json
 import os
 import logging
 import ssl
 import subprocess
+import time
 from datetime import datetime
 from datetime import timezone
-from typing import Any
+from typing import Any, Optional
+
+import aiohttp
+import orjson
+import paho.mqtt.client as paho
 from fastmcp import Context
 from bson import ObjectId
 
+from .mqtt import _sub_once, get_mqtt_client
+
+logger = logging.getLogger(__name__)
+
 MQTT_HOST = os.getenv("AWSIP", "localhost")
 MQTT_PORT = int(os.getenv("AWSPORT", 3003))
 
+# MCP_STATUS=0 turns off status publishing; emit_status then returns before
+# the payload is ever serialized.
+STATUS_ENABLED = os.getenv("MCP_STATUS", "1").strip().lower() not in ("0", "false", "no", "off")
+
 
 class MongoJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder to handle MongoDB ObjectId and other BSON types"""
@@ -23,6 +37,17 @@ class MongoJSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def dumps(obj: Any) -> str:
+    """
+    Serialize a response payload to a JSON string.
+
+    orjson handles datetime/UUID natively, so the `default=str` callback only
+    fires for the odd BSON type (ObjectId) instead of walking every value in
+    Python. Typically 3-10x faster than stdlib json on list-of-dict payloads.
+    """
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def create_response(success: bool, data: Any = None, message: str = None) -> str:
     """
     Create a standardized JSON response.
@@ -57,30 +82,134 @@ def create_response(success: bool, data: Any = None, message: str = None) -> str
     if message is not None:
         response["message"] = message
 
-    return json.dumps(response, cls=MongoJSONEncoder)
+    return dumps(response)
+
+
+def encode_payload(message: Any) -> bytes:
+    """MQTT payload bytes for a message: dicts and lists as compact JSON, bytes as-is, the rest str().
+
+    orjson's bytes go to paho unchanged; a str payload would be decoded here
+    only for paho to encode it straight back.
+    """
+    if isinstance(message, (dict, list)):
+        return orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS)
+    if isinstance(message, bytes):
+        return message
+    return str(message).encode()
+
 
+async def mqtt_publish(topic: str, message: Any, ctx: Context = None, retain: bool = False) -> bool:
+    """Publish a message to the specified MQTT topic. message may be str, bytes, or a dict/list sent as JSON.
 
-async def mqtt_publish(topic: str, message: str, ctx: Context = None, retain: bool = False) -> bool:
-    """Publish a message to the specified MQTT topic"""
+    Goes through the shared persistent paho client, so a publish is a local
+    enqueue (QoS 0) rather than a mosquitto_pub fork and broker handshake.
+    """
+    payload = encode_payload(message)
     try:
-        cmd = ["mosquitto_pub", "-h", MQTT_HOST, "-p", str(MQTT_PORT), "-t", topic, "-m", str(message)]
-        if retain:
-            cmd.append("-r")
-        subprocess.run(cmd, check=True)
-        return True
-    except subprocess.SubprocessError as e:
-        print(f"Failed to publish MQTT message: {str(e)}")
+        info = get_mqtt_client(MQTT_HOST, MQTT_PORT).publish(topic, payload, qos=0, retain=retain)
+    except (ValueError, OSError) as e:
+        logger.warning("Failed to publish MQTT message to %s: %s", topic, e)
+        return False
+    if info.rc != paho.MQTT_ERR_SUCCESS:
+        logger.warning("Failed to publish MQTT message to %s: %s", topic, paho.error_string(info.rc))
         return False
+    return True
+
+
+# Strong references to in-flight fire-and-forget tasks. The event loop only
+# holds weak ones, so an unreferenced task can be collected before it runs.
+_background_tasks: set = set()
+
+
+def spawn_background(coro, label: str) -> Optional[asyncio.Task]:
+    """Run coro without awaiting it. Failures are logged and dropped."""
+    try:
+        task = asyncio.get_running_loop().create_task(coro)
+    except RuntimeError:
+        coro.close()
+        logger.debug(f"No running event loop, skipped background {label}")
+        return None
+    _background_tasks.add(task)
+
+    def _done(t):
+        _background_tasks.discard(t)
+        if not t.cancelled() and t.exception() is not None:
+            logger.warning(f"Background {label} failed: {t.exception()}")
+
+    task.add_done_callback(_done)
+    return task
+
+
+# Status publishes are queued and drained by one flusher task per event loop,
+# so a burst of tool calls costs one wakeup per batch instead of a task each.
+STATUS_BATCH_WINDOW = 0.01  # seconds to keep collecting after the first message
+STATUS_BATCH_MAX = 64
+_status_queue: Optional[asyncio.Queue] = None
+_status_flusher: Optional[asyncio.Task] = None
+
+
+async def _flush_status(queue: asyncio.Queue) -> None:
+    """Publish queued status messages in batches until stop_status_flusher() queues the None sentinel."""
+    while True:
+        batch = [await queue.get()]
+        # One sleep per batch, then drain what arrived; a wait_for per message
+        # would cost a task and a timer for every status event.
+        if queue.qsize() < STATUS_BATCH_MAX - 1:
+            await asyncio.sleep(STATUS_BATCH_WINDOW)
+        while len(batch) < STATUS_BATCH_MAX and not queue.empty():
+            batch.append(queue.get_nowait())
+        for item in batch:
+            if item is None:
+                continue
+            topic, message, ctx, retain = item
+            try:
+                await mqtt_publish(topic, message, ctx, retain)
+            except Exception as e:
+                logger.warning(f"Background MQTT publish to {topic} failed: {e}")
+        if None in batch:
+            return
+
+
+def emit_status(topic: str, message: Any, ctx: Context = None, retain: bool = False) -> None:
+    """Publish an MQTT status message without holding up the caller's response.
+
+    Pass dicts as-is: they are serialized once, in the flusher, and not at all
+    when STATUS_ENABLED is off.
+    """
+    global _status_queue, _status_flusher
+    if not STATUS_ENABLED:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.debug(f"No running event loop, skipped background MQTT publish to {topic}")
+        return
+    if _status_flusher is None or _status_flusher.done() or _status_flusher.get_loop() is not loop:
+        _status_queue = asyncio.Queue()
+        _status_flusher = spawn_background(_flush_status(_status_queue), "MQTT status flusher")
+    _status_queue.put_nowait((topic, message, ctx, retain))
+
+
+async def stop_status_flusher() -> None:
+    """Publish whatever is still queued, then stop the flusher (call on shutdown)."""
+    global _status_queue, _status_flusher
+    flusher, queue = _status_flusher, _status_queue
+    _status_flusher = _status_queue = None
+    if flusher is None or flusher.done():
+        return
+    queue.put_nowait(None)
+    try:
+        await flusher
+    except Exception as e:
+        logger.warning(f"MQTT status flusher failed while stopping: {e}")
 
 
 async def mqtt_get(topic: str) -> str:
     """Get a message from the specified MQTT topic"""
     try:
-        cmd = ["mosquitto_sub", "-h", MQTT_HOST, "-p", str(MQTT_PORT), "-t", topic, "-C", "1"]
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=3)
-        return result.stdout.strip()
-    except subprocess.SubprocessError as e:
-        print(f"Failed to get MQTT message: {str(e)}")
+        return await _sub_once(topic, host=MQTT_HOST, port=MQTT_PORT)
+    except (subprocess.SubprocessError, OSError) as e:
+        logger.warning("Failed to get MQTT message from %s: %s", topic, e)
         return f"Failed to get MQTT message: {str(e)}"
 
 
@@ -98,26 +227,209 @@ def _format_duration(seconds: int) -> str:
         days = seconds // 86400
         return f"{days} day{'s' if days != 1 else ''}"
 
+# Node-RED admin API state shared across deploys. The access token is valid for
+# `expires_in` seconds (a week by default) and the flow list barely changes
+# between back-to-back deploys, so neither needs a round trip on every call.
+_nr_token_cache = {"token": None, "expires_at": 0}
+_nr_flows_cache = {"flows": None, "fetched_at": 0}
+_NR_FLOWS_TTL = 5  # seconds
+_NR_KEEPALIVE = 60  # seconds an idle pooled connection stays open
+NR_URL = os.getenv("NR_URL", "http://localhost:9191")
+NR_USER = os.getenv("NR_USER")
+NR_PASS = os.getenv("NR_PASS")
+_GIT_PULL_TIMEOUT = 5.0  # seconds a pre-deploy git pull may take
+# OMNISPINDLE_AUTO_PULL=0 deploys the checkout as it is, skipping the pull entirely
+AUTO_PULL_ENABLED = os.getenv("OMNISPINDLE_AUTO_PULL", "1").strip().lower() not in ("0", "false", "no", "off")
+_GIT_PULL_TTL = 300.0  # seconds before the same checkout is pulled again
+_last_git_pull: dict = {}  # repo_dir -> monotonic time of the last attempt
+_nr_session: Optional[aiohttp.ClientSession] = None
+
+# Node-RED usually sits behind a self-signed cert on the LAN, hence no verification.
+# Built once: create_default_context() loads and parses the whole CA bundle.
+_NR_SSL_CONTEXT = ssl.create_default_context()
+_NR_SSL_CONTEXT.check_hostname = False
+_NR_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+
+async def _get_nr_session() -> aiohttp.ClientSession:
+    """Return the shared Node-RED session, creating it on first use.
+
+    The pooled connector keeps TCP+TLS connections alive between deploys, so
+    rapid successive deploys skip the handshake. Idle connections are held for
+    a minute rather than aiohttp's 15s default, which outlives the gap between
+    deploys in an edit-deploy loop.
+    """
+    global _nr_session
+    if _nr_session is None or _nr_session.closed:
+        connector = aiohttp.TCPConnector(ssl=_NR_SSL_CONTEXT, limit=20, keepalive_timeout=_NR_KEEPALIVE)
+        _nr_session = aiohttp.ClientSession(connector=connector)
+    return _nr_session
+
+
+async def close_nr_session() -> None:
+    """Close the shared Node-RED session (call on shutdown)."""
+    global _nr_session
+    if _nr_session is not None and not _nr_session.closed:
+        await _nr_session.close()
+    _nr_session = None
+
+
+async def _get_nr_token(session: aiohttp.ClientSession, node_red_url: str, username: str,
+                        password: str) -> str:
+    """Exchange credentials for an admin token, reusing it until 30s before expiry."""
+    now = time.time()
+    if _nr_token_cache["token"] and now < _nr_token_cache["expires_at"] - 30:
+        return _nr_token_cache["token"]
+
+    token_payload = {
+        "client_id": "node-red-admin",
+        "grant_type": "password",
+        "scope": "*",
+        "username": username,
+        "password": password,
+    }
+    async with session.post(f"{node_red_url}/auth/token", data=token_payload) as token_response:
+        if token_response.status != 200:
+            raise RuntimeError(f"Token request failed ({token_response.status}): {await token_response.text()}")
+        try:
+            # Parse straight from the body bytes; the text is only needed to report a bad body
+            token_data = await token_response.json(loads=orjson.loads, content_type=None)
+        except ValueError:
+            raise RuntimeError(f"Token response was not JSON: {await token_response.text()}")
+
+    _nr_token_cache["token"] = token_data["access_token"]
+    _nr_token_cache["expires_at"] = now + token_data.get("expires_in", 0)
+    return _nr_token_cache["token"]
+
+
+async def _get_existing_flows(session: aiohttp.ClientSession, node_red_url: str, headers: dict) -> list:
+    """GET /flows, served from a short-lived cache for rapid successive deploys."""
+    now = time.time()
+    if _nr_flows_cache["flows"] is not None and now - _nr_flows_cache["fetched_at"] < _NR_FLOWS_TTL:
+        return _nr_flows_cache["flows"]
+
+    async with session.get(f"{node_red_url}/flows", headers=headers) as flows_response:
+        if flows_response.status != 200:
+            raise RuntimeError(f"Failed to fetch flows ({flows_response.status}): {await flows_response.text()}")
+        existing_flows = await flows_response.json(loads=orjson.loads, content_type=None)
+
+    _nr_flows_cache["flows"] = existing_flows
+    _nr_flows_cache["fetched_at"] = now
+    return existing_flows
+
+
+def _invalidate_nr_flows_cache() -> None:
+    _nr_flows_cache["flows"] = None
+    _nr_flows_cache["fetched_at"] = 0
+
+
+async def _git_pull(repo_dir: str, timeout: float = _GIT_PULL_TIMEOUT) -> None:
+    """git pull without blocking the event loop. Failures are logged, never fatal.
+
+    A pull that hangs (unreachable remote) is killed after `timeout` seconds
+    and the deploy goes ahead with the checkout as it is. A checkout pulled
+    in the last _GIT_PULL_TTL seconds is not pulled again, so back-to-back
+    deploys skip the fork and the fetch.
+    """
+    now = time.monotonic()
+    last = _last_git_pull.get(repo_dir)
+    if last is not None and now - last < _GIT_PULL_TTL:
+        logger.debug("Git pull of %s skipped, last attempt %.0fs ago", repo_dir, now - last)
+        return
+    _last_git_pull[repo_dir] = now
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            'git', 'pull', cwd=repo_dir,
+            # never stop to ask for credentials; a prompt would only run into the timeout
+            env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        )
+    except OSError as e:
+        logger.warning(f"Git pull failed: {e}")
+        return
+    try:
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        logger.warning(f"Git pull timed out after {timeout}s, deploying the current checkout")
+        return
+    if proc.returncode != 0:
+        logger.warning(f"Git pull failed ({proc.returncode}): {stderr.decode(errors='replace').strip()}")
+
+
+# Prepared flow files keyed by path, tagged with the (mtime_ns, size) they were
+# read at. Redeploying an unchanged dashboard skips the read, the parse and the
+# re-encode of the request body.
+_flow_file_cache: dict = {}
+
+
+def _load_flow(flow_path: str) -> tuple:
+    """(tab id, tab label, encoded request body) for a flow file.
+
+    Rebuilt only when the file has changed since the last deploy. Raises
+    orjson.JSONDecodeError for bad JSON and ValueError for JSON that isn't a
+    flow (wrong top-level type, a non-object node, no tab node).
+    """
+    stat = os.stat(flow_path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _flow_file_cache.get(flow_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(flow_path, 'rb') as file:
+        flow_data = orjson.loads(file.read())
+
+    if not isinstance(flow_data, (list, dict)):
+        raise ValueError(f"Flow JSON must be a list or dict, got {type(flow_data).__name__}")
+    # If it's a single flow object, wrap it in a list
+    if isinstance(flow_data, dict):
+        flow_data = [flow_data]
+    if not all(isinstance(node, dict) for node in flow_data):
+        raise ValueError("Flow nodes must be JSON objects")
+
+    # The tab node identifies the flow; everything else rides along as its nodes
+    tab = next((node for node in flow_data if node.get("type") == "tab"), {})
+    flow_id = tab.get("id")
+    if not flow_id:
+        raise ValueError("No tab node found")
+    flow_label = tab.get("label")
+
+    # Encoded here with orjson; aiohttp's json= would run stdlib json.dumps
+    # over what can be a multi-MB dashboard.
+    flow_body = orjson.dumps({
+        "id": flow_id,
+        "label": flow_label,
+        "nodes": [node for node in flow_data if node.get("type") != "tab"],
+    })
+    prepared = (flow_id, flow_label, flow_body)
+    _flow_file_cache[flow_path] = (stamp, prepared)
+    return prepared
+
+
 async def deploy_nodered_flow(flow_json_name: str) -> str:
     """Deploys a Node-RED flow to a Node-RED instance."""
     try:
-        # Set up logging
-        logger = logging.getLogger(__name__)
-
         # Set default Node-RED URL if not provided
-        node_red_url = os.getenv("NR_URL", "http://localhost:9191")
-        username = os.getenv("NR_USER", None)
-        password = os.getenv("NR_PASS", None)
+        node_red_url, username, password = NR_URL, NR_USER, NR_PASS
 
-        logger.debug(f"Node-RED URL: {node_red_url}")
+        logger.debug("Node-RED URL: %s", node_red_url)
 
-        # Add local git pull
+        session = await _get_nr_session()
+        headers = {"Content-Type": "application/json"}
+
+        async def _auth_and_fetch_flows() -> list:
+            if username and password:
+                token = await _get_nr_token(session, node_red_url, username, password)
+                headers["Authorization"] = f"Bearer {token}"
+            return await _get_existing_flows(session, node_red_url, headers)
+
+        # The pull has to land before the flow file is read, but the admin API
+        # round trips don't depend on either, so overlap them with the pull.
         dashboard_dir = os.path.abspath(os.path.dirname(__file__))
-        try:
-            result = subprocess.run(['git', 'pull'], cwd=dashboard_dir, check=True, capture_output=True, text=True)
-        except subprocess.CalledProcessError as e:
-            logger.warning(f"Git pull failed: {e}")
-            # Continue even if git pull fails
+        if AUTO_PULL_ENABLED:
+            _, existing_flows = await asyncio.gather(_git_pull(dashboard_dir), _auth_and_fetch_flows())
+        else:
+            existing_flows = await _auth_and_fetch_flows()
 
         flow_json_path = f"../../dashboard/{flow_json_name}"
         flow_path = os.path.abspath(os.path.join(os.path.dirname(__file__), flow_json_path))
@@ -125,37 +437,45 @@ async def deploy_nodered_flow(flow_json_name: str) -> str:
         if not os.path.exists(flow_path):
             return create_response(False, message=f"Flow file not found: {flow_json_name}")
 
-        # Read the JSON content from the file
         try:
-            with open(flow_path, 'r') as file:
-                flow_data = json.load(file)
-        except json.JSONDecodeError as e:
+            flow_id, flow_label, flow_body = await asyncio.to_thread(_load_flow, flow_path)
+        except orjson.JSONDecodeError as e:
             return create_response(False, message=f"Invalid JSON: {str(e)}")
+        except ValueError as e:
+            return create_response(False, message=f"{e} in {flow_json_name}")
         except Exception as e:
             return create_response(False, message=f"Error reading file: {str(e)}")
 
-        # Validate flow_data is either a list or a dict
-        if not isinstance(flow_data, (list, dict)):
-            return create_response(False, message=f"Flow JSON must be a list or dict, got {type(flow_data).__name__}")
-
-        # If it's a single flow object, wrap it in a list
-        if isinstance(flow_data, dict):
-            flow_data = [flow_data]
-
-        # Create SSL context
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
-
-        # The rest of the function remains largely the same but with simplified response
-        # ... (skipping the HTTP client code for brevity, but it would be updated to use create_response)
-
-        # At the end of successful deployment:
+        # One pass over the server's flows; membership is then a dict lookup.
+        server_tabs = {f.get("id"): f.get("label") for f in existing_flows if f.get("type") == "tab"}
+        flow_exists = flow_id in server_tabs
+        if not flow_exists and flow_label in server_tabs.values():
+            logger.warning(f"Creating tab {flow_id} '{flow_label}' alongside an existing tab with the same label")
+
+        # headers already carry the application/json content type for the
+        # pre-encoded body.
+        if flow_exists:
+            operation = "update"
+            request = session.put(f"{node_red_url}/flow/{flow_id}", headers=headers, data=flow_body)
+        else:
+            operation = "create"
+            request = session.post(f"{node_red_url}/flow", headers=headers, data=flow_body)
+
+        async with request as deploy_response:
+            if deploy_response.status == 401:
+                # Token revoked or Node-RED restarted — drop it so the next deploy re-auths
+                _nr_token_cache["token"] = None
+            if deploy_response.status not in (200, 204):
+                error_text = await deploy_response.text()
+                return create_response(False, message=f"Failed to {operation} flow ({deploy_response.status}): {error_text}")
+
+        _invalidate_nr_flows_cache()
         return create_response(True, {
-            "operation": "create",
+            "operation": operation,
+            "flow_id": flow_id,
             "flow_name": flow_json_name
         })
 
     except Exception as e:
-        logging.exception("Unhandled exception")
+        logger.exception("Node-RED deploy of %s failed", flow_json_name)
         return create_response(False, message=f"Deployment error: {str(e)}")
@@ -0,0 +1,129 @@
+"""Shared fakes for the tool tests: in-memory stand-ins for the Mongo collections tools.py uses."""
+import threading
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+
+class FakeResult:
+    modified_count = 1
+    deleted_count = 1
+
+
+class FakeDatabase:
+    name = "user_test"
+
+
+class FakeCursor(list):
+    """A materialized find() result that accepts the cursor chain tools.py builds."""
+    sorted_by = None
+    batch = None
+
+    def sort(self, *args):
+        self.sorted_by = args[0] if args else None
+        return self
+
+    def skip(self, n):
+        return self
+
+    def limit(self, n):
+        return self
+
+    def batch_size(self, n):
+        self.batch = n
+        return self
+
+
+class FakeCollection:
+    """
+    One pymongo collection, in memory.
+
+    doc backs the point calls (find_one, update_one, delete_one); docs backs
+    find(). Calls are recorded: reads counts find_one, finds keeps each
+    (filter, projection), batches and bulk_calls keep the bulk writes, and
+    threads the thread every blocking call ran on.
+    """
+    database = FakeDatabase()
+
+    def __init__(self, doc=None, docs=None, fail_index=None):
+        self.doc = doc
+        self.docs = docs or []
+        self.fail_index = fail_index
+        self.reads = 0
+        self.finds = []
+        self.cursors = []
+        self.batches = []
+        self.bulk_calls = []
+        self.threads = []
+
+    def _called(self):
+        self.threads.append(threading.get_ident())
+
+    def find_one(self, query, projection=None):
+        self._called()
+        self.reads += 1
+        if self.doc is None:
+            return None
+        for key, value in query.items():
+            if not isinstance(value, dict) and self.doc.get(key) != value:
+                return None
+        return dict(self.doc)
+
+    def find(self, query_filter, projection=None):
+        self._called()
+        self.finds.append((query_filter, projection))
+        cursor = FakeCursor(dict(doc) for doc in self.docs)
+        self.cursors.append(cursor)
+        return cursor
+
+    def insert_one(self, doc):
+        self._called()
+
+    def insert_many(self, docs, ordered=True):
+        self._called()
+        self.batches.append((list(docs), ordered))
+        if self.fail_index is not None:
+            raise BulkWriteError({"writeErrors": [{"index": self.fail_index}]})
+
+    def update_one(self, query, update, upsert=False):
+        self._called()
+        if self.doc is not None and "$set" in update:
+            self.doc.update(update["$set"])
+        return FakeResult()
+
+    def bulk_write(self, ops, ordered=True):
+        self._called()
+        self.bulk_calls.append((ops, ordered))
+
+    def delete_one(self, query):
+        self._called()
+        self.doc = None
+        return FakeResult()
+
+    def find_one_and_delete(self, query):
+        doc, self.doc = self.find_one(query), None
+        return doc
+
+
+@pytest.fixture
+def use_collections(monkeypatch):
+    """
+    Serve the given fakes from db_connection.get_collections.
+
+    use_collections(todos=FakeCollection(...)) returns the mapping, so a test
+    can add collections to it afterwards.
+    """
+    from Omnispindle import tools
+
+    def install(**collections):
+        collections.setdefault("database", FakeDatabase())
+        monkeypatch.setattr(tools.db_connection, "get_collections", lambda user=None: collections)
+        return collections
+    return install
+
+
+@pytest.fixture
+def no_tag_cache(monkeypatch):
+    """Skip the lesson tag cache invalidation lesson writes trigger."""
+    from Omnispindle import tools
+    monkeypatch.setattr(tools, "invalidate_lesson_tags_cache", lambda ctx=None: None)
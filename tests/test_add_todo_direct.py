@@ -1,6 +1,4 @@
-import unittest
-import asyncio
-from unittest.mock import MagicMock
+import pytest
 
 # Add src to path to allow direct import
 import sys
@@ -10,28 +8,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 from Omnispindle import tools
 from Omnispindle.context import Context
 
-class TestAddTodoDirect(unittest.TestCase):
 
-    def test_add_todo_directly(self):
-        """
-        Test that we can add a todo directly without the stdio_server.
-        """
-        async def run_test():
-            # Mock the context object
-            mock_ctx = Context(user={'email': 'test@test.com', 'sub': 'test|123'})
-            
-            # Call the add_todo tool directly
-            result = await tools.add_todo(
-                description="This is a direct test",
-                project="Omnispindle",
-                ctx=mock_ctx
-            )
-            
-            print(f"Result from add_todo: {result}")
-            self.assertIn("success", result)
+@pytest.mark.asyncio
+async def test_add_todo_directly():
+    """
+    Test that we can add a todo directly without the stdio_server.
+    """
+    # Mock the context object
+    mock_ctx = Context(user={'email': 'test@test.com', 'sub': 'test|123'})
 
-        # Run the async test
-        asyncio.run(run_test())
+    # Call the add_todo tool directly
+    result = await tools.add_todo(
+        description="This is a direct test",
+        project="Omnispindle",
+        ctx=mock_ctx
+    )
 
-if __name__ == '__main__':
-    unittest.main() 
+    print(f"Result from add_todo: {result}")
+    assert "success" in result
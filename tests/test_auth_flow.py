@@ -1,7 +1,7 @@
+import asyncio
 import unittest
 from unittest.mock import patch, MagicMock, mock_open
 import os
-import time
 import threading
 from http.server import HTTPServer
 from pathlib import Path
@@ -35,8 +35,8 @@ class TestAuthFlow(unittest.TestCase):
         self.env_patcher.stop()
 
     @patch('webbrowser.open')
-    @patch('src.Omnispindle.auth_flow.save_token_to_env')
-    @patch('src.Omnispindle.auth_flow.start_callback_server')
+    @patch('Omnispindle.auth_flow.save_token_to_env')
+    @patch('Omnispindle.auth_flow.start_callback_server')
     def test_full_authentication_flow(self, mock_start_server, mock_save_token, mock_webbrowser_open):
         """
         Test the full browser-based authentication flow from start to finish.
@@ -46,10 +46,17 @@ class TestAuthFlow(unittest.TestCase):
         # Mock the server to prevent it from actually starting
         mock_server_instance = MagicMock()
         mock_server_instance.token = None
-        mock_start_server.return_value = mock_server_instance
+        # The flow starts waiting right after the callback server is up
+        waiting = threading.Event()
+
+        def start_server():
+            waiting.set()
+            return mock_server_instance
+
+        mock_start_server.side_effect = start_server
         
         def simulate_callback():
-            time.sleep(0.5) # give the main thread a moment to start waiting
+            waiting.wait(timeout=2)
             mock_server_instance.token = self.test_token
             
         # --- Test Execution ---
@@ -57,7 +64,8 @@ class TestAuthFlow(unittest.TestCase):
         callback_thread = threading.Thread(target=simulate_callback)
         callback_thread.start()
         
-        result_token = auth_flow.authenticate_user()
+        result_token = asyncio.run(auth_flow.authenticate_user())
+        callback_thread.join()
         
         # --- Assertions ---
 
@@ -66,7 +74,7 @@ class TestAuthFlow(unittest.TestCase):
         mock_save_token.assert_called_once_with(self.test_token)
         mock_server_instance.shutdown.assert_called_once()
 
-    @patch('builtins.open', new_callable=mock_open, read_data='EXISTING_KEY=some_value\\n')
+    @patch('builtins.open', new_callable=mock_open, read_data='EXISTING_KEY=some_value\n')
     @patch.dict(os.environ, {})
     def test_save_token_to_env_file(self, mock_file):
         """
@@ -90,12 +98,12 @@ class TestAuthFlow(unittest.TestCase):
         
         handle = mock_file()
         
-        # Get all writes and join them
-        written_content = "".join(call[0][0] for call in handle.write.call_args_list)
+        # The whole file goes out in one write
+        handle.write.assert_called_once()
+        written_content = handle.write.call_args[0][0]
 
         # Verify the new token is in the content and old content is preserved
-        self.assertIn(f"AUTH0_TOKEN={test_token}\\n", written_content)
-        self.assertIn("EXISTING_KEY=some_value\\n", written_content)
+        self.assertEqual(written_content, f"EXISTING_KEY=some_value\nAUTH0_TOKEN={test_token}\n")
         
         # Verify the environment variable was set in the current process
         self.assertEqual(os.environ['AUTH0_TOKEN'], test_token)
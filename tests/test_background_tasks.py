@@ -0,0 +1,123 @@
+"""Tests for fire-and-forget helpers in utils."""
+import asyncio
+
+from Omnispindle import utils
+
+
+def test_emit_status_does_not_wait_for_publish(monkeypatch):
+    gate = asyncio.Event()
+    published = []
+
+    async def slow_publish(topic, message, ctx=None, retain=False):
+        await gate.wait()
+        published.append(topic)
+        return True
+
+    monkeypatch.setattr(utils, "mqtt_publish", slow_publish)
+
+    async def scenario():
+        utils.emit_status("status/test", "hello")
+        assert published == []  # caller returned before the publish ran
+        gate.set()
+        await asyncio.sleep(utils.STATUS_BATCH_WINDOW * 3)
+        await utils.stop_status_flusher()
+
+    asyncio.run(scenario())
+    assert published == ["status/test"]
+    assert utils._background_tasks == set()
+
+
+def test_emit_status_batches_through_one_flusher(monkeypatch):
+    published = []
+
+    async def record_publish(topic, message, ctx=None, retain=False):
+        published.append((topic, message))
+        return True
+
+    monkeypatch.setattr(utils, "mqtt_publish", record_publish)
+
+    async def scenario():
+        for i in range(5):
+            utils.emit_status("status/test", i)
+        assert len(utils._background_tasks) == 1  # one flusher, not a task per message
+        await asyncio.sleep(utils.STATUS_BATCH_WINDOW * 3)
+        await utils.stop_status_flusher()
+
+    asyncio.run(scenario())
+    assert published == [("status/test", i) for i in range(5)]
+
+
+def test_stop_status_flusher_drains_the_queue(monkeypatch):
+    published = []
+
+    async def record_publish(topic, message, ctx=None, retain=False):
+        published.append(topic)
+        return True
+
+    monkeypatch.setattr(utils, "mqtt_publish", record_publish)
+
+    async def scenario():
+        utils.emit_status("status/a", "1")
+        utils.emit_status("status/b", "2")
+        await utils.stop_status_flusher()
+
+    asyncio.run(scenario())
+    assert published == ["status/a", "status/b"]
+
+
+def test_stop_status_flusher_finishes_the_in_flight_batch(monkeypatch):
+    started = asyncio.Event()
+    published = []
+
+    async def slow_publish(topic, message, ctx=None, retain=False):
+        started.set()
+        await asyncio.sleep(0.01)
+        published.append(topic)
+        return True
+
+    monkeypatch.setattr(utils, "mqtt_publish", slow_publish)
+
+    async def scenario():
+        utils.emit_status("status/a", "1")
+        utils.emit_status("status/b", "2")
+        await started.wait()  # the flusher has taken both off the queue
+        await utils.stop_status_flusher()
+
+    asyncio.run(scenario())
+    assert published == ["status/a", "status/b"]
+
+
+def test_background_failure_is_logged_not_raised(caplog):
+    async def boom():
+        raise ValueError("broker gone")
+
+    async def scenario():
+        utils.spawn_background(boom(), "test publish")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+    assert "Background test publish failed: broker gone" in caplog.text
+
+
+def test_spawn_without_loop_is_a_no_op():
+    async def never():
+        raise AssertionError("should not run")
+
+    assert utils.spawn_background(never(), "orphan") is None
+
+
+def test_emit_status_is_a_no_op_when_disabled(monkeypatch):
+    monkeypatch.setattr(utils, "STATUS_ENABLED", False)
+
+    async def scenario():
+        utils.emit_status("status/test", {"big": "payload"})
+        return utils._status_queue
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_encode_payload_serializes_dicts_as_json():
+    assert utils.encode_payload({"a": 1}) == b'{"a":1}'
+    assert utils.encode_payload(b"raw") == b"raw"
+    assert utils.encode_payload("text") == b"text"
@@ -0,0 +1,178 @@
+"""Tests for add_todos / add_lessons — one insert_many per batch."""
+import asyncio
+import json
+import threading
+
+import pytest
+
+from Omnispindle import tools
+from Omnispindle.context import Context
+from tests.conftest import FakeCollection
+
+
+CTX = Context(user={"sub": "test|bulk", "email": "bulk@test.com"})
+
+
+@pytest.fixture
+def followups(monkeypatch):
+    """Ids handed to the post-insert follow-ups; git and background work are stubbed."""
+    scheduled = []
+    monkeypatch.setattr(tools, "get_git_metadata", lambda: {"branch": "main"})
+    monkeypatch.setattr(tools, "_schedule_todo_followups", lambda todo, *a, **kw: scheduled.append(todo["id"]))
+    monkeypatch.setattr(tools, "_track_background", lambda name, coro, ref: coro.close())
+    return scheduled
+
+
+def test_add_todos_single_round_trip(use_collections, followups):
+    todos = FakeCollection()
+    use_collections(todos=todos)
+    items = [{"description": f"task {i}", "project": "Omnispindle", "priority": "high"} for i in range(3)]
+    data = json.loads(asyncio.run(tools.add_todos(items, ctx=CTX)))
+
+    assert data["count"] == 3
+    assert len(todos.batches) == 1
+    docs, ordered = todos.batches[0]
+    assert ordered is False
+    assert {d["created_at"] for d in docs} == {data["created_at"]}
+    assert all(d["project"] == "omnispindle" and d["priority"] == "High" for d in docs)
+    assert all(d["metadata"]["branch"] == "main" for d in docs)
+    assert followups == data["ids"]
+
+
+def test_add_todos_reports_invalid_items_and_keeps_the_rest(use_collections, followups):
+    todos = FakeCollection()
+    use_collections(todos=todos)
+    items = [{"description": "ok", "project": "p"}, {"project": "p"}, "junk"]
+    data = json.loads(asyncio.run(tools.add_todos(items, ctx=CTX)))
+
+    assert data["count"] == 1
+    assert [e["index"] for e in data["errors"]] == [1, 2]
+
+
+def test_add_todos_partial_bulk_failure(use_collections, followups):
+    todos = FakeCollection(fail_index=1)
+    use_collections(todos=todos)
+    items = [{"description": f"task {i}", "project": "p"} for i in range(3)]
+    data = json.loads(asyncio.run(tools.add_todos(items, ctx=CTX)))
+
+    assert data["count"] == 2
+    assert len(data["errors"]) == 1
+    assert len(followups) == 2
+
+
+def test_add_todos_read_only_without_auth(use_collections, followups):
+    todos = FakeCollection()
+    use_collections(todos=todos)
+    data = json.loads(asyncio.run(tools.add_todos([{"description": "x", "project": "p"}])))
+    assert data["success"] is False
+    assert todos.batches == []
+
+
+def test_add_lessons_single_round_trip(use_collections, followups, no_tag_cache):
+    lessons = FakeCollection()
+    use_collections(lessons=lessons)
+    items = [{"language": "python", "topic": f"t{i}", "lesson_learned": "x", "tags": ["a"]} for i in range(2)]
+    data = json.loads(asyncio.run(tools.add_lessons(items, ctx=CTX)))
+
+    assert data["count"] == 2
+    assert len(lessons.batches) == 1
+    assert lessons.batches[0][1] is False
+
+
+def test_update_todos_single_bulk_write(use_collections, followups):
+    todos = FakeCollection(docs=[
+        {"id": "a", "description": "old a", "project": "p", "metadata": {"tags": ["x"]}},
+        {"id": "b", "description": "old b", "project": "p"},
+    ])
+    use_collections(todos=todos)
+    items = [
+        {"todo_id": "a", "updates": {"priority": "High", "metadata": {"effort": 3}}},
+        {"todo_id": "b", "updates": '{"notes": "json string updates"}'},
+    ]
+    data = json.loads(asyncio.run(tools.update_todos(items, ctx=CTX)))
+
+    assert data["ids"] == ["a", "b"]
+    assert len(todos.finds) == 1
+    assert len(todos.bulk_calls) == 1
+    ops, ordered = todos.bulk_calls[0]
+    assert ordered is False
+    merged = ops[0]._doc["$set"]["metadata"]
+    assert merged["tags"] == ["x"] and merged["effort"] == 3
+
+
+def test_update_todos_logs_changes_in_one_batch(monkeypatch, use_collections, followups):
+    todos = FakeCollection(docs=[
+        {"id": "a", "description": "old a", "project": "p"},
+        {"id": "b", "description": "old b", "project": "p"},
+    ])
+    use_collections(todos=todos)
+    logged = []
+
+    async def fake_batch(actions, user_context=None):
+        logged.append(actions)
+
+    monkeypatch.setattr(tools, "log_todo_batch", fake_batch)
+    monkeypatch.setattr(tools, "_track_background", lambda name, coro, ref: asyncio.get_running_loop().create_task(coro))
+    items = [{"todo_id": t, "updates": {"priority": "Low"}} for t in ("a", "b")]
+
+    async def scenario():
+        result = await tools.update_todos(items, ctx=CTX)
+        await asyncio.sleep(0)
+        return result
+
+    asyncio.run(scenario())
+    assert len(logged) == 1
+    assert [(a["operation"], a["todo_id"]) for a in logged[0]] == [("update", "a"), ("update", "b")]
+
+
+def test_update_todos_reports_bad_items(use_collections, followups):
+    todos = FakeCollection(docs=[{"id": "a", "description": "d", "project": "p"}])
+    use_collections(todos=todos)
+    items = [
+        {"todo_id": "a", "updates": {"status": "completed"}},
+        {"todo_id": "missing", "updates": {"priority": "Low"}},
+        {"updates": {"priority": "Low"}},
+    ]
+    data = json.loads(asyncio.run(tools.update_todos(items, ctx=CTX)))
+
+    assert data["success"] is False
+    assert sorted(e["index"] for e in data["data"]["errors"]) == [0, 1, 2]
+    assert todos.bulk_calls == []
+
+
+def test_add_todos_inserts_off_the_event_loop(use_collections, followups):
+    todos = FakeCollection()
+    use_collections(todos=todos)
+
+    async def scenario():
+        await tools.add_todos([{"description": "t", "project": "p"}], ctx=CTX)
+        return threading.get_ident()
+
+    assert asyncio.run(scenario()) not in todos.threads
+
+
+def test_batch_embeddings_written_in_one_bulk_write(monkeypatch):
+    todos = FakeCollection()
+
+    async def fake_embedding(text):
+        return None if text.startswith("skip") else [0.1]
+
+    monkeypatch.setattr(tools.embeddings, "generate_embedding", fake_embedding)
+    docs = [{"id": "a", "description": "keep a"}, {"id": "b", "description": "skip b"}, {"id": "c", "description": "keep c"}]
+    asyncio.run(tools._store_embeddings(todos, docs, lambda doc: doc["description"]))
+
+    assert len(todos.bulk_calls) == 1
+    ops, ordered = todos.bulk_calls[0]
+    assert ordered is False
+    assert [op._filter["id"] for op in ops] == ["a", "c"]
+
+
+def test_new_ids_are_time_ordered_uuid7():
+    from uuid import UUID
+
+    ids = [tools._new_id() for _ in range(3)]
+    assert all(UUID(i).version == 7 and i.count("-") == 4 for i in ids)
+    assert len(set(ids)) == 3
+    # the leading 48 bits are the creation millisecond, so ids never go backwards
+    stamps = [int(i.replace("-", "")[:12], 16) for i in ids]
+    assert stamps == sorted(stamps)
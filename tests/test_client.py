@@ -1,51 +1,65 @@
-from fastmcp import FastMCP
+from fastmcp import Client
 import asyncio
 import logging
-import json
+import orjson
 import sys
 import os
 from typing import Optional
 
+try:
+    import uvloop
+except ImportError:  # not installed, or Windows
+    uvloop = None
+
 # Add src directory to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
-# Configure logging
+# Configure logging: quiet by default, TEST_LOG=DEBUG for wire-level detail
+LOG_LEVEL = os.getenv("TEST_LOG", "WARNING").upper()
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=LOG_LEVEL,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
-# Also enable debug logging for FastMCP
-logging.getLogger('fastmcp').setLevel(logging.DEBUG)
-logging.getLogger('mcp').setLevel(logging.DEBUG)
+# FastMCP and the MCP SDK follow the same level
+logging.getLogger('fastmcp').setLevel(LOG_LEVEL)
+logging.getLogger('mcp').setLevel(LOG_LEVEL)
 
+# fastmcp 2.2.8 clients and servers speak SSE over HTTP. Start the server with
+#   fastmcp run src/Omnispindle/http_server.py --transport sse
+# which serves /sse on port 8000; plain `make run` serves stdio only.
 class TodoClient:
-    def __init__(self, host: str = "localhost", port: int = 1883):
+    def __init__(self, host: str = "localhost", port: int = 8000, connect_timeout: float = 2.0):
         self.host = host
         self.port = port
-        self.client: Optional[FastMCP] = None
+        self.connect_timeout = connect_timeout
+        self.client: Optional[Client] = None
 
     async def connect(self) -> bool:
-        """Connect to the FastMCP server"""
+        """Open an SSE session with the FastMCP server"""
         try:
-            logger.debug(f"Connecting to FastMCP server at {self.host}:{self.port}")
-            self.client = FastMCP(
-                "todo_test_client",
-                mqtt_host=self.host,
-                mqtt_port=self.port
-            )
-            logger.debug("FastMCP client created")
-
-            # Wait for connection
-            await asyncio.sleep(2)
-            logger.debug("Connection wait complete")
+            url = f"http://{self.host}:{self.port}/sse"
+            logger.debug("Connecting to FastMCP server at %s", url)
+            client = Client(url)
+            # Entering the client runs the MCP initialize handshake, so the
+            # session is ready as soon as this returns; the cap keeps a dead
+            # server from hanging the run
+            await asyncio.wait_for(client.__aenter__(), timeout=self.connect_timeout)
+            self.client = client
+            logger.debug("FastMCP session initialized")
 
             return True
         except Exception as e:
             logger.error(f"Failed to connect: {str(e)}", exc_info=True)
             return False
 
+    async def close(self) -> None:
+        """Close the MCP session"""
+        if self.client:
+            await self.client.__aexit__(None, None, None)
+            self.client = None
+
     async def add_todo(self, description: str, project: str, priority: str = "high", target_agent: str = "test_client", metadata: dict = None) -> dict:
         """Add a new todo item"""
         if not self.client:
@@ -63,12 +77,12 @@ class TodoClient:
             if metadata:
                 args["metadata"] = metadata
                 
-            logger.debug(f"Adding todo with args: {args}")
+            logger.debug("Adding todo with args: %s", args)
 
             result = await self.client.call_tool("add_todo", args)
-            logger.debug(f"Add todo result: {result}")
+            logger.debug("Add todo result: %s", result)
 
-            return json.loads(result)
+            return orjson.loads(result[0].text)
         except Exception as e:
             logger.error(f"Failed to add todo: {str(e)}", exc_info=True)
             return {"status": "error", "message": str(e)}
@@ -84,12 +98,12 @@ class TodoClient:
                 "project": projection,
                 "limit": limit
             }
-            logger.debug(f"Querying todos with args: {args}")
+            logger.debug("Querying todos with args: %s", args)
 
             result = await self.client.call_tool("query_todos", args)
-            logger.debug(f"Query result: {result}")
+            logger.debug("Query result: %s", result)
 
-            return json.loads(result)
+            return orjson.loads(result[0].text)
         except Exception as e:
             logger.error(f"Failed to query todos: {str(e)}", exc_info=True)
             return {"status": "error", "message": str(e)}
@@ -142,11 +156,14 @@ async def run_tests():
     except Exception as e:
         logger.error(f"Test failed: {str(e)}", exc_info=True)
         return 1
+    finally:
+        await client.close()
 
 def main():
     """Main entry point"""
     logger.info("Starting FastMCP Todo Client Tests")
-    return asyncio.run(run_tests())
+    run = uvloop.run if uvloop else asyncio.run
+    return run(run_tests())
 
 if __name__ == "__main__":
     sys.exit(main())
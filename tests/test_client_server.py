@@ -46,12 +46,18 @@ async def main():
             )
             print("\nQuery todos result:", result)
 
-@pytest.fixture
+# Keep this module on one xdist worker so the module-scoped app is built once
+pytestmark = pytest.mark.xdist_group("client_server")
+
+# One app per module: every test creates the todos it touches, so they can
+# share the route table instead of rebuilding it per test
+@pytest.fixture(scope="module")
 def test_client():
     app = create_app()
-    return TestClient(app)
+    with TestClient(app) as client:
+        yield client
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mcp_server():
     server = FastMCPServer()
     return server
@@ -94,6 +94,14 @@ def test_compact_todo_list_handles_none_entries():
     assert len(out) == 2  # None dropped
 
 
+def test_compact_todo_list_consumes_an_iterator():
+    # query_todos hands the cursor straight in rather than list(cursor)
+    docs = iter([SAMPLE_TODO, dict(SAMPLE_TODO, id="other")])
+    out = compact_todo_list(docs, brief=True)
+    assert [d["id"] for d in out] == [SAMPLE_TODO["id"], "other"]
+    assert all("notes" not in d for d in out)
+
+
 def test_brief_response_is_substantially_smaller():
     full = json.dumps(compact_todo(SAMPLE_TODO))
     brief = json.dumps(compact_todo(SAMPLE_TODO, brief=True))
@@ -156,6 +164,14 @@ def test_iso_dates_skips_non_epoch_values():
     assert "created_at_iso" not in out
 
 
+def test_iso_dates_match_datetime_rendering():
+    doc = {"id": "x", "created_at": 1767323045, "updated_at": 1767323045.25, "completed_at": 2**40}
+    out = compact_todo(doc, iso_dates=True)
+    assert out["created_at_iso"] == "2026-01-02T03:04:05Z"
+    assert out["updated_at_iso"] == "2026-01-02T03:04:05.250000Z"
+    assert "completed_at_iso" not in out  # past year 9999
+
+
 def test_compact_todo_list_passes_iso_flag():
     out = compact_todo_list([SAMPLE_TODO], iso_dates=True)
     assert "created_at_iso" in out[0]
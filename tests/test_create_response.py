@@ -1,6 +1,8 @@
 """Tests for create_response envelope — no redundant agent_context block."""
+import asyncio
 import json
 
+from Omnispindle import tools
 from Omnispindle.utils import create_response
 
 
@@ -42,3 +44,24 @@ def test_collection_response_has_no_context():
 
 def test_data_omitted_when_none():
     assert json.loads(create_response(True)) == {"success": True}
+
+
+def test_bson_and_datetime_values_serialize():
+    from datetime import datetime, timezone
+    from bson import ObjectId
+
+    oid = ObjectId()
+    when = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    out = json.loads(create_response(True, {"_id": oid, "created": when}))
+    assert out["data"] == {"_id": str(oid), "created": "2026-01-02T03:04:05+00:00"}
+
+
+def test_demo_refusals_are_prebuilt_responses():
+    result = asyncio.run(tools.delete_todo("any-id", ctx=None))
+    assert result is tools._DEMO_DELETE_REFUSED
+    assert json.loads(result) == {"success": False, "message": "Demo mode: Todo deletion is disabled. Please authenticate to delete todos."}
+
+
+def test_message_only_response_has_no_data_key():
+    result = create_response(False, message="No valid fields to update")
+    assert json.loads(result) == {"success": False, "message": "No valid fields to update"}
@@ -0,0 +1,26 @@
+"""Tests for the shared embeddings HTTP client."""
+import asyncio
+
+from Omnispindle import embeddings
+
+
+def test_client_reused_within_a_loop_and_closed_on_shutdown():
+    async def scenario():
+        first = embeddings._get_http_client()
+        assert embeddings._get_http_client() is first
+        await embeddings.close_http_client()
+        return first
+
+    client = asyncio.run(scenario())
+    assert client.is_closed
+    assert embeddings._http_client is None
+
+
+def test_client_rebuilt_for_a_new_loop():
+    async def grab():
+        return embeddings._get_http_client()
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert second is not first
+    asyncio.run(embeddings.close_http_client())
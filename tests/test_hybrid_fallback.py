@@ -0,0 +1,22 @@
+"""Tests for hybrid mode's API-first call with local fallback."""
+import asyncio
+
+from Omnispindle import hybrid_tools
+from Omnispindle.utils import create_response
+
+
+def test_failure_response_falls_back_to_local(monkeypatch):
+    config = hybrid_tools.HybridConfig()
+    config.mode = hybrid_tools.OmnispindleMode.HYBRID
+    config.fallback_enabled = True
+    monkeypatch.setattr(hybrid_tools, "_hybrid_config", config)
+
+    async def api_func(ctx=None):
+        return create_response(False, message="API said no")
+
+    async def local_func(ctx=None):
+        return create_response(True, {"source": "local"})
+
+    result = asyncio.run(hybrid_tools._execute_with_fallback("op", api_func, local_func))
+    assert '"source":"local"' in result
+    assert config.api_failures == 1
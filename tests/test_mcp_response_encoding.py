@@ -6,7 +6,7 @@ quote escaped (~10-15% token overhead) and forcing clients to parse twice.
 """
 import json
 
-from Omnispindle.mcp_handler import _as_text
+from Omnispindle.mcp_handler import ORJSONResponse, _as_text
 
 
 SAMPLE_PAYLOAD = {
@@ -50,3 +50,15 @@ def test_single_encoding_is_smaller_than_double_encoding():
     double_encoded = json.dumps(tool_result, default=str)
 
     assert len(_as_text(tool_result)) < len(double_encoded)
+
+
+def test_envelope_rendered_by_orjson_matches_stdlib():
+    envelope = {
+        "jsonrpc": "2.0",
+        "id": 7,
+        "result": {"content": [{"type": "text", "text": _as_text(json.dumps(SAMPLE_PAYLOAD))}]},
+    }
+    response = ORJSONResponse(content=envelope)
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == envelope
+    assert json.loads(json.loads(response.body)["result"]["content"][0]["text"]) == SAMPLE_PAYLOAD
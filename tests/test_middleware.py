@@ -5,8 +5,9 @@ from starlette.applications import Starlette
 from starlette.responses import PlainTextResponse
 from starlette.testclient import TestClient
 from starlette.middleware import Middleware
+from starlette.routing import Route
 
-from Omnispindle.middleware import ConnectionErrorsMiddleware, NoneTypeResponseMiddleware
+from Omnispindle.middleware import ConnectionErrorsMiddleware, NoneTypeResponseMiddleware, JSONGZipMiddleware
 
 def test_middleware_handles_disconnected_requests():
     """Test that the middleware properly handles disconnected requests."""
@@ -114,3 +115,23 @@ def test_none_type_response_middleware():
     # This should be caught by the middleware and return a 204 response
     response = client.get("/none_response")
     assert response.status_code == 204 
+
+
+def test_json_gzip_middleware_skips_sse_paths():
+    """Large JSON is gzipped; SSE paths go out uncompressed."""
+    body = "x" * 4096
+
+    async def endpoint(request):
+        return PlainTextResponse(body)
+
+    app = Starlette(routes=[Route("/api/mcp", endpoint), Route("/api/mcp/sse", endpoint)])
+    app.add_middleware(JSONGZipMiddleware)
+    client = TestClient(app)
+
+    response = client.get("/api/mcp", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == body
+
+    response = client.get("/api/mcp/sse", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.text == body
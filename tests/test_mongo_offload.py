@@ -0,0 +1,80 @@
+"""Tests that tool handlers run their Mongo round trips off the event loop."""
+import asyncio
+import json
+import threading
+
+import pytest
+
+from Omnispindle import tools
+from Omnispindle.context import Context
+from tests.conftest import FakeCollection
+
+CTX = Context(user={"sub": "test|offload", "email": "offload@test.com"})
+
+pytestmark = pytest.mark.usefixtures("no_tag_cache")
+
+
+def test_get_lesson_reads_in_worker_thread(use_collections):
+    tools.invalidate_point_read_cache()
+    lessons = FakeCollection({"id": "lesson-1", "topic": "t", "lesson_learned": "l", "tags": []})
+    use_collections(lessons=lessons)
+
+    async def scenario():
+        await tools.get_lesson("lesson-1", ctx=CTX)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+    tools.invalidate_point_read_cache()
+    assert lessons.threads and loop_thread not in lessons.threads
+
+
+def test_update_lesson_writes_in_worker_thread(use_collections):
+    lessons = FakeCollection()
+    use_collections(lessons=lessons)
+
+    async def scenario():
+        await tools.update_lesson("lesson-1", {"topic": "new"}, ctx=CTX)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+    assert lessons.threads and loop_thread not in lessons.threads
+
+
+def test_get_explanation_reads_in_worker_thread(use_collections):
+    explanations = FakeCollection({"topic": "t", "content": "c"})
+    use_collections(explanations=explanations)
+
+    async def scenario():
+        await tools.get_explanation("t", ctx=CTX)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+    assert explanations.threads and loop_thread not in explanations.threads
+
+
+def test_complete_todo_refuses_an_already_completed_todo(monkeypatch, use_collections):
+    todos = FakeCollection({"id": "t-1", "status": "completed", "created_at": 0})
+    use_collections(todos=todos)
+    monkeypatch.setattr(tools, "get_git_metadata", lambda: (_ for _ in ()).throw(AssertionError("git ran")))
+
+    data = json.loads(asyncio.run(tools.complete_todo("t-1", ctx=CTX)))
+    assert data["success"] is False and "already completed" in data["message"]
+    assert len(todos.threads) == 1  # the read, no write
+
+
+def test_regenerate_embedding_reads_and_writes_in_worker_thread(monkeypatch, use_collections):
+    lessons = FakeCollection({"id": "lesson-1", "topic": "t", "lesson_learned": "l"})
+    use_collections(lessons=lessons)
+
+    async def fake_embedding(text):
+        return [0.1]
+
+    monkeypatch.setattr(tools.embeddings, "is_available", lambda: True)
+    monkeypatch.setattr(tools.embeddings, "generate_embedding", fake_embedding)
+
+    async def scenario():
+        await tools.regenerate_embedding("lesson-1", ctx=CTX)
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(scenario())
+    assert len(lessons.threads) == 2 and loop_thread not in lessons.threads
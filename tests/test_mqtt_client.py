@@ -0,0 +1,150 @@
+"""Tests for the shared persistent MQTT client."""
+import asyncio
+
+import pytest
+
+from Omnispindle import mqtt, utils
+
+
+class _Info:
+    def __init__(self, rc):
+        self.rc = rc
+
+
+class _FakeClient:
+    instances = []
+
+    def __init__(self, *args, **kwargs):
+        self.published = []
+        self.connected_to = None
+        self.rc = mqtt.paho.MQTT_ERR_SUCCESS
+        _FakeClient.instances.append(self)
+
+    def connect_async(self, host, port, keepalive=60):
+        self.connected_to = (host, port)
+
+    def loop_start(self):
+        pass
+
+    def loop_stop(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def publish(self, topic, payload, qos=0, retain=False):
+        self.published.append((topic, payload, retain))
+        return _Info(self.rc)
+
+
+@pytest.fixture(autouse=True)
+def fake_paho(monkeypatch):
+    _FakeClient.instances = []
+    mqtt.close_mqtt_clients()
+    monkeypatch.setattr(mqtt.paho, "Client", _FakeClient)
+    yield
+    mqtt.close_mqtt_clients()
+
+
+def test_client_created_once_per_broker():
+    first = mqtt.get_mqtt_client("broker", 1883)
+    assert mqtt.get_mqtt_client("broker", 1883) is first
+    assert mqtt.get_mqtt_client("other", 1883) is not first
+    assert first.connected_to == ("broker", 1883)
+
+
+def test_publish_reuses_the_connection():
+    for i in range(3):
+        assert asyncio.run(mqtt.mqtt_publish("status/test", f"msg {i}"))
+    assert len(_FakeClient.instances) == 1
+    assert [p[1] for p in _FakeClient.instances[0].published] == ["msg 0", "msg 1", "msg 2"]
+
+
+def test_publish_while_disconnected_reports_failure():
+    mqtt.get_mqtt_client().rc = mqtt.paho.MQTT_ERR_NO_CONN
+    assert asyncio.run(mqtt.mqtt_publish("status/test", "dropped")) is False
+
+
+class _RecordingCtx:
+    def __init__(self):
+        self.lines = []
+
+    async def info(self, text):
+        self.lines.append(("info", text))
+
+    async def error(self, text):
+        self.lines.append(("error", text))
+
+
+def test_publish_logs_to_live_context():
+    ctx = _RecordingCtx()
+    assert asyncio.run(mqtt.mqtt_publish("status/test", "hi", ctx))
+    assert ctx.lines == [("info", "MQTT published to status/test: hi (retain=False)")]
+
+
+def test_context_log_skipped_without_context():
+    class _Unformattable:
+        def __str__(self):
+            raise AssertionError("formatted without a context")
+
+    asyncio.run(mqtt._ctx_log(None, "info", "%s", _Unformattable()))
+
+
+def test_status_publish_uses_the_shared_client():
+    for payload in ({"status": "ok"}, b"raw"):
+        assert asyncio.run(utils.mqtt_publish("status/test", payload, retain=True))
+    client = mqtt.get_mqtt_client(utils.MQTT_HOST, utils.MQTT_PORT)
+    assert client.published == [("status/test", b'{"status":"ok"}', True), ("status/test", b"raw", True)]
+
+
+def test_get_without_mosquitto_sub_returns_none(monkeypatch):
+    async def missing(*cmd, **kwargs):
+        raise FileNotFoundError("mosquitto_sub")
+
+    monkeypatch.setattr(mqtt.asyncio, "create_subprocess_exec", missing)
+    assert asyncio.run(mqtt.mqtt_get("status/x")) is None
+
+
+def test_hanging_get_is_killed(monkeypatch):
+    class _Hang:
+        returncode = None
+        killed = False
+
+        async def communicate(self):
+            await asyncio.sleep(10)
+
+        def kill(self):
+            self.killed = True
+
+        async def wait(self):
+            return -9
+
+    proc = _Hang()
+
+    async def fake_exec(*cmd, **kwargs):
+        return proc
+
+    monkeypatch.setattr(mqtt.asyncio, "create_subprocess_exec", fake_exec)
+    with pytest.raises(mqtt.subprocess.TimeoutExpired):
+        asyncio.run(mqtt._sub_once("status/x", timeout=0.01))
+    assert proc.killed
+
+
+def test_utils_get_reads_from_the_utils_broker(monkeypatch):
+    seen = []
+
+    class _Done:
+        returncode = 0
+
+        async def communicate(self):
+            return b"on\n", b""
+
+    async def fake_exec(*cmd, **kwargs):
+        seen.append(cmd)
+        return _Done()
+
+    monkeypatch.setattr(mqtt.asyncio, "create_subprocess_exec", fake_exec)
+    assert asyncio.run(utils.mqtt_get("status/x")) == "on"
+    cmd = seen[0]
+    assert cmd[cmd.index("-h") + 1] == utils.MQTT_HOST
+    assert cmd[cmd.index("-p") + 1] == str(utils.MQTT_PORT)
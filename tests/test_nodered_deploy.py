@@ -0,0 +1,177 @@
+"""Tests for the Node-RED deploy helpers — admin token and flow list are cached."""
+import asyncio
+
+import pytest
+
+from Omnispindle import utils
+
+
+class _FakeResponse:
+    def __init__(self, status=200, text="", json_data=None):
+        self.status = status
+        self._text = text
+        self._json = json_data
+
+    async def text(self):
+        return self._text
+
+    async def json(self, loads=None, **kwargs):
+        if self._json is not None:
+            return self._json
+        return loads(self._text.encode())
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    """Records each request so tests can count round trips."""
+
+    def __init__(self, token_text='{"access_token": "tok", "expires_in": 604800}', flows=None):
+        self.token_text = token_text
+        self.flows = flows or []
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append(("POST", url))
+        return _FakeResponse(text=self.token_text)
+
+    def get(self, url, **kwargs):
+        self.calls.append(("GET", url))
+        return _FakeResponse(json_data=self.flows)
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    utils._nr_token_cache.update(token=None, expires_at=0)
+    utils._invalidate_nr_flows_cache()
+    yield
+    utils._nr_token_cache.update(token=None, expires_at=0)
+    utils._invalidate_nr_flows_cache()
+
+
+def test_token_reused_until_expiry():
+    session = _FakeSession()
+    for _ in range(3):
+        token = asyncio.run(utils._get_nr_token(session, "http://nr", "u", "p"))
+        assert token == "tok"
+    assert session.calls == [("POST", "http://nr/auth/token")]
+
+
+def test_token_refreshed_near_expiry():
+    session = _FakeSession()
+    utils._nr_token_cache.update(token="stale", expires_at=utils.time.time() + 10)
+    token = asyncio.run(utils._get_nr_token(session, "http://nr", "u", "p"))
+    assert token == "tok"
+    assert len(session.calls) == 1
+
+
+def test_flows_cached_for_back_to_back_deploys():
+    session = _FakeSession(flows=[{"id": "tab1", "type": "tab"}])
+    for _ in range(3):
+        flows = asyncio.run(utils._get_existing_flows(session, "http://nr", {}))
+        assert flows == [{"id": "tab1", "type": "tab"}]
+    assert session.calls == [("GET", "http://nr/flows")]
+
+
+def test_flows_refetched_after_invalidation():
+    session = _FakeSession(flows=[])
+    asyncio.run(utils._get_existing_flows(session, "http://nr", {}))
+    utils._invalidate_nr_flows_cache()
+    asyncio.run(utils._get_existing_flows(session, "http://nr", {}))
+    assert len(session.calls) == 2
+
+
+def test_git_pull_failure_is_not_fatal(tmp_path, caplog):
+    # tmp_path is not a git checkout, so the pull exits non-zero
+    asyncio.run(utils._git_pull(str(tmp_path)))
+    assert "Git pull failed" in caplog.text
+
+
+def test_hanging_git_pull_is_killed(monkeypatch, caplog):
+    class _HangingProc:
+        killed = False
+        returncode = None
+
+        async def communicate(self):
+            await asyncio.sleep(3600)
+
+        def kill(self):
+            self.killed = True
+
+        async def wait(self):
+            return -9
+
+    proc = _HangingProc()
+
+    async def fake_exec(*args, **kwargs):
+        return proc
+
+    monkeypatch.setattr(utils.asyncio, "create_subprocess_exec", fake_exec)
+    asyncio.run(utils._git_pull("/nowhere", timeout=0.01))
+    assert proc.killed
+    assert "timed out" in caplog.text
+
+
+def test_non_json_token_response_reported():
+    session = _FakeSession(token_text="<html>proxy error</html>")
+    with pytest.raises(RuntimeError, match="not JSON: <html>"):
+        asyncio.run(utils._get_nr_token(session, "http://nr", "u", "p"))
+
+
+def test_flow_file_prepared_once_until_it_changes(tmp_path, monkeypatch):
+    import os
+
+    flow = tmp_path / "flow.json"
+    flow.write_bytes(b'[{"id": "t1", "type": "tab"}]')
+    parses = []
+    real_loads = utils.orjson.loads
+    monkeypatch.setattr(utils.orjson, "loads", lambda raw: parses.append(raw) or real_loads(raw))
+
+    first = utils._load_flow(str(flow))
+    assert utils._load_flow(str(flow)) is first
+    assert len(parses) == 1
+
+    flow.write_bytes(b'[{"id": "t2", "type": "tab", "label": "changed"}]')
+    os.utime(flow, ns=(0, os.stat(flow).st_mtime_ns + 1_000_000))
+    flow_id, flow_label, body = utils._load_flow(str(flow))
+    assert (flow_id, flow_label) == ("t2", "changed")
+    assert utils.orjson.loads(body) == {"id": "t2", "label": "changed", "nodes": []}
+    assert len(parses) == 3  # two file parses plus the decode above
+
+
+def test_flow_without_tab_rejected(tmp_path):
+    flow = tmp_path / "flow.json"
+    flow.write_bytes(b'[{"id": "n1", "type": "inject"}]')
+    with pytest.raises(ValueError, match="No tab node"):
+        utils._load_flow(str(flow))
+
+
+def test_flow_with_non_object_node_rejected(tmp_path):
+    flow = tmp_path / "flow.json"
+    flow.write_bytes(b'[{"id": "t1", "type": "tab"}, "stray"]')
+    with pytest.raises(ValueError, match="must be JSON objects"):
+        utils._load_flow(str(flow))
+
+
+def test_recent_git_pull_not_repeated(monkeypatch):
+    calls = []
+
+    class _DoneProc:
+        returncode = 0
+
+        async def communicate(self):
+            return b"", b""
+
+    async def fake_exec(*args, **kwargs):
+        calls.append(kwargs["env"]["GIT_TERMINAL_PROMPT"])
+        return _DoneProc()
+
+    monkeypatch.setattr(utils.asyncio, "create_subprocess_exec", fake_exec)
+    monkeypatch.setattr(utils, "_last_git_pull", {})
+    asyncio.run(utils._git_pull("/repo"))
+    asyncio.run(utils._git_pull("/repo"))
+    assert calls == ["0"]
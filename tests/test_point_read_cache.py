@@ -0,0 +1,112 @@
+"""Tests for the get_todo / get_lesson point-read cache."""
+import asyncio
+import json
+
+import pytest
+
+from Omnispindle import tools
+from Omnispindle.context import Context
+from tests.conftest import FakeCollection
+
+
+CTX = Context(user={"sub": "test|cache", "email": "cache@test.com"})
+LESSON = {"id": "lesson-1", "topic": "caching", "lesson_learned": "keep TTLs short", "tags": []}
+TODO = {"id": "todo-1", "description": "poll me", "project": "p", "status": "pending"}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(no_tag_cache):
+    tools.invalidate_point_read_cache()
+    yield
+    tools.invalidate_point_read_cache()
+
+
+def test_repeat_lesson_read_served_from_cache(use_collections):
+    lessons = FakeCollection(dict(LESSON))
+    use_collections(lessons=lessons)
+    first = asyncio.run(tools.get_lesson("lesson-1", ctx=CTX))
+    second = asyncio.run(tools.get_lesson("lesson-1", ctx=CTX))
+    assert first == second
+    assert lessons.reads == 1
+
+
+def test_update_lesson_invalidates(use_collections):
+    lessons = FakeCollection(dict(LESSON))
+    use_collections(lessons=lessons)
+    asyncio.run(tools.get_lesson("lesson-1", ctx=CTX))
+    asyncio.run(tools.update_lesson("lesson-1", {"topic": "invalidation"}, ctx=CTX))
+    data = json.loads(asyncio.run(tools.get_lesson("lesson-1", ctx=CTX)))
+    assert data["topic"] == "invalidation"
+    assert lessons.reads == 2
+
+
+def test_misses_are_not_cached(use_collections):
+    lessons = FakeCollection(dict(LESSON))
+    use_collections(lessons=lessons)
+    asyncio.run(tools.get_lesson("nope", ctx=CTX))
+    asyncio.run(tools.get_lesson("nope", ctx=CTX))
+    assert lessons.reads == 2
+
+
+def test_entries_expire(monkeypatch, use_collections):
+    lessons = FakeCollection(dict(LESSON))
+    use_collections(lessons=lessons)
+    monkeypatch.setattr(tools, "_POINT_READ_TTL", -1)
+    asyncio.run(tools.get_lesson("lesson-1", ctx=CTX))
+    asyncio.run(tools.get_lesson("lesson-1", ctx=CTX))
+    assert lessons.reads == 2
+
+
+def test_cache_is_scoped_per_user(use_collections):
+    lessons = FakeCollection(dict(LESSON))
+    use_collections(lessons=lessons)
+    asyncio.run(tools.get_lesson("lesson-1", ctx=CTX))
+    asyncio.run(tools.get_lesson("lesson-1", ctx=Context(user={"sub": "someone|else"})))
+    assert lessons.reads == 2
+
+
+def test_delete_todo_invalidates_cached_todo(monkeypatch, use_collections):
+    todos = FakeCollection(dict(TODO))
+    use_collections(todos=todos, deleted_todos=FakeCollection(None))
+    monkeypatch.setattr(tools, "log_todo_delete", _noop)
+
+    assert json.loads(asyncio.run(tools.get_todo("todo-1", ctx=CTX)))["id"] == "todo-1"
+    asyncio.run(tools.delete_todo("todo-1", ctx=CTX))
+    data = json.loads(asyncio.run(tools.get_todo("todo-1", ctx=CTX)))
+    assert data["success"] is False
+
+
+async def _noop(*args, **kwargs):
+    return None
+
+
+def test_delete_todo_restores_the_todo_when_the_tombstone_fails(monkeypatch, use_collections):
+    todos = FakeCollection(dict(TODO))
+    todos.insert_one = lambda doc: setattr(todos, "doc", doc)
+    deleted = FakeCollection(None)
+    deleted.insert_one = lambda doc: (_ for _ in ()).throw(RuntimeError("write refused"))
+    monkeypatch.setattr(tools, "log_todo_delete", _noop)
+    use_collections(todos=todos, deleted_todos=deleted)
+
+    data = json.loads(asyncio.run(tools.delete_todo("todo-1", ctx=CTX)))
+    assert data["success"] is False
+    assert todos.doc["id"] == "todo-1"
+
+
+def test_delete_todo_does_not_wait_for_the_audit_log(monkeypatch, use_collections):
+    todos = FakeCollection(dict(TODO))
+    deleted = FakeCollection(None)
+    logged = []
+
+    async def slow_log(*args, **kwargs):
+        await asyncio.Event().wait()
+        logged.append(args)
+
+    monkeypatch.setattr(tools, "log_todo_delete", slow_log)
+    use_collections(todos=todos, deleted_todos=deleted)
+
+    async def scenario():
+        return json.loads(await asyncio.wait_for(tools.delete_todo("todo-1", ctx=CTX), timeout=1))
+
+    assert asyncio.run(scenario())["id"] == "todo-1"
+    assert logged == []
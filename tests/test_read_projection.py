@@ -0,0 +1,121 @@
+"""Tests that list/search reads project away fields the response never ships."""
+import asyncio
+import json
+
+from Omnispindle import tools
+from tests.conftest import FakeCollection
+
+
+def test_query_todos_defaults_to_slim_projection(use_collections):
+    todos = FakeCollection(docs=[{"id": "a", "description": "d", "status": "pending"}])
+    use_collections(todos=todos)
+    data = json.loads(asyncio.run(tools.query_todos(limit=7, brief=False)))
+    assert data["count"] == 1
+    _, projection = todos.finds[0]
+    assert projection == {"_id": 0, "embedding": 0, "embedding_updated_at": 0}
+    assert todos.cursors[0].batch == 7
+
+
+def test_brief_read_also_skips_notes(use_collections):
+    todos = FakeCollection()
+    use_collections(todos=todos)
+    asyncio.run(tools.list_todos_by_status("pending"))
+    _, projection = todos.finds[0]
+    assert projection["notes"] == 0 and projection["updated_at"] == 0
+
+
+def test_caller_projection_wins(use_collections):
+    todos = FakeCollection()
+    use_collections(todos=todos)
+    asyncio.run(tools.list_todos_by_status("pending", projection={"id": 1}))
+    assert todos.finds[0][1] == {"id": 1}
+
+
+def test_lesson_reads_skip_id_and_vector(use_collections):
+    lessons = FakeCollection(docs=[{"id": "l", "topic": "t", "lesson_learned": "x"}])
+    use_collections(lessons=lessons)
+    asyncio.run(tools.list_lessons(limit=5))
+    asyncio.run(tools.search_lessons("topic"))
+    for _, projection in lessons.finds:
+        assert projection == {"_id": 0, "embedding": 0, "embedding_updated_at": 0}
+    assert lessons.cursors[0].batch == 5
+
+
+def test_brief_lesson_reads_leave_lesson_text_on_the_server(use_collections):
+    lessons = FakeCollection(docs=[{"id": "l", "topic": "t"}])
+    use_collections(lessons=lessons)
+    asyncio.run(tools.list_lessons(brief=True))
+    asyncio.run(tools.search_lessons("topic", brief=True))
+    for _, projection in lessons.finds:
+        assert projection == {"_id": 0, "id": 1, "topic": 1, "language": 1, "tags": 1}
+
+
+def test_status_filter_template_is_not_mutated(use_collections):
+    todos = FakeCollection()
+    use_collections(todos=todos)
+    asyncio.run(tools.list_todos_by_status("Review"))
+    assert todos.finds[0][0] == {"status": "review"}
+    assert dict(tools._STATUS_FILTERS["review"]) == {"status": "review"}
+
+
+def test_unknown_status_rejected_before_query(use_collections):
+    todos = FakeCollection()
+    use_collections(todos=todos)
+    data = json.loads(asyncio.run(tools.list_todos_by_status("done")))
+    assert data["success"] is False
+    assert todos.finds == []
+
+
+def test_search_todos_strict_hit_skips_json_round_trip(monkeypatch, use_collections):
+    todos = FakeCollection(docs=[{"id": "a", "description": "fix login", "project": "p", "status": "pending"}])
+    use_collections(todos=todos)
+    monkeypatch.setattr(tools.orjson, "loads", lambda *_: (_ for _ in ()).throw(AssertionError("re-parsed")))
+    data = json.loads(asyncio.run(tools.search_todos("login")))
+    assert data["search_mode"] == "strict"
+    assert [i["id"] for i in data["items"]] == ["a"]
+    assert len(todos.finds) == 1
+
+
+def test_advanced_search_escapes_the_query(use_collections):
+    todos = FakeCollection()
+    use_collections(todos=todos)
+    asyncio.run(tools.search_todos_advanced("(a+)+ c++"))
+    query_filter, _ = todos.finds[0]
+    assert query_filter["$or"][0]["description"]["$regex"] == r"\(a\+\)\+\ c\+\+"
+
+
+def test_strict_search_filter_built_once_per_query():
+    first = tools._build_tokenized_search_query("fix login bug", ["description", "project"])
+    assert tools._build_tokenized_search_query("fix login bug", ("description", "project")) is first
+    assert [clause["$or"][0]["description"]["$regex"] for clause in first["$and"]] == ["login", "bug"]
+
+
+def test_keyword_needles_are_lowercased_literals():
+    needles = tools._keyword_needles(tools._extract_keywords("Mongo c++ a.b"))
+    assert needles == ["mongo", "c++", "a.b"]
+    assert [n in "the mongo driver" for n in needles] == [True, False, False]
+
+
+def test_advanced_search_never_fetches_object_id(use_collections):
+    todos = FakeCollection()
+    use_collections(todos=todos)
+    asyncio.run(tools.search_todos_advanced("login", limit=250))
+    _, projection = todos.finds[0]
+    assert projection["_id"] == 0 and projection["embedding"] == 0
+    assert todos.cursors[0].batch == 250
+
+
+def test_check_quest_fetches_only_the_fields_it_reports(use_collections):
+    quests = FakeCollection({"id": "q", "name": "Q", "chains": [{"label": "c", "todos": ["a"]}]})
+    todos = FakeCollection(docs=[{"id": "a", "status": "pending", "description": "d"}])
+    use_collections(todos=todos, quests=quests)
+    data = json.loads(asyncio.run(tools.check_quest("q")))
+    assert data["total"] == "0/1"
+    _, projection = todos.finds[0]
+    assert projection == {"_id": 0, "id": 1, "status": 1, "description": 1}
+
+
+def test_exact_project_match_is_escaped_and_reused():
+    pattern = tools._exact_ci("my.proj")
+    assert pattern.pattern == r"^my\.proj$" and pattern.flags
+    assert tools._exact_ci("my.proj") is pattern
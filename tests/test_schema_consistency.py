@@ -58,6 +58,9 @@ TOOL_FUNCTION_MAP = {
     "read_agent_journal": tools_module.read_agent_journal,
     "query_todos_near": tools_module.query_todos_near,
     "link_todos": tools_module.link_todos,
+    "add_todos": tools_module.add_todos,
+    "update_todos": tools_module.update_todos,
+    "add_lessons": tools_module.add_lessons,
     "regenerate_embedding": tools_module.regenerate_embedding,
     "create_quest": tools_module.create_quest,
     "check_quest": tools_module.check_quest,
@@ -0,0 +1,217 @@
+"""Tests for the text-index fast path in the fuzzy search pass."""
+import asyncio
+import json
+import re
+import threading
+
+from pymongo.errors import OperationFailure
+
+from Omnispindle import tools
+from Omnispindle.database import Database, LESSON_SEARCH_FIELDS
+from tests.conftest import FakeCollection, FakeCursor
+
+
+class _FakeLessons(FakeCollection):
+    """Strict pass finds nothing; $text and regex each return a canned hit."""
+
+    def __init__(self, text_hits):
+        super().__init__()
+        self.text_hits = text_hits
+        self.filters = []
+        self.text_cursor = None
+
+    def find(self, query_filter, projection=None):
+        self.filters.append(query_filter)
+        if "$text" in query_filter:
+            self.text_cursor = FakeCursor(self.text_hits)
+            return self.text_cursor
+        if "$or" in query_filter and len(self.filters) > 1:
+            return FakeCursor([{"id": "regex-hit", "topic": "docker networking"}])
+        return FakeCursor()
+
+
+def _run_search(use_collections, lessons, **kwargs):
+    use_collections(lessons=lessons)
+    return json.loads(asyncio.run(tools.search_lessons("docker networking", **kwargs)))
+
+
+def test_fuzzy_pass_uses_text_index(use_collections):
+    lessons = _FakeLessons(text_hits=[{"id": "text-hit", "topic": "docker networking"}])
+    data = _run_search(use_collections, lessons, limit=1)
+    assert [i["id"] for i in data["items"]] == ["text-hit"]
+    assert lessons.filters[1] == {"$text": {"$search": "docker networking"}}
+    assert len(lessons.filters) == 2  # $text filled the page: no regex scan needed
+
+
+def test_short_text_page_is_topped_up_by_regex(use_collections):
+    lessons = _FakeLessons(text_hits=[{"id": "text-hit", "topic": "docker networking"}])
+    data = _run_search(use_collections, lessons)
+    assert [i["id"] for i in data["items"]] == ["text-hit", "regex-hit"]
+    assert "$or" in lessons.filters[-1]
+
+
+def test_text_pass_ranks_by_text_score(use_collections):
+    lessons = _FakeLessons(text_hits=[{"id": "text-hit", "topic": "docker networking"}])
+    _run_search(use_collections, lessons)
+    assert lessons.text_cursor.sorted_by == [("score", {"$meta": "textScore"})]
+
+
+def test_fuzzy_pass_falls_back_to_regex_when_text_misses(use_collections):
+    lessons = _FakeLessons(text_hits=[])
+    data = _run_search(use_collections, lessons)
+    assert [i["id"] for i in data["items"]] == ["regex-hit"]
+    assert "$or" in lessons.filters[-1]
+
+
+def _matches(doc, query_filter):
+    """Enough of Mongo's matcher for the search filters: $and/$or/$text/$regex/$ne."""
+    for key, cond in query_filter.items():
+        if key == "$and":
+            if not all(_matches(doc, sub) for sub in cond):
+                return False
+        elif key == "$or":
+            if not any(_matches(doc, sub) for sub in cond):
+                return False
+        elif key == "$text":
+            # whole words only, like the stemmed text index
+            words = " ".join(str(v) for v in doc.values()).lower().split()
+            if not any(t in words for t in cond["$search"].lower().split()):
+                return False
+        elif "$regex" in cond:
+            if not re.search(cond["$regex"], str(doc.get(key, "")), re.I):
+                return False
+        elif "$ne" in cond:
+            if doc.get(key) == cond["$ne"]:
+                return False
+    return True
+
+
+class _MatchingCollection(FakeCollection):
+    def find(self, query_filter, projection=None):
+        return FakeCursor(d for d in self.docs if _matches(d, query_filter))
+
+
+_PARTIAL_WORD_DOCS = [
+    {"id": "a", "topic": "docker networking", "description": "docker networking", "project": "p", "status": "pending"},
+    {"id": "b", "topic": "compose files", "description": "compose files", "project": "p", "status": "pending"},
+]
+
+
+def test_lesson_search_keeps_partial_word_hits(use_collections):
+    lessons = _MatchingCollection(docs=_PARTIAL_WORD_DOCS)
+    use_collections(lessons=lessons)
+    data = json.loads(asyncio.run(tools.search_lessons("dock compose")))
+    assert data["search_mode"] == "fuzzy_or"
+    assert sorted(i["id"] for i in data["items"]) == ["a", "b"]
+
+
+def test_todo_search_keeps_partial_word_hits(use_collections):
+    todos = _MatchingCollection(docs=_PARTIAL_WORD_DOCS)
+    use_collections(todos=todos)
+    data = json.loads(asyncio.run(tools.search_todos("dock compose", brief=False)))
+    assert data["search_mode"] == "fuzzy_or"
+    assert sorted(i["id"] for i in data["items"]) == ["a", "b"]
+
+
+def test_custom_fields_skip_text_index(use_collections):
+    lessons = _FakeLessons(text_hits=[{"id": "text-hit"}])
+    _run_search(use_collections, lessons, fields=["topic"])
+    assert not any("$text" in f for f in lessons.filters)
+
+
+def test_text_filter_requires_the_indexed_fields():
+    assert tools._text_search_filter(["a"], list(LESSON_SEARCH_FIELDS), LESSON_SEARCH_FIELDS)
+    assert tools._text_search_filter(["a"], ["topic"], LESSON_SEARCH_FIELDS) is None
+    assert tools._text_search_filter([], list(LESSON_SEARCH_FIELDS), LESSON_SEARCH_FIELDS) is None
+
+
+class _IndexRecorder:
+    def __init__(self):
+        self.calls = []
+
+    def create_index(self, keys, **options):
+        self.calls.append((tuple(keys), options))
+
+
+class _IndexedDatabase(dict):
+    name = "user_x"
+
+    def __missing__(self, key):
+        self[key] = _IndexRecorder()
+        return self[key]
+
+
+def test_ensure_indexes_builds_one_text_index_per_collection():
+    db = _IndexedDatabase()
+    Database().ensure_indexes(db)
+    todo_text = [c for c in db["todos"].calls if c[0][0][1] == "text"]
+    lesson_text = [c for c in db["lessons_learned"].calls if c[0][0][1] == "text"]
+    assert todo_text == [((("description", "text"), ("project", "text")), {"name": "search_text"})]
+    assert len(lesson_text) == 1
+
+
+def test_ensure_indexes_covers_id_and_status():
+    db = _IndexedDatabase()
+    Database().ensure_indexes(db)
+    assert ((("id", 1),), {"unique": True}) in db["todos"].calls
+    assert ((("status", 1), ("created_at", -1)), {}) in db["todos"].calls
+    assert ((("id", 1),), {"unique": True}) in db["lessons_learned"].calls
+
+
+def test_ensure_indexes_covers_blockers_quests_and_explanations():
+    db = _IndexedDatabase()
+    Database().ensure_indexes(db)
+    assert ((("metadata.blockers", 1),), {}) in db["todos"].calls
+    assert ((("id", 1),), {"unique": True}) in db["quests"].calls
+    assert ((("topic", 1),), {"unique": True}) in db["explanations"].calls
+
+
+class _FailingIndexRecorder(_IndexRecorder):
+    def create_index(self, keys, **options):
+        raise RuntimeError("server selection timeout")
+
+
+def test_failed_index_build_is_not_marked_done():
+    database = Database()
+    db = _IndexedDatabase()
+    db.name = "user_flaky"
+    db["todos"] = _FailingIndexRecorder()
+    assert database.ensure_indexes(db) is False
+    assert "user_flaky" not in database._indexed_databases
+    assert database._index_retry_at["user_flaky"] > 0
+
+
+class _ConflictingIndexRecorder(_IndexRecorder):
+    def create_index(self, keys, **options):
+        super().create_index(keys, **options)
+        if options.get("name") == "search_text":
+            raise OperationFailure("An equivalent index already exists with a different name", code=85)
+
+
+def test_conflicting_index_is_reported_once_and_marked_done():
+    database = Database()
+    db = _IndexedDatabase()
+    db.name = "user_conflict"
+    db["todos"] = _ConflictingIndexRecorder()
+    assert database.ensure_indexes(db) is True
+    assert "user_conflict" in database._indexed_databases
+    assert "user_conflict" not in database._index_retry_at
+
+
+def test_index_build_runs_off_the_calling_thread(monkeypatch):
+    database = Database()
+    threads, done = [], threading.Event()
+
+    def record(db):
+        threads.append(threading.get_ident())
+        done.set()
+
+    monkeypatch.setattr(database, "ensure_indexes", record)
+    db = _IndexedDatabase()
+    db.name = "user_offloop"
+    database._index_retry_at.pop("user_offloop", None)
+    database._schedule_indexes(db)
+    database._schedule_indexes(db)  # already in flight: no second build
+    assert done.wait(timeout=2)
+    assert threads and threading.get_ident() not in threads
+    assert len(threads) == 1
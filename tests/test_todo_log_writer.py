@@ -0,0 +1,70 @@
+"""Tests for the batched background writer in TodoLogService."""
+import asyncio
+
+from Omnispindle import todo_log_service
+
+
+class _FakeLogs:
+    def __init__(self):
+        self.batches = []
+
+    def insert_many(self, docs, ordered=True):
+        self.batches.append(list(docs))
+
+
+def _service(monkeypatch, logs):
+    async def no_publish(*args, **kwargs):
+        return True
+
+    monkeypatch.setattr(todo_log_service.db_connection, "get_collections", lambda user=None: {"logs": logs})
+    monkeypatch.setattr(todo_log_service, "mqtt_publish", no_publish)
+    service = todo_log_service.TodoLogService()
+    service.running = True
+    service.logs_collection = logs
+    monkeypatch.setattr(todo_log_service, "_service_instance", service)
+    return service
+
+
+def test_burst_of_log_calls_is_one_insert_many(monkeypatch):
+    logs = _FakeLogs()
+    service = _service(monkeypatch, logs)
+
+    async def scenario():
+        queued = [await todo_log_service.log_todo_update(f"t-{i}", "d", "p", [{"field": "x"}]) for i in range(5)]
+        assert logs.batches == []  # callers returned before the write
+        await asyncio.sleep(todo_log_service.LOG_BATCH_WINDOW * 3)
+        await service.drain()
+        return queued
+
+    assert asyncio.run(scenario()) == [True] * 5
+    assert len(logs.batches) == 1
+    assert [e["todoId"] for e in logs.batches[0]] == [f"t-{i}" for i in range(5)]
+
+
+def test_drain_stores_what_is_still_queued(monkeypatch):
+    logs = _FakeLogs()
+    service = _service(monkeypatch, logs)
+
+    async def scenario():
+        await todo_log_service.log_todo_create("t-1", "d", "p")
+        await todo_log_service.log_todo_delete("t-2", "d", "p")
+        await todo_log_service.drain_log_queue()
+
+    asyncio.run(scenario())
+    assert [(e["operation"], e["todoId"]) for b in logs.batches for e in b] == [("create", "t-1"), ("delete", "t-2")]
+    assert service._writer is None
+
+
+def test_full_queue_drops_instead_of_blocking(monkeypatch):
+    logs = _FakeLogs()
+    service = _service(monkeypatch, logs)
+    monkeypatch.setattr(todo_log_service, "LOG_QUEUE_LIMIT", 1)
+
+    async def scenario():
+        first = await todo_log_service.log_todo_create("t-1", "d", "p")
+        second = await todo_log_service.log_todo_create("t-2", "d", "p")
+        await service.drain()
+        return first, second
+
+    assert asyncio.run(scenario()) == (True, False)
+    assert [e["todoId"] for b in logs.batches for e in b] == ["t-1"]